@@ -28,19 +28,41 @@ REINDEX_AGE = timedelta(0, 60)  # 60 seconds
 
 log = logging.getLogger('edx.modulestore')
 
+# Patterns used to reduce html content to searchable text; compiled once since
+# they are applied to every analysed property of every course being indexed
+WHITESPACE_PATTERN = re.compile(r"(\s|&nbsp;|//)+")
+CDATA_PATTERN = re.compile(r"<!\[CDATA\[.*\]\]>")
+COMMENT_PATTERN = re.compile(r"<!--.*-->")
+
 
 def strip_html_content_to_text(html_content):
     """ Gets only the textual part for html content - useful for building text to be searched """
     # Removing HTML-encoded non-breaking space characters
-    text_content = re.sub(r"(\s|&nbsp;|//)+", " ", html_to_text(html_content))
+    text_content = WHITESPACE_PATTERN.sub(" ", html_to_text(html_content))
     # Removing HTML CDATA
-    text_content = re.sub(r"<!\[CDATA\[.*\]\]>", "", text_content)
+    text_content = CDATA_PATTERN.sub("", text_content)
     # Removing HTML comments
-    text_content = re.sub(r"<!--.*-->", "", text_content)
+    text_content = COMMENT_PATTERN.sub("", text_content)
 
     return text_content
 
 
+def strip_html_contents_to_text(html_contents):
+    """
+    Batched version of `strip_html_content_to_text`
+
+    Arguments:
+        html_contents (dict): maps a property name to its html content
+
+    Returns:
+        dict mapping the same property names to their textual content
+    """
+    return {
+        property_name: strip_html_content_to_text(html_content)
+        for property_name, html_content in html_contents.iteritems()
+    }
+
+
 def indexing_is_enabled():
     """
     Checks to see if the indexing feature is enabled
@@ -604,6 +626,9 @@ class CourseAboutSearchIndexer(object):
             "about_dictionary": about_dictionary,
         }
 
+        # html content to analyse is collected and stripped to text in a single batch per course
+        html_to_analyse = {}
+
         for about_information in cls.ABOUT_INFORMATION_TO_INCLUDE:
             # Broad exception handler so that a single bad property does not scupper the collection of others
             try:
@@ -619,13 +644,15 @@ class CourseAboutSearchIndexer(object):
 
             if section_content:
                 if about_information.index_flags & AboutInfo.ANALYSE:
-                    analyse_content = section_content
                     if isinstance(section_content, basestring):
-                        analyse_content = strip_html_content_to_text(section_content)
-                    course_info['content'][about_information.property_name] = analyse_content
+                        html_to_analyse[about_information.property_name] = section_content
+                    else:
+                        course_info['content'][about_information.property_name] = section_content
                 if about_information.index_flags & AboutInfo.PROPERTY:
                     course_info[about_information.property_name] = section_content
 
+        course_info['content'].update(strip_html_contents_to_text(html_to_analyse))
+
         # Broad exception handler to protect around and report problems with indexing
         try:
             searcher.index(cls.DISCOVERY_DOCUMENT_TYPE, [course_info])
@@ -1,10 +1,14 @@
 """ Management command to update courses' search index """
 import logging
+import multiprocessing
+import os
+import time
 from django.core.management import BaseCommand, CommandError
+from django.db import connections
 from optparse import make_option
 from textwrap import dedent
 
-from contentstore.courseware_index import CoursewareSearchIndexer
+from contentstore.courseware_index import CoursewareSearchIndexer, SearchIndexingError
 from search.search_engine_base import SearchEngine
 from elasticsearch import exceptions
 
@@ -14,7 +18,62 @@ from opaque_keys.edx.locator import CourseLocator
 
 from .prompt import query_yes_no
 
-from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.django import modulestore, clear_existing_modulestores
+
+log = logging.getLogger(__name__)
+
+
+def _init_reindex_worker():
+    """
+    Initializes a reindex worker process: database and modulestore connections
+    inherited from the parent process must not be shared across the fork.
+    """
+    connections.close_all()
+    clear_existing_modulestores()
+
+
+def _reindex_course_worker(course_key_string):
+    """
+    Reindexes a single course inside a worker process.
+
+    Returns a tuple of (course_key_string, indexed_count, error_message), where
+    error_message is None if the course was indexed successfully.
+    """
+    course_key = CourseKey.from_string(course_key_string)
+    try:
+        indexed_count = CoursewareSearchIndexer.do_course_reindex(modulestore(), course_key)
+    except SearchIndexingError as exc:
+        return course_key_string, 0, u"{}: {}".format(exc, exc.error_list)
+    except Exception as exc:  # pylint: disable=broad-except
+        # broad exception so that a single bad course does not stop the remaining shards
+        log.exception(u"Unexpected error reindexing course %s", course_key_string)
+        return course_key_string, 0, unicode(exc)
+    return course_key_string, indexed_count or 0, None
+
+
+class ReindexCheckpoint(object):
+    """
+    Records the courses that have been reindexed successfully in a plain text
+    file (one course key per line), so that an interrupted reindex can resume.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.completed = set()
+        if path and os.path.exists(path):
+            with open(path) as checkpoint_file:
+                self.completed = set(line.strip() for line in checkpoint_file if line.strip())
+
+    def is_completed(self, course_key):
+        """ Returns True if the course has been reindexed by a previous run """
+        return unicode(course_key) in self.completed
+
+    def mark_completed(self, course_key):
+        """ Records that the course has been reindexed """
+        course_key_string = unicode(course_key)
+        self.completed.add(course_key_string)
+        if self.path:
+            with open(self.path, 'a') as checkpoint_file:
+                checkpoint_file.write(course_key_string + '\n')
 
 
 class Command(BaseCommand):
@@ -26,6 +85,9 @@ class Command(BaseCommand):
         ./manage.py reindex_course <course_id_1> <course_id_2> - reindexes courses with keys course_id_1 and course_id_2
         ./manage.py reindex_course --all - reindexes all available courses
         ./manage.py reindex_course --setup - reindexes all courses for devstack setup
+        ./manage.py reindex_course --all --processes=8 --checkpoint=/tmp/reindex.txt - reindexes all
+            courses using 8 worker processes, skipping courses already listed in /tmp/reindex.txt
+            and appending each course to it once it has been reindexed
     """
     help = dedent(__doc__)
 
@@ -45,7 +107,20 @@ class Command(BaseCommand):
                                default=False,
                                help='Reindex all courses on developers stack setup')
 
-    option_list = BaseCommand.option_list + (all_option, setup_option)
+    processes_option = make_option('--processes',
+                                   action='store',
+                                   dest='processes',
+                                   type='int',
+                                   default=1,
+                                   help='Number of worker processes to shard the courses across')
+
+    checkpoint_option = make_option('--checkpoint',
+                                    action='store',
+                                    dest='checkpoint',
+                                    default=None,
+                                    help='File recording reindexed courses, used to resume an interrupted reindex')
+
+    option_list = BaseCommand.option_list + (all_option, setup_option, processes_option, checkpoint_option)
 
     CONFIRMATION_PROMPT = u"Re-indexing all courses might be a time consuming operation. Do you want to continue?"
 
@@ -111,5 +186,55 @@ class Command(BaseCommand):
             # in case course keys are provided as arguments
             course_keys = map(self._parse_course_key, args)
 
-        for course_key in course_keys:
-            CoursewareSearchIndexer.do_course_reindex(store, course_key)
+        checkpoint = ReindexCheckpoint(options.get('checkpoint'))
+        course_keys = [course_key for course_key in course_keys if not checkpoint.is_completed(course_key)]
+        processes = options.get('processes') or 1
+
+        start_time = time.time()
+        if processes > 1:
+            indexed_count = self._reindex_in_parallel(course_keys, processes, checkpoint)
+        else:
+            indexed_count = 0
+            for course_key in course_keys:
+                indexed_count += CoursewareSearchIndexer.do_course_reindex(store, course_key) or 0
+                checkpoint.mark_completed(course_key)
+        self._log_throughput(len(course_keys), indexed_count, time.time() - start_time)
+
+    def _reindex_in_parallel(self, course_keys, processes, checkpoint):
+        """
+        Shards the courses across a pool of worker processes. Unlike the sequential
+        reindex, a failing course does not stop the others; all failures are
+        reported once the pool has drained.
+        """
+        # connections must not be shared with the forked workers
+        connections.close_all()
+        pool = multiprocessing.Pool(processes=processes, initializer=_init_reindex_worker)
+        indexed_count = 0
+        errors = []
+        try:
+            results = pool.imap_unordered(_reindex_course_worker, [unicode(key) for key in course_keys])
+            for course_key_string, course_indexed_count, error in results:
+                if error:
+                    log.error(u"Failed to reindex course %s: %s", course_key_string, error)
+                    errors.append(course_key_string)
+                    continue
+                indexed_count += course_indexed_count
+                checkpoint.mark_completed(course_key_string)
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+        if errors:
+            raise CommandError(u"Failed to reindex courses: {}".format(u", ".join(errors)))
+        return indexed_count
+
+    def _log_throughput(self, course_count, indexed_count, elapsed):
+        """ Reports how many documents per second have been indexed """
+        rate = indexed_count / elapsed if elapsed else 0
+        log.info(
+            u"Reindexed %d courses, %d documents in %.1f seconds (%.1f documents/second)",
+            course_count, indexed_count, elapsed, rate
+        )
@@ -1,4 +1,8 @@
 """ Tests for course reindex command """
+import os
+import shutil
+from tempfile import mkdtemp
+
 import ddt
 from django.core.management import call_command, CommandError
 import mock
@@ -36,6 +40,8 @@ class TestReindexCourse(ModuleStoreTestCase):
     REINDEX_PATH_LOCATION = 'contentstore.management.commands.reindex_course.CoursewareSearchIndexer.do_course_reindex'
     MODULESTORE_PATCH_LOCATION = 'contentstore.management.commands.reindex_course.modulestore'
     YESNO_PATCH_LOCATION = 'contentstore.management.commands.reindex_course.query_yes_no'
+    POOL_PATCH_LOCATION = 'contentstore.management.commands.reindex_course.multiprocessing.Pool'
+    CONNECTIONS_PATCH_LOCATION = 'contentstore.management.commands.reindex_course.connections'
 
     def _get_lib_key(self, library):
         """ Get's library key as it is passed to indexer """
@@ -122,3 +128,50 @@ class TestReindexCourse(ModuleStoreTestCase):
 
             with self.assertRaises(SearchIndexingError):
                 call_command('reindex_course', unicode(self.second_course.id))
+
+    def test_checkpoint_skips_completed_courses(self):
+        """ Test that courses recorded in the checkpoint file are not reindexed again """
+        checkpoint_path = os.path.join(mkdtemp(), 'checkpoint.txt')
+        self.addCleanup(shutil.rmtree, os.path.dirname(checkpoint_path))
+        with open(checkpoint_path, 'w') as checkpoint_file:
+            checkpoint_file.write(unicode(self.first_course.id) + '\n')
+
+        with mock.patch(self.REINDEX_PATH_LOCATION) as patched_index, \
+                mock.patch(self.MODULESTORE_PATCH_LOCATION, mock.Mock(return_value=self.store)):
+            patched_index.return_value = 3
+            call_command(
+                'reindex_course',
+                unicode(self.first_course.id),
+                unicode(self.second_course.id),
+                checkpoint=checkpoint_path
+            )
+            self.assertEqual(patched_index.mock_calls, self._build_calls(self.second_course))
+
+        with open(checkpoint_path) as checkpoint_file:
+            self.assertEqual(
+                checkpoint_file.read().split(),
+                [unicode(self.first_course.id), unicode(self.second_course.id)]
+            )
+
+    def test_parallel_reindex_reports_failures(self):
+        """ Test that the parallel reindex records successful courses and reports failed ones """
+        checkpoint_path = os.path.join(mkdtemp(), 'checkpoint.txt')
+        self.addCleanup(shutil.rmtree, os.path.dirname(checkpoint_path))
+        results = [
+            (unicode(self.first_course.id), 5, None),
+            (unicode(self.second_course.id), 0, "error"),
+        ]
+        # closing the database connections would break the test transaction
+        with mock.patch(self.POOL_PATCH_LOCATION) as patched_pool, mock.patch(self.CONNECTIONS_PATCH_LOCATION):
+            patched_pool.return_value.imap_unordered.return_value = iter(results)
+            with self.assertRaisesRegexp(CommandError, "Failed to reindex courses: .*course2.*"):
+                call_command(
+                    'reindex_course',
+                    unicode(self.first_course.id),
+                    unicode(self.second_course.id),
+                    processes=2,
+                    checkpoint=checkpoint_path
+                )
+
+        with open(checkpoint_path) as checkpoint_file:
+            self.assertEqual(checkpoint_file.read().split(), [unicode(self.first_course.id)])
@@ -9,6 +9,7 @@ from mock import patch, Mock
 from django.test.utils import override_settings
 from django.conf import settings
 from django.utils import translation
+from opaque_keys.edx.locator import CourseLocator
 
 from nose.plugins.skip import SkipTest
 
@@ -609,6 +610,18 @@ class TestTranscript(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             transcripts_utils.Transcript.convert(self.srt_transcript, 'srt', 'sjson')
 
+    def test_convert_asset_cached(self):
+        location = StaticContent.compute_location(CourseLocator('org', 'course', 'run'), 'subs_test.srt.sjson')
+        asset = StaticContent(
+            location, 'subs_test.srt.sjson', 'application/json', self.sjson_transcript, content_digest=uuid4().hex
+        )
+        convert = transcripts_utils.Transcript.convert
+        with patch.object(transcripts_utils.Transcript, 'convert', side_effect=convert) as mock_convert:
+            for __ in range(2):
+                actual = transcripts_utils.Transcript.convert_asset(asset, 'sjson', 'srt')
+                self.assertEqual(actual, self.srt_transcript)
+            self.assertEqual(mock_convert.call_count, 1)
+
 
 class TestSubsFilename(unittest.TestCase):
     """
@@ -9,14 +9,11 @@ import re
 import shutil
 import tarfile
 from path import Path as path
-from tempfile import mkdtemp
 
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import SuspiciousOperation, PermissionDenied
-from django.core.files.temp import NamedTemporaryFile
-from django.core.servers.basehttp import FileWrapper
-from django.http import HttpResponse, HttpResponseNotFound, Http404
+from django.http import HttpResponse, HttpResponseNotFound, Http404, StreamingHttpResponse
 from django.utils.translation import ugettext as _
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_http_methods, require_GET
@@ -29,7 +26,7 @@ from xmodule.modulestore.django import modulestore
 from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import LibraryLocator
 from xmodule.modulestore.xml_importer import import_course_from_xml, import_library_from_xml
-from xmodule.modulestore.xml_exporter import export_course_to_xml, export_library_to_xml
+from xmodule.modulestore.xml_exporter import stream_course_to_tar_gz, stream_library_to_tar_gz
 from xmodule.modulestore import COURSE_ROOT, LIBRARY_ROOT
 
 from student.auth import has_course_author_access
@@ -389,23 +386,19 @@ def import_status_handler(request, course_key_string, filename=None):
 
 def create_export_tarball(course_module, course_key, context):
     """
-    Generates the export tarball, or returns None if there was an error.
+    Generates the export tarball, returned as an iterator over its gzipped chunks.
 
-    Updates the context with any error information if applicable.
+    The course xml is serialized before this returns, while the static assets are
+    streamed from the contentstore as the chunks are consumed, so nothing is written
+    to disk. Updates the context with any error information if applicable.
     """
     name = course_module.url_name
-    export_file = NamedTemporaryFile(prefix=name + '.', suffix=".tar.gz")
-    root_dir = path(mkdtemp())
 
     try:
         if isinstance(course_key, LibraryLocator):
-            export_library_to_xml(modulestore(), contentstore(), course_key, root_dir, name)
+            return stream_library_to_tar_gz(modulestore(), contentstore(), course_key, name)
         else:
-            export_course_to_xml(modulestore(), contentstore(), course_module.id, root_dir, name)
-
-        logging.debug(u'tar file being generated at %s', export_file.name)
-        with tarfile.open(name=export_file.name, mode='w:gz') as tar_file:
-            tar_file.add(root_dir / name, arcname=name)
+            return stream_course_to_tar_gz(modulestore(), contentstore(), course_module.id, name)
 
     except SerializationError as exc:
         log.exception(u'There was an error exporting %s', course_key)
@@ -439,20 +432,14 @@ def create_export_tarball(course_module, course_key, context):
             'unit': None,
             'raw_err_msg': str(exc)})
         raise
-    finally:
-        shutil.rmtree(root_dir / name)
-
-    return export_file
 
 
-def send_tarball(tarball):
+def send_tarball(tarball, filename):
     """
-    Renders a tarball to response, for use when sending a tar.gz file to the user.
+    Renders a streamed tarball to response, for use when sending a tar.gz file to the user.
     """
-    wrapper = FileWrapper(tarball)
-    response = HttpResponse(wrapper, content_type='application/x-tgz')
-    response['Content-Disposition'] = 'attachment; filename=%s' % os.path.basename(tarball.name.encode('utf-8'))
-    response['Content-Length'] = os.path.getsize(tarball.name)
+    response = StreamingHttpResponse(tarball, content_type='application/x-tgz')
+    response['Content-Disposition'] = 'attachment; filename=%s' % filename.encode('utf-8')
     return response
 
 
@@ -507,7 +494,7 @@ def export_handler(request, course_key_string):
             tarball = create_export_tarball(courselike_module, course_key, context)
         except SerializationError:
             return render_to_response('export.html', context)
-        return send_tarball(tarball)
+        return send_tarball(tarball, courselike_module.url_name + '.tar.gz')
 
     elif 'text/html' in requested_format:
         return render_to_response('export.html', context)
@@ -11,12 +11,14 @@ import shutil
 import tarfile
 import tempfile
 from path import Path as path
+from StringIO import StringIO
 from uuid import uuid4
 
 from django.test.utils import override_settings
 from django.conf import settings
 
 from contentstore.tests.test_libraries import LibraryTestCase
+from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.xml_exporter import export_library_to_xml, export_course_to_xml
@@ -558,6 +560,21 @@ class ExportTestCase(CourseTestCase):
         self.assertEquals(resp.status_code, 200)
         self.assertTrue(resp.get('Content-Disposition').startswith('attachment'))
 
+    def test_export_targz_contents(self):
+        """
+        The streamed tarball contains the course xml and the static assets.
+        """
+        asset_key = StaticContent.compute_location(self.course.id, 'handouts.txt')
+        contentstore().save(StaticContent(asset_key, 'handouts.txt', 'text/plain', 'handouts content'))
+
+        resp = self.client.get(self.url, HTTP_ACCEPT='application/x-tgz')
+        self._verify_export_succeeded(resp)
+        with tarfile.open(fileobj=StringIO(''.join(resp.streaming_content)), mode='r:gz') as tar_file:
+            name = self.course.url_name
+            self.assertIn(name + '/course.xml', tar_file.getnames())
+            self.assertIn(name + '/policies/assets.json', tar_file.getnames())
+            self.assertEqual(tar_file.extractfile(name + '/static/handouts.txt').read(), 'handouts content')
+
     def test_export_failure_top_level(self):
         """
         Export failure.
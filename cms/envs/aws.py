@@ -119,6 +119,9 @@ if STATIC_URL_BASE:
 # DEFAULT_COURSE_ABOUT_IMAGE_URL specifies the default image to show for courses that don't provide one
 DEFAULT_COURSE_ABOUT_IMAGE_URL = ENV_TOKENS.get('DEFAULT_COURSE_ABOUT_IMAGE_URL', DEFAULT_COURSE_ABOUT_IMAGE_URL)
 
+MAKO_MODULE_DIR = ENV_TOKENS.get('MAKO_MODULE_DIR', MAKO_MODULE_DIR)
+MAKO_PRECOMPILE_TEMPLATES = ENV_TOKENS.get('MAKO_PRECOMPILE_TEMPLATES', MAKO_PRECOMPILE_TEMPLATES)
+
 # GITHUB_REPO_ROOT is the base directory
 # for course data
 GITHUB_REPO_ROOT = ENV_TOKENS.get('GITHUB_REPO_ROOT', GITHUB_REPO_ROOT)
@@ -165,6 +168,10 @@ SESSION_COOKIE_HTTPONLY = ENV_TOKENS.get('SESSION_COOKIE_HTTPONLY', True)
 SESSION_ENGINE = ENV_TOKENS.get('SESSION_ENGINE', SESSION_ENGINE)
 SESSION_COOKIE_SECURE = ENV_TOKENS.get('SESSION_COOKIE_SECURE', SESSION_COOKIE_SECURE)
 SESSION_SAVE_EVERY_REQUEST = ENV_TOKENS.get('SESSION_SAVE_EVERY_REQUEST', SESSION_SAVE_EVERY_REQUEST)
+SAFE_SESSIONS_LAZY_VERIFICATION = ENV_TOKENS.get('SAFE_SESSIONS_LAZY_VERIFICATION', SAFE_SESSIONS_LAZY_VERIFICATION)
+SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE = ENV_TOKENS.get(
+    'SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE', SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE
+)
 
 # social sharing settings
 SOCIAL_SHARING_SETTINGS = ENV_TOKENS.get('SOCIAL_SHARING_SETTINGS', SOCIAL_SHARING_SETTINGS)
@@ -463,6 +470,10 @@ PARTNER_SUPPORT_EMAIL = ENV_TOKENS.get('PARTNER_SUPPORT_EMAIL', PARTNER_SUPPORT_
 # Affiliate cookie tracking
 AFFILIATE_COOKIE_NAME = ENV_TOKENS.get('AFFILIATE_COOKIE_NAME', AFFILIATE_COOKIE_NAME)
 
+# Course import parallelism
+STATIC_CONTENT_IMPORT_THREADS = ENV_TOKENS.get('STATIC_CONTENT_IMPORT_THREADS', STATIC_CONTENT_IMPORT_THREADS)
+THUMBNAIL_IMPORT_PROCESSES = ENV_TOKENS.get('THUMBNAIL_IMPORT_PROCESSES', THUMBNAIL_IMPORT_PROCESSES)
+
 ############## Settings for Studio Context Sensitive Help ##############
 
 DOC_LINK_BASE_URL = ENV_TOKENS.get('DOC_LINK_BASE_URL', DOC_LINK_BASE_URL)
@@ -245,6 +245,9 @@ GEOIPV6_PATH = REPO_ROOT / "common/static/data/geoip/GeoIPv6.dat"
 # TODO: Move the Mako templating into a different engine in TEMPLATES below.
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_cms')
+# Whether to eagerly load (and verify) every mako template at startup, e.g. the ones
+# compiled ahead of time into MAKO_MODULE_DIR by the `compile_mako_templates` command.
+MAKO_PRECOMPILE_TEMPLATES = False
 MAKO_TEMPLATES = {}
 MAKO_TEMPLATES['main'] = [
     PROJECT_ROOT / 'templates',
@@ -471,6 +474,11 @@ CODE_JAIL = {
 DEBUG = False
 SESSION_COOKIE_SECURE = False
 SESSION_SAVE_EVERY_REQUEST = False
+
+# Verify the safe session cookie only once the session is loaded by the request.
+SAFE_SESSIONS_LAZY_VERIFICATION = False
+# Reuse the safe session cookie of the request in the response if it was signed less than this many seconds ago.
+SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE = 60 * 60
 SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
 
 
@@ -843,6 +851,9 @@ INSTALLED_APPS = (
     # Theming
     'openedx.core.djangoapps.theming',
 
+    # Session cookies bound to their user
+    'openedx.core.djangoapps.safe_sessions',
+
     # Site configuration for theming and behavioral modification
     'openedx.core.djangoapps.site_configuration',
 
@@ -1073,6 +1084,14 @@ MAX_ASSET_UPLOAD_FILE_SIZE_IN_MB = 10
 # a file that exceeds the above size
 MAX_ASSET_UPLOAD_FILE_SIZE_URL = ""
 
+### Number of threads streaming static files into GridFS during a course import
+STATIC_CONTENT_IMPORT_THREADS = 8
+
+### Number of worker processes rendering image thumbnails during a course import.
+### Worker processes are forked from the importing process, so this is disabled
+### (thumbnails are rendered in the import threads) unless explicitly enabled.
+THUMBNAIL_IMPORT_PROCESSES = 0
+
 ### Default value for entrance exam minimum score
 ENTRANCE_EXAM_MIN_SCORE_PCT = 50
 
@@ -1170,6 +1189,14 @@ PROCTORING_BACKEND_PROVIDER = {
 }
 PROCTORING_SETTINGS = {}
 
+# How long, in seconds, CourseOverview.get_many keeps course overviews in a cache
+# local to each process. Set to 0 to disable this cache.
+COURSE_OVERVIEW_PROCESS_CACHE_TIMEOUT = 60
+
+# How long, in seconds, ConfigurationModel.current keeps configurations in each
+# process, in front of the configuration cache. Set to 0 to disable this cache.
+CONFIG_MODELS_PROCESS_CACHE_TIMEOUT = 5
+
 ############################ Global Database Configuration #####################
 
 DATABASE_ROUTERS = [
@@ -182,6 +182,10 @@ CACHES = {
     },
 }
 
+# Don't keep course overviews or configurations across tests.
+COURSE_OVERVIEW_PROCESS_CACHE_TIMEOUT = 0
+CONFIG_MODELS_PROCESS_CACHE_TIMEOUT = 0
+
 # hide ratelimit warnings while running tests
 filterwarnings('ignore', message='No request passed to the backend, unable to rate-limit')
 
@@ -53,6 +53,11 @@ timeout in each ``ConfigurationModel`` by setting the ``cache_timeout`` property
 You can change the name of the cache key used by the ``ConfigurationModel`` by overriding
 the ``cache_key_name`` function.
 
+If the ``CONFIG_MODELS_PROCESS_CACHE_TIMEOUT`` setting is set, the current ``ConfigurationModel``
+is also kept in each process for that many seconds, for as long as no new entry of the model
+is saved. The number of calls to ``current`` made in the process is counted by model in
+``config_models.models.CURRENT_CALL_COUNTS``.
+
 Extension
 ---------
 
@@ -1,6 +1,11 @@
 """
 Django Model baseclass for database-backed configuration.
 """
+import time
+from collections import Counter
+from uuid import uuid4
+
+from django.conf import settings
 from django.db import connection, models
 from django.contrib.auth.models import User
 from django.core.cache import caches, InvalidCacheBackendError
@@ -8,12 +13,42 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework.utils import model_meta
 
+import request_cache
+
 
 try:
     cache = caches['configuration']  # pylint: disable=invalid-name
 except InvalidCacheBackendError:
     from django.core.cache import cache
 
+# The number of calls to ConfigurationModel.current made in this process, by
+# model name, to see which configurations are hot.
+CURRENT_CALL_COUNTS = Counter()
+
+# The name of the request cache holding the versions of the configuration
+# models, as fetched during the current request.
+VERSIONS_REQUEST_CACHE = 'config_models.versions'
+
+# The current configurations loaded in this process, keyed by (model name,
+# cache key), as (model version, load time, configuration) tuples.
+_PROCESS_CACHE = {}
+
+# The names of the configuration models whose current configuration was loaded in this process.
+_PROCESS_CACHE_MODELS = set()
+
+
+def _version_cache_key_name(model_name):
+    """Return the name of the key of the version of a configuration model in the cache"""
+    return 'configuration/{}/version'.format(model_name)
+
+
+def _process_cache_timeout():
+    """
+    Return the number of seconds current configurations are kept in the
+    process, or 0 if they are not.
+    """
+    return getattr(settings, 'CONFIG_MODELS_PROCESS_CACHE_TIMEOUT', 0)
+
 
 class ConfigurationModelManager(models.Manager):
     """
@@ -111,6 +146,9 @@ class ConfigurationModel(models.Model):
         cache.delete(self.cache_key_name(*[getattr(self, key) for key in self.KEY_FIELDS]))
         if self.KEY_FIELDS:
             cache.delete(self.key_values_cache_key_name())
+        # Let the other processes know that the configurations they hold are outdated.
+        cache.set(_version_cache_key_name(self.__class__.__name__), uuid4().hex, None)
+        self.clear_process_cache()
 
     @classmethod
     def cache_key_name(cls, *args):
@@ -130,6 +168,72 @@ class ConfigurationModel(models.Model):
         Return the active configuration entry, either from cache,
         from the database, or by creating a new empty entry (which is not
         persisted).
+
+        If CONFIG_MODELS_PROCESS_CACHE_TIMEOUT is set, the entry is also kept
+        in the process for that many seconds, and shared by the callers in the
+        process: it must not be modified. It is used for as long as the version
+        of the model in the cache, which is changed whenever a new entry is
+        saved, stays the same. The versions of all the models used in the
+        process are fetched together, once per request.
+        """
+        CURRENT_CALL_COUNTS[cls.__name__] += 1
+        timeout = _process_cache_timeout()
+        if not timeout:
+            return cls._current(*args)
+
+        process_cache_key = (cls.__name__, cls.cache_key_name(*args))
+        # Get the version before the entry, so that an entry is never kept
+        # along with a version newer than itself.
+        version = cls._version(timeout)
+        cached = _PROCESS_CACHE.get(process_cache_key)
+        if cached is not None:
+            cached_version, loaded_at, current = cached
+            if cached_version == version and time.time() - loaded_at < timeout:
+                return current
+
+        current = cls._current(*args)
+        _PROCESS_CACHE[process_cache_key] = (version, time.time(), current)
+        return current
+
+    @classmethod
+    def _version(cls, timeout):
+        """
+        Return the version of this model in the cache, as fetched during the
+        current request, or within the last `timeout` seconds outside of
+        requests.
+
+        The versions of all the models used in the process are fetched with
+        a single `get_many`.
+        """
+        fetched = request_cache.get_cache(VERSIONS_REQUEST_CACHE)
+        now = time.time()
+        if now - fetched.get('fetched_at', 0) >= timeout:
+            fetched['fetched_at'] = now
+            fetched['versions'] = {}
+        versions = fetched['versions']
+
+        if cls.__name__ not in versions:
+            _PROCESS_CACHE_MODELS.add(cls.__name__)
+            model_names = [model_name for model_name in _PROCESS_CACHE_MODELS if model_name not in versions]
+            cached_versions = cache.get_many([_version_cache_key_name(model_name) for model_name in model_names])
+            for model_name in model_names:
+                versions[model_name] = cached_versions.get(_version_cache_key_name(model_name))
+        return versions[cls.__name__]
+
+    @classmethod
+    def clear_process_cache(cls):
+        """
+        Forget the current configurations of this model kept in the process.
+        """
+        for process_cache_key in _PROCESS_CACHE.keys():
+            if process_cache_key[0] == cls.__name__:
+                _PROCESS_CACHE.pop(process_cache_key, None)
+
+    @classmethod
+    def _current(cls, *args):
+        """
+        Return the active configuration entry, either from the cache, from the
+        database, or by creating a new empty entry (which is not persisted).
         """
         cached = cache.get(cls.cache_key_name(*args))
         if cached is not None:
@@ -7,13 +7,15 @@ import ddt
 from django.contrib.auth.models import User
 from django.db import models
 from django.test import TestCase
+from django.test.utils import override_settings
 from rest_framework.test import APIRequestFactory
 
 from freezegun import freeze_time
 
-from mock import patch, Mock
-from config_models.models import ConfigurationModel
+from mock import patch, Mock, ANY
+from config_models.models import ConfigurationModel, CURRENT_CALL_COUNTS
 from config_models.views import ConfigurationModelCurrentAPIView
+from request_cache.middleware import RequestCache
 
 
 class ExampleConfig(ConfigurationModel):
@@ -415,6 +417,90 @@ class KeyedConfigurationModelTests(TestCase):
         self.assertFalse(ExampleKeyedConfig.equal_to_current({}))
 
 
+@override_settings(CONFIG_MODELS_PROCESS_CACHE_TIMEOUT=60)
+@patch('config_models.models.cache')
+class ProcessCacheTests(TestCase):
+    """
+    Tests of the process-local cache of current configurations
+    """
+    def setUp(self):
+        super(ProcessCacheTests, self).setUp()
+        self.user = User()
+        self.user.save()
+        RequestCache.clear_request_cache()
+        self.addCleanup(RequestCache.clear_request_cache)
+        ExampleConfig.clear_process_cache()
+        self.addCleanup(ExampleConfig.clear_process_cache)
+        ExampleKeyedConfig.clear_process_cache()
+        self.addCleanup(ExampleKeyedConfig.clear_process_cache)
+
+    def _new_request(self, mock_cache, versions=None):
+        """
+        Simulate the start of a new request, in which the versions of the models are the given ones.
+        """
+        RequestCache.clear_request_cache()
+        mock_cache.get_many.reset_mock()
+        mock_cache.get_many.return_value = versions or {}
+
+    def test_current_kept_in_process(self, mock_cache):
+        mock_cache.get.return_value = None
+        self._new_request(mock_cache)
+        ExampleConfig(changed_by=self.user, string_field='first').save()
+
+        self.assertEquals(ExampleConfig.current().string_field, 'first')
+        self._new_request(mock_cache)
+        with self.assertNumQueries(0):
+            self.assertEquals(ExampleConfig.current().string_field, 'first')
+        self.assertEquals(mock_cache.get.call_count, 1)
+
+    def test_saving_evicts_process_cache(self, mock_cache):
+        mock_cache.get.return_value = None
+        self._new_request(mock_cache)
+        ExampleConfig(changed_by=self.user, string_field='first').save()
+        self.assertEquals(ExampleConfig.current().string_field, 'first')
+
+        ExampleConfig(changed_by=self.user, string_field='second').save()
+        self.assertEquals(ExampleConfig.current().string_field, 'second')
+        mock_cache.set.assert_any_call('configuration/ExampleConfig/version', ANY, None)
+
+    def test_version_changed_by_other_process(self, mock_cache):
+        mock_cache.get.return_value = None
+        self._new_request(mock_cache)
+        ExampleConfig(changed_by=self.user, string_field='first').save()
+        self.assertEquals(ExampleConfig.current().string_field, 'first')
+
+        # Another process saves a new entry, and changes the version of the model.
+        ExampleConfig.objects.update(string_field='second')
+        self._new_request(mock_cache)
+        self.assertEquals(ExampleConfig.current().string_field, 'first')
+        self._new_request(mock_cache, {'configuration/ExampleConfig/version': 'other'})
+        self.assertEquals(ExampleConfig.current().string_field, 'second')
+
+    def test_versions_fetched_once_per_request(self, mock_cache):
+        mock_cache.get.return_value = None
+        self._new_request(mock_cache)
+        ExampleConfig.current()
+        ExampleKeyedConfig.current('left', 'right')
+
+        self._new_request(mock_cache)
+        for __ in range(3):
+            ExampleConfig.current()
+            ExampleKeyedConfig.current('left', 'right')
+        self.assertEquals(mock_cache.get_many.call_count, 1)
+        self.assertEquals(
+            set(mock_cache.get_many.call_args[0][0]),
+            {'configuration/ExampleConfig/version', 'configuration/ExampleKeyedConfig/version'},
+        )
+
+    def test_current_call_counts(self, mock_cache):
+        mock_cache.get.return_value = None
+        self._new_request(mock_cache)
+        calls_before = CURRENT_CALL_COUNTS['ExampleConfig']
+        for __ in range(3):
+            ExampleConfig.current()
+        self.assertEquals(CURRENT_CALL_COUNTS['ExampleConfig'], calls_before + 3)
+
+
 @ddt.ddt
 class ConfigurationModelAPITests(TestCase):
     """
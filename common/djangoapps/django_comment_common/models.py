@@ -8,7 +8,7 @@ from django.db.models.signals import post_save
 from django.utils.translation import ugettext_noop
 
 from config_models.models import ConfigurationModel
-from student.models import CourseEnrollment
+from student.models import CourseEnrollment, ENROLLMENTS_BULK_SAVED
 
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
@@ -42,6 +42,15 @@ def assign_default_role_on_enrollment(sender, instance, **kwargs):
     assign_default_role(instance.course_id, instance.user)
 
 
+@receiver(ENROLLMENTS_BULK_SAVED)
+def assign_default_role_on_bulk_enrollment(sender, course_id, enrollments, **kwargs):  # pylint: disable=unused-argument
+    """
+    Assign forum default role 'Student' to the users of enrollments saved in bulk
+    """
+    role, __ = Role.objects.get_or_create(course_id=course_id, name=FORUM_ROLE_STUDENT)
+    role.users.add(*[enrollment.user_id for enrollment in enrollments])
+
+
 def assign_default_role(course_id, user):
     """
     Assign forum default role 'Student' to user
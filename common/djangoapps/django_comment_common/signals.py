@@ -1,7 +1,11 @@
 # pylint: disable=invalid-name
 """Signals related to the comments service."""
 
-from django.dispatch import Signal
+from django.core.cache import cache
+from django.dispatch import Signal, receiver
+from xmodule.modulestore.django import SignalHandler
+
+from django_comment_common.utils import get_discussion_category_skeleton_cache_key
 
 
 thread_created = Signal(providing_args=['user', 'post'])
@@ -13,3 +17,12 @@ comment_edited = Signal(providing_args=['user', 'post'])
 comment_voted = Signal(providing_args=['user', 'post'])
 comment_deleted = Signal(providing_args=['user', 'post'])
 comment_endorsed = Signal(providing_args=['user', 'post'])
+
+
+@receiver(SignalHandler.course_published)
+def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    Catches the signal that a course has been published in Studio and
+    evicts the cached discussion category skeleton of the course.
+    """
+    cache.delete(get_discussion_category_skeleton_cache_key(course_key))
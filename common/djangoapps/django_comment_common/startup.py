@@ -0,0 +1,4 @@
+"""
+Setup the signals on startup.
+"""
+import django_comment_common.signals  # pylint: disable=unused-import
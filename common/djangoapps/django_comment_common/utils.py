@@ -22,6 +22,14 @@ MODERATOR_ROLE_PERMISSIONS = ["edit_content", "delete_thread", "openclose_thread
 ADMINISTRATOR_ROLE_PERMISSIONS = ["manage_moderator"]
 
 
+def get_discussion_category_skeleton_cache_key(course_key):
+    """
+    Returns the django cache key under which the discussion category skeleton of
+    the course is stored.
+    """
+    return u"django_comment_client.discussion_category_skeleton.{}".format(course_key)
+
+
 def _save_forum_role(course_key, name):
     """
     Save and Update 'course_key' for all roles which are already created to keep course_id same
@@ -0,0 +1,61 @@
+"""
+Management command for compiling mako templates ahead of time.
+"""
+
+from __future__ import unicode_literals
+
+from django.core.management import BaseCommand, CommandError
+
+from edxmako.paths import PRECOMPILED_TEMPLATE_EXTENSIONS, precompile_lookups
+
+
+class Command(BaseCommand):
+    """
+    Compile the templates of every mako lookup namespace, including the templates
+    of comprehensive themes, into the module directory of the lookup.
+
+    Run it at deploy time, with the settings the application is served with, so that
+    the application servers find the compiled modules instead of compiling each template
+    on its first use. Set MAKO_PRECOMPILE_TEMPLATES to load them eagerly at startup.
+    """
+
+    help = 'Compile mako templates into the module directory of their lookup.'
+
+    def add_arguments(self, parser):
+        """
+            Add arguments for compile_mako_templates command.
+
+            Args:
+                parser (django.core.management.base.CommandParser): parsed for parsing command line arguments.
+        """
+        parser.add_argument(
+            '--extensions',
+            type=str,
+            nargs='+',
+            default=list(PRECOMPILED_TEMPLATE_EXTENSIONS),
+            help="Extensions of the template files to compile.",
+        )
+        parser.add_argument(
+            '--strict',
+            action='store_true',
+            default=False,
+            help="Fail if any template does not compile.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle compile_mako_templates command.
+        """
+        failed = 0
+        for namespace, (compiled, failures) in sorted(precompile_lookups(options['extensions']).items()):
+            for uri, error in sorted(failures.items()):
+                self.stderr.write("{namespace}: {uri} failed to compile: {error}".format(
+                    namespace=namespace, uri=uri, error=error,
+                ))
+            self.stdout.write("{namespace}: compiled {count} templates".format(
+                namespace=namespace, count=len(compiled),
+            ))
+            failed += len(failures)
+
+        if failed and options['strict']:
+            raise CommandError("{count} templates failed to compile".format(count=failed))
@@ -6,18 +6,32 @@ import hashlib
 import contextlib
 import os
 import pkg_resources
+from collections import defaultdict
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from mako.lookup import TemplateLookup
 from mako.exceptions import TopLevelLookupException
 
 from . import LOOKUP
+from openedx.core.djangoapps.theming import helpers as theming_helpers
 from openedx.core.djangoapps.theming.helpers import (
     get_template as themed_template,
     get_template_path_with_theme,
     strip_site_theme_templates_path,
 )
 
+# Settings which affect how template uris resolve to themed templates.
+THEME_SETTINGS = (
+    'ENABLE_COMPREHENSIVE_THEMING',
+    'COMPREHENSIVE_THEME_DIRS',
+    'DEFAULT_SITE_THEME',
+)
+
+# Extensions of the files in the template directories which are compiled ahead of time.
+PRECOMPILED_TEMPLATE_EXTENSIONS = ('.html', '.txt', '.xml')
+
 
 class DynamicTemplateLookup(TemplateLookup):
     """
@@ -27,6 +41,8 @@ class DynamicTemplateLookup(TemplateLookup):
     def __init__(self, *args, **kwargs):
         super(DynamicTemplateLookup, self).__init__(*args, **kwargs)
         self.__original_module_directory = self.template_args['module_directory']
+        # Maps (site theme directory name, uri) to the template the uri resolves to.
+        self._resolved_templates = {}
 
     def __repr__(self):
         return "<{0.__class__.__name__} {0.directories}>".format(self)
@@ -51,6 +67,14 @@ class DynamicTemplateLookup(TemplateLookup):
         # Also clear the internal caches. Ick.
         self._collection.clear()
         self._uri_cache.clear()
+        self.clear_resolved_templates()
+
+    def clear_resolved_templates(self):
+        """
+        Forget which templates uris resolved to, e.g. because the theme
+        settings have changed.
+        """
+        self._resolved_templates.clear()
 
     def get_template(self, uri):
         """
@@ -65,18 +89,94 @@ class DynamicTemplateLookup(TemplateLookup):
         """
         # try to get template for the given file from microsite
         template = themed_template(uri)
+        if template:
+            return template
 
         # if microsite template is not present or request is not in microsite then
-        # let mako find and serve a template
-        if not template:
+        # let mako find and serve a template, remembering which one it was for
+        # the site theme, so that the theme lookup happens once per uri.
+        site_theme = theming_helpers.get_current_site_theme()
+        cache_key = (site_theme.theme_dir_name if site_theme else None, uri)
+        template = self._resolved_templates.get(cache_key)
+        if template is not None:
+            if self.filesystem_checks:
+                # Let mako reload the template if it has been modified.
+                template = super(DynamicTemplateLookup, self).get_template(template.uri)
+            return template
+
+        try:
+            # Try to find themed template, i.e. see if current theme overrides the template
+            template = super(DynamicTemplateLookup, self).get_template(get_template_path_with_theme(uri))
+        except TopLevelLookupException:
+            # strip off the prefix path to theme and look in default template dirs
+            template = super(DynamicTemplateLookup, self).get_template(strip_site_theme_templates_path(uri))
+
+        self._resolved_templates[cache_key] = template
+        return template
+
+    def template_uris(self, extensions=PRECOMPILED_TEMPLATE_EXTENSIONS):
+        """
+        Yield the uri of every template in the lookup directories, including
+        the templates of the comprehensive themes found in them.
+        """
+        themes_by_base_dir = defaultdict(list)
+        for theme in theming_helpers.get_themes():
+            themes_by_base_dir[os.path.normpath(theme.themes_base_dir)].append(theme)
+
+        seen = set()
+        for directory in self.directories:
+            if directory in themes_by_base_dir:
+                # Only the templates of a theme are mako templates, not its static assets.
+                roots = [(theme.path / 'templates', theme.template_path) for theme in themes_by_base_dir[directory]]
+            else:
+                roots = [(directory, '')]
+            for root, prefix in roots:
+                for uri in _find_templates(root, prefix, extensions):
+                    if uri not in seen:
+                        seen.add(uri)
+                        yield uri
+
+    def precompile(self, extensions=PRECOMPILED_TEMPLATE_EXTENSIONS):
+        """
+        Compile every template of the lookup into its module directory and
+        keep it loaded.
+
+        Returns a tuple of the list of compiled uris and a dict mapping the
+        uris which failed to compile to their errors. Any error, e.g. a mako
+        syntax error or an unwritable module directory, only skips its
+        template, which is then compiled lazily when it's first rendered.
+        """
+        compiled = []
+        failures = {}
+        for uri in self.template_uris(extensions):
             try:
-                # Try to find themed template, i.e. see if current theme overrides the template
-                template = super(DynamicTemplateLookup, self).get_template(get_template_path_with_theme(uri))
-            except TopLevelLookupException:
-                # strip off the prefix path to theme and look in default template dirs
-                template = super(DynamicTemplateLookup, self).get_template(strip_site_theme_templates_path(uri))
+                super(DynamicTemplateLookup, self).get_template(uri)
+            except Exception as error:  # pylint: disable=broad-except
+                failures[uri] = error
+            else:
+                compiled.append(uri)
+        return compiled, failures
 
-        return template
+
+def _find_templates(root, prefix, extensions):
+    """
+    Yield the uris, prefixed with `prefix`, of the files under `root` which
+    have one of the given extensions.
+    """
+    for dirpath, __, filenames in os.walk(root):
+        for filename in sorted(filenames):
+            if filename.endswith(tuple(extensions)):
+                yield str(os.path.join(prefix, os.path.relpath(os.path.join(dirpath, filename), root)))
+
+
+@receiver(setting_changed)
+def clear_resolved_templates(setting, **kwargs):  # pylint: disable=unused-argument
+    """
+    Forget which templates uris resolved to when the theme settings change.
+    """
+    if setting in THEME_SETTINGS:
+        for lookup in LOOKUP.values():
+            lookup.clear_resolved_templates()
 
 
 def clear_lookups(namespace):
@@ -109,6 +209,16 @@ def add_lookup(namespace, directory, package=None, prepend=False):
     templates.add_directory(directory, prepend=prepend)
 
 
+def precompile_lookups(extensions=PRECOMPILED_TEMPLATE_EXTENSIONS):
+    """
+    Compile the templates of every mako template lookup ahead of time.
+
+    Returns a dict mapping each namespace to the result of
+    `DynamicTemplateLookup.precompile` for it.
+    """
+    return {namespace: lookup.precompile(extensions) for namespace, lookup in LOOKUP.items()}
+
+
 def lookup_template(namespace, name):
     """
     Look up a Mako template by namespace and name.
@@ -1,8 +1,12 @@
 """
 Initialize the mako template lookup
 """
+import logging
+
 from django.conf import settings
-from . import add_lookup, clear_lookups
+from . import add_lookup, clear_lookups, precompile_lookups
+
+log = logging.getLogger(__name__)
 
 
 def run():
@@ -17,3 +21,23 @@ def run():
         clear_lookups(namespace)
         for directory in directories:
             add_lookup(namespace, directory)
+
+    if settings.MAKO_PRECOMPILE_TEMPLATES:
+        try:
+            load_precompiled_templates()
+        except Exception:  # pylint: disable=broad-except
+            # The templates are still compiled lazily when they're first rendered.
+            log.exception(u"Failed to precompile the mako templates")
+
+
+def load_precompiled_templates():
+    """
+    Eagerly load every mako template, verifying that each one compiles.
+
+    Templates which were compiled at deploy time by the `compile_mako_templates`
+    management command are loaded from the module directory of their lookup.
+    """
+    for namespace, (compiled, failures) in precompile_lookups().items():
+        for uri, error in failures.items():
+            log.error(u"Mako template %s in namespace %s failed to compile: %s", uri, namespace, error)
+        log.info(u"Loaded %d mako templates in namespace %s", len(compiled), namespace)
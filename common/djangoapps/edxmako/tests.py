@@ -1,4 +1,7 @@
 from mock import patch, Mock
+import os
+import shutil
+import tempfile
 import unittest
 import ddt
 
@@ -10,7 +13,7 @@ from django.test.utils import override_settings
 from django.test.client import RequestFactory
 from django.core.urlresolvers import reverse
 from edxmako.request_context import get_template_request_context
-from edxmako import add_lookup, LOOKUP
+from edxmako import add_lookup, clear_lookups, lookup_template, LOOKUP
 from edxmako.shortcuts import (
     marketing_link,
     is_marketing_link_set,
@@ -80,6 +83,54 @@ class AddLookupTests(TestCase):
         self.assertTrue(dirs[0].endswith('management'))
 
 
+class DynamicTemplateLookupTests(TestCase):
+    """
+    Test the resolution of template uris by `DynamicTemplateLookup`.
+    """
+    def setUp(self):
+        super(DynamicTemplateLookupTests, self).setUp()
+        template_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, template_dir)
+        with open(os.path.join(template_dir, 'test.html'), 'w') as template_file:
+            template_file.write('test')
+
+        add_lookup('dynamic_lookup_test', template_dir)
+        self.addCleanup(clear_lookups, 'dynamic_lookup_test')
+
+    def test_resolution_cached(self):
+        with patch('edxmako.paths.get_template_path_with_theme', side_effect=lambda uri: uri) as mock_resolve:
+            template = lookup_template('dynamic_lookup_test', 'test.html')
+            self.assertIs(lookup_template('dynamic_lookup_test', 'test.html'), template)
+            self.assertEqual(mock_resolve.call_count, 1)
+
+    def test_resolution_cleared_on_theme_settings_change(self):
+        with patch('edxmako.paths.get_template_path_with_theme', side_effect=lambda uri: uri) as mock_resolve:
+            lookup_template('dynamic_lookup_test', 'test.html')
+            with override_settings(ENABLE_COMPREHENSIVE_THEMING=not settings.ENABLE_COMPREHENSIVE_THEMING):
+                lookup_template('dynamic_lookup_test', 'test.html')
+            self.assertEqual(mock_resolve.call_count, 2)
+
+    def test_precompile(self):
+        template_dir = LOOKUP['dynamic_lookup_test'].directories[0]
+        os.mkdir(os.path.join(template_dir, 'nested'))
+        for name, content in (('nested/test.txt', 'test'), ('broken.html', '${'), ('script.js', '${')):
+            with open(os.path.join(template_dir, name), 'w') as template_file:
+                template_file.write(content)
+
+        compiled, failures = LOOKUP['dynamic_lookup_test'].precompile()
+        self.assertEqual(sorted(compiled), ['nested/test.txt', 'test.html'])
+        self.assertEqual(failures.keys(), ['broken.html'])
+        module_directory = LOOKUP['dynamic_lookup_test'].template_args['module_directory']
+        self.assertTrue(os.path.exists(os.path.join(module_directory, 'nested', 'test.txt.py')))
+
+    def test_precompile_io_error(self):
+        with patch('mako.lookup.TemplateLookup.get_template', side_effect=IOError('Permission denied')):
+            compiled, failures = LOOKUP['dynamic_lookup_test'].precompile()
+        self.assertEqual(compiled, [])
+        self.assertEqual(failures.keys(), ['test.html'])
+        self.assertIsInstance(failures['test.html'], IOError)
+
+
 class MakoRequestContextTest(TestCase):
     """
     Test MakoMiddleware.
@@ -6,7 +6,6 @@ This API is exposed via the middleware(emabargo/middileware.py) layer but may be
 
 """
 import logging
-import pygeoip
 
 from django.core.cache import cache
 from django.conf import settings
@@ -14,6 +13,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from ipware.ip import get_ip
 
+from geoinfo.api import country_code_from_ip
 from student.auth import has_course_author_access
 from embargo.models import CountryAccessRule, RestrictedCourse
 
@@ -60,27 +60,60 @@ def check_course_access(course_key, user=None, ip_address=None, url=None):
         Boolean: True if the user has access to the course; False otherwise
 
     """
+    return check_courses_access([course_key], user=user, ip_address=ip_address, url=url)[course_key]
+
+
+def check_courses_access(course_keys, user=None, ip_address=None, url=None):
+    """
+    Check if the user with this ip_address has access to each of the given courses,
+    e.g. for the courses listed in a catalog or dashboard page.
+
+    The user's countries are looked up once, and the access rules of all the courses
+    are retrieved at once.
+
+    Arguments:
+        course_keys (list of CourseKey): Locations of the courses the user is trying to access.
+
+    Keyword Arguments:
+        Same as `check_course_access`
+
+    Returns:
+        dict: maps each course key to True if the user has access to the course; False otherwise
+
+    """
+    access = {course_key: True for course_key in course_keys}
+
     # No-op if the country access feature is not enabled
     if not settings.FEATURES.get('EMBARGO'):
-        return True
+        return access
 
-    # First, check whether there are any restrictions on the course.
+    # First, check whether there are any restrictions on the courses.
     # If not, then we do not need to do any further checks
-    course_is_restricted = RestrictedCourse.is_restricted_course(course_key)
-
-    if not course_is_restricted:
-        return True
+    restricted_course_keys = RestrictedCourse.filter_restricted_courses(course_keys)
 
     # Always give global and course staff access, regardless of embargo settings.
-    if user is not None and has_course_author_access(user, course_key):
-        return True
-
-    if ip_address is not None:
-        # Retrieve the country code from the IP address
-        # and check it against the allowed countries list for a course
-        user_country_from_ip = _country_code_from_ip(ip_address)
-
-        if not CountryAccessRule.check_country_access(course_key, user_country_from_ip):
+    if user is not None:
+        restricted_course_keys = [
+            course_key for course_key in restricted_course_keys
+            if not has_course_author_access(user, course_key)
+        ]
+
+    if not restricted_course_keys:
+        return access
+
+    access_bitmaps = CountryAccessRule.get_country_access_bitmaps(restricted_course_keys)
+
+    # Retrieve the country code from the IP address and from the user's profile
+    # and check them against the allowed countries list for each course
+    user_country_from_ip = _country_code_from_ip(ip_address) if ip_address is not None else None
+    user_country_from_profile = _get_user_country_from_profile(user) if user is not None else None
+
+    for course_key in restricted_course_keys:
+        access_bitmap = access_bitmaps[course_key]
+        if (
+            user_country_from_ip is not None and
+            not CountryAccessRule.check_country_access_in_bitmap(access_bitmap, user_country_from_ip)
+        ):
             log.info(
                 (
                     u"Blocking user %s from accessing course %s at %s "
@@ -93,14 +126,11 @@ def check_course_access(course_key, user=None, ip_address=None, url=None):
                 ip_address,
                 user_country_from_ip
             )
-            return False
-
-    if user is not None:
-        # Retrieve the country code from the user's profile
-        # and check it against the allowed countries list for a course.
-        user_country_from_profile = _get_user_country_from_profile(user)
-
-        if not CountryAccessRule.check_country_access(course_key, user_country_from_profile):
+            access[course_key] = False
+        elif (
+            user_country_from_profile is not None and
+            not CountryAccessRule.check_country_access_in_bitmap(access_bitmap, user_country_from_profile)
+        ):
             log.info(
                 (
                     u"Blocking user %s from accessing course %s at %s "
@@ -108,9 +138,9 @@ def check_course_access(course_key, user=None, ip_address=None, url=None):
                 ),
                 user.id, course_key, url, user_country_from_profile
             )
-            return False
+            access[course_key] = False
 
-    return True
+    return access
 
 
 def message_url_path(course_key, access_point):
@@ -170,10 +200,7 @@ def _country_code_from_ip(ip_addr):
         str: A 2-letter country code.
 
     """
-    if ip_addr.find(':') >= 0:
-        return pygeoip.GeoIP(settings.GEOIPV6_PATH).country_code_by_addr(ip_addr)
-    else:
-        return pygeoip.GeoIP(settings.GEOIP_PATH).country_code_by_addr(ip_addr)
+    return country_code_from_ip(ip_addr)
 
 
 def get_embargo_response(request, course_id, user):
@@ -182,6 +182,20 @@ class RestrictedCourse(models.Model):
             and cls._get_restricted_courses_from_cache().get(unicode(course_id))["disable_access_check"]
         )
 
+    @classmethod
+    def filter_restricted_courses(cls, course_ids):
+        """
+        Return which of the given courses are in the restricted list
+
+        Args:
+            course_ids (list): course_ids to look for
+
+        Returns:
+            list of the course_ids which are in the restricted course list.
+        """
+        restricted_courses = cls._get_restricted_courses_from_cache()
+        return [course_id for course_id in course_ids if unicode(course_id) in restricted_courses]
+
     @classmethod
     def _get_restricted_courses_from_cache(cls):
         """
@@ -432,10 +446,13 @@ class CountryAccessRule(models.Model):
         help_text=ugettext_lazy(u"The country to which this rule applies.")
     )
 
-    CACHE_KEY = u"embargo.allowed_countries.{course_key}"
+    CACHE_KEY = u"embargo.country_access_bitmap.{course_key}"
 
     ALL_COUNTRIES = set(code[0] for code in list(countries))
 
+    # The bit of each country in the access bitmap of a course.
+    COUNTRY_BITS = dict((code, bit) for bit, code in enumerate(sorted(ALL_COUNTRIES)))
+
     @classmethod
     def check_country_access(cls, course_id, country):
         """
@@ -458,13 +475,54 @@ class CountryAccessRule(models.Model):
         if country not in cls.ALL_COUNTRIES:
             return True
 
-        cache_key = cls.CACHE_KEY.format(course_key=course_id)
-        allowed_countries = cache.get(cache_key)
-        if allowed_countries is None:
-            allowed_countries = cls._get_country_access_list(course_id)
-            cache.set(cache_key, allowed_countries)
+        return cls.check_country_access_in_bitmap(cls.get_country_access_bitmaps([course_id])[course_id], country)
 
-        return country == '' or country in allowed_countries
+    @classmethod
+    def check_country_access_in_bitmap(cls, bitmap, country):
+        """
+        Check if the country is allowed by the access bitmap of a course
+
+        Args:
+            bitmap (int): access bitmap of the course, see `get_country_access_bitmaps`
+            country (str): A 2 characters code of country
+
+        Returns:
+            Boolean
+            True if the country is allowed, or is not a known country
+        """
+        bit = cls.COUNTRY_BITS.get(country)
+        return bit is None or bool(bitmap >> bit & 1)
+
+    @classmethod
+    def get_country_access_bitmaps(cls, course_ids):
+        """
+        Return the access bitmaps of the courses, which have the bits of the countries in
+        `COUNTRY_BITS` set when the country is allowed to access the course.
+
+        The bitmaps are built from the rules of the courses and cached, so that checking
+        the access of a country to a course is a lookup in the cache and a bit test.
+
+        Args:
+            course_ids (list): course_ids to look for
+
+        Returns:
+            dict mapping each course_id to its access bitmap
+        """
+        cache_keys = {course_id: cls.CACHE_KEY.format(course_key=course_id) for course_id in course_ids}
+        cached_bitmaps = cache.get_many(cache_keys.values())
+
+        bitmaps = {}
+        for course_id, cache_key in cache_keys.iteritems():
+            bitmap = cached_bitmaps.get(cache_key)
+            if bitmap is None:
+                bitmap = sum(
+                    1 << cls.COUNTRY_BITS[country]
+                    for country in cls._get_country_access_list(course_id)
+                    if country in cls.COUNTRY_BITS
+                )
+                cache.set(cache_key, bitmap)
+            bitmaps[course_id] = bitmap
+        return bitmaps
 
     @classmethod
     def _get_country_access_list(cls, course_id):
@@ -7,6 +7,7 @@ import pygeoip
 from django.core.urlresolvers import reverse
 from django.core.cache import cache
 from embargo.models import Country, CountryAccessRule, RestrictedCourse
+from geoinfo.api import clear_country_cache
 
 
 @contextlib.contextmanager
@@ -43,6 +44,7 @@ def restrict_course(course_key, access_point="enrollment", disable_access_check=
     # Clear the cache to ensure that previous tests don't interfere
     # with this test.
     cache.clear()
+    clear_country_cache()
 
     with mock.patch.object(pygeoip.GeoIP, 'country_code_by_addr') as mock_ip:
 
@@ -32,6 +32,7 @@ from embargo.models import (
 from util.testing import UrlResetMixin
 from embargo import api as embargo_api
 from embargo.exceptions import InvalidAccessPoint
+from geoinfo.api import clear_country_cache
 from mock import patch
 
 
@@ -178,6 +179,68 @@ class EmbargoCheckAccessApiTests(ModuleStoreTestCase):
             with self.assertNumQueries(0):
                 embargo_api.check_course_access(self.course.id, user=self.user, ip_address='0.0.0.0')
 
+    def test_check_courses_access(self):
+        CountryAccessRule.objects.create(
+            rule_type=CountryAccessRule.BLACKLIST_RULE,
+            restricted_course=self.restricted_course,
+            country=Country.objects.get(country='IR')
+        )
+        other_restricted_course = CourseFactory.create()
+        RestrictedCourse.objects.create(course_key=other_restricted_course.id)
+        unrestricted_course = CourseFactory.create()
+        course_keys = [self.course.id, other_restricted_course.id, unrestricted_course.id]
+
+        with self._mock_geoip('IR'):
+            result = embargo_api.check_courses_access(course_keys, ip_address='0.0.0.0')
+            self.assertEqual(result, {
+                self.course.id: False,
+                other_restricted_course.id: True,
+                unrestricted_course.id: True,
+            })
+
+            # The access rules of all the courses are cached at once.
+            with self.assertNumQueries(0):
+                embargo_api.check_courses_access(course_keys, ip_address='0.0.0.0')
+
+    def test_check_courses_access_profile_country(self):
+        CountryAccessRule.objects.create(
+            rule_type=CountryAccessRule.BLACKLIST_RULE,
+            restricted_course=self.restricted_course,
+            country=Country.objects.get(country='IR')
+        )
+        whitelisted_course = CourseFactory.create()
+        CountryAccessRule.objects.create(
+            rule_type=CountryAccessRule.WHITELIST_RULE,
+            restricted_course=RestrictedCourse.objects.create(course_key=whitelisted_course.id),
+            country=Country.objects.get(country='US')
+        )
+        other_blacklisted_course = CourseFactory.create()
+        CountryAccessRule.objects.create(
+            rule_type=CountryAccessRule.BLACKLIST_RULE,
+            restricted_course=RestrictedCourse.objects.create(course_key=other_blacklisted_course.id),
+            country=Country.objects.get(country='CU')
+        )
+        course_keys = [self.course.id, whitelisted_course.id, other_blacklisted_course.id]
+
+        # The IP address is allowed everywhere, but not the user's profile country
+        self.user.profile.country = 'IR'
+        self.user.profile.save()
+        with self._mock_geoip('US'):
+            result = embargo_api.check_courses_access(course_keys, user=self.user, ip_address='0.0.0.0')
+        self.assertEqual(result, {
+            self.course.id: False,
+            whitelisted_course.id: False,
+            other_blacklisted_course.id: True,
+        })
+
+        # The same as checking each course on its own
+        with self._mock_geoip('US'):
+            for course_key in course_keys:
+                self.assertEqual(
+                    result[course_key],
+                    embargo_api.check_course_access(course_key, user=self.user, ip_address='0.0.0.0')
+                )
+
     def test_caching_no_restricted_courses(self):
         RestrictedCourse.objects.all().delete()
         cache.clear()
@@ -229,6 +292,7 @@ class EmbargoCheckAccessApiTests(ModuleStoreTestCase):
 
     @contextmanager
     def _mock_geoip(self, country_code):
+        clear_country_cache()
         with mock.patch.object(pygeoip.GeoIP, 'country_code_by_addr') as mock_ip:
             mock_ip.return_value = country_code
             yield
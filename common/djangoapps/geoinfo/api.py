@@ -0,0 +1,130 @@
+"""
+Geolocation of IP addresses, shared by every app in the process.
+
+The GeoIP databases are opened once per process in memory-mapped mode, and
+reopened when they change on disk. The countries of the most recently looked
+up IP addresses are remembered.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pygeoip
+from django.conf import settings
+
+log = logging.getLogger(__name__)
+
+# How many IP addresses to remember the country of, per database.
+COUNTRY_CACHE_SIZE = 10000
+
+# How often, in seconds, to check whether a database has changed on disk.
+DATABASE_CHECK_INTERVAL = 60
+
+
+class GeoIPDatabase(object):
+    """
+    A GeoIP database file, along with the countries of the IP addresses
+    recently looked up in it.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._reader = None
+        self._mtime = None
+        self._checked_at = None
+        self._countries = OrderedDict()
+
+    def _get_reader(self):
+        """
+        Return the reader of the database, (re)opening it if the file changed on disk.
+
+        A new reader replaces the current one in a single assignment, so lookups
+        in progress keep using the reader they started with.
+        """
+        now = time.time()
+        if self._checked_at is not None and now - self._checked_at < DATABASE_CHECK_INTERVAL:
+            return self._reader
+
+        with self._lock:
+            if self._checked_at is None or now - self._checked_at >= DATABASE_CHECK_INTERVAL:
+                mtime = os.path.getmtime(self.path)
+                if mtime != self._mtime:
+                    # Don't let pygeoip hand back the instance it already opened for this path.
+                    self._reader = pygeoip.GeoIP(self.path, pygeoip.MMAP_CACHE, cache=False)
+                    self._mtime = mtime
+                    self._countries.clear()
+                    log.info(u"Opened GeoIP database %s", self.path)
+                self._checked_at = now
+        return self._reader
+
+    def country_code_by_addr(self, ip_addr):
+        """
+        Return the 2-letter code of the country the IP address is located in.
+        """
+        reader = self._get_reader()
+        with self._lock:
+            country_code = self._countries.pop(ip_addr, None)
+            if country_code is not None:
+                self._countries[ip_addr] = country_code
+                return country_code
+
+        country_code = reader.country_code_by_addr(ip_addr)
+
+        with self._lock:
+            self._countries[ip_addr] = country_code
+            if len(self._countries) > COUNTRY_CACHE_SIZE:
+                self._countries.popitem(last=False)
+        return country_code
+
+    def clear(self):
+        """
+        Forget the countries of the IP addresses looked up so far.
+        """
+        with self._lock:
+            self._countries.clear()
+
+
+_DATABASES = {}
+_DATABASES_LOCK = threading.Lock()
+
+
+def _get_database(path):
+    """
+    Return the process-wide `GeoIPDatabase` for the file at `path`.
+    """
+    database = _DATABASES.get(path)
+    if database is None:
+        with _DATABASES_LOCK:
+            database = _DATABASES.setdefault(path, GeoIPDatabase(path))
+    return database
+
+
+def country_code_from_ip(ip_addr):
+    """
+    Return the country code associated with an IP address.
+    Handles both IPv4 and IPv6 addresses.
+
+    Args:
+        ip_addr (str): The IP address to look up.
+
+    Returns:
+        str: A 2-letter country code.
+
+    """
+    if ip_addr.find(':') >= 0:
+        return _get_database(settings.GEOIPV6_PATH).country_code_by_addr(ip_addr)
+    else:
+        return _get_database(settings.GEOIP_PATH).country_code_by_addr(ip_addr)
+
+
+def clear_country_cache():
+    """
+    Forget the countries of the IP addresses looked up so far, e.g. because
+    tests mock the GeoIP lookups.
+    """
+    with _DATABASES_LOCK:
+        for database in _DATABASES.values():
+            database.clear()
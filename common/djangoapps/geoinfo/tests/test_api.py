@@ -0,0 +1,48 @@
+"""
+Tests for the geolocation of IP addresses.
+"""
+from mock import patch
+import pygeoip
+
+from django.test import TestCase
+
+from geoinfo import api as geoinfo_api
+
+
+class CountryCodeFromIpTests(TestCase):
+    """
+    Tests of `country_code_from_ip`.
+    """
+    def setUp(self):
+        super(CountryCodeFromIpTests, self).setUp()
+        geoinfo_api.clear_country_cache()
+        self.addCleanup(geoinfo_api.clear_country_cache)
+        patcher = patch.object(pygeoip.GeoIP, 'country_code_by_addr', return_value='CN')
+        self.mock_country_code_by_addr = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ipv4_and_ipv6(self):
+        self.assertEqual(geoinfo_api.country_code_from_ip('117.79.83.1'), 'CN')
+        self.assertEqual(geoinfo_api.country_code_from_ip('2001:da8:20f:1502:edcf:550b:4a9c:207d'), 'CN')
+        self.assertEqual(self.mock_country_code_by_addr.call_count, 2)
+
+    def test_recent_countries_remembered(self):
+        for __ in range(3):
+            self.assertEqual(geoinfo_api.country_code_from_ip('117.79.83.1'), 'CN')
+        self.assertEqual(self.mock_country_code_by_addr.call_count, 1)
+
+    @patch.object(geoinfo_api, 'COUNTRY_CACHE_SIZE', 2)
+    def test_least_recently_used_forgotten(self):
+        for ip_addr in ('117.79.83.1', '117.79.83.2', '117.79.83.1', '117.79.83.3', '117.79.83.1'):
+            geoinfo_api.country_code_from_ip(ip_addr)
+        self.assertEqual(self.mock_country_code_by_addr.call_count, 3)
+
+        geoinfo_api.country_code_from_ip('117.79.83.2')
+        self.assertEqual(self.mock_country_code_by_addr.call_count, 4)
+
+    @patch.object(geoinfo_api, 'DATABASE_CHECK_INTERVAL', 0)
+    def test_reopened_when_changed_on_disk(self):
+        geoinfo_api.country_code_from_ip('117.79.83.1')
+        with patch('geoinfo.api.os.path.getmtime', return_value=0):
+            self.assertEqual(geoinfo_api.country_code_from_ip('117.79.83.1'), 'CN')
+        self.assertEqual(self.mock_country_code_by_addr.call_count, 2)
@@ -0,0 +1,49 @@
+"""Management command to correct the enrollment counts which drifted from the enrollments."""
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from student.models import CourseEnrollmentCount
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+
+class Command(BaseCommand):
+    """Management command to correct the enrollment counts which drifted from the enrollments."""
+
+    help = """
+    Recount the active enrollments in each mode of the given courses, or of
+    every course if none is given, and correct the stored enrollment counts.
+
+    Example:
+
+        $ ... reconcile_enrollment_counts course-v1:SomeCourse+SomethingX+2016
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'course_ids',
+            nargs='*',
+            help='the courses to reconcile the enrollment counts of'
+        )
+
+    def handle(self, *args, **options):
+        if not options['course_ids']:
+            num_corrected = CourseEnrollmentCount.reconcile_all()
+            logger.info(u"Corrected the enrollment counts of %d courses.", num_corrected)
+            return
+
+        try:
+            course_keys = [CourseKey.from_string(course_id) for course_id in options['course_ids']]
+        except InvalidKeyError as error:
+            raise CommandError(u'Invalid course key: {}'.format(error))
+
+        for course_key in course_keys:
+            corrections = CourseEnrollmentCount.reconcile(course_key)
+            for mode, (stored_count, actual_count) in sorted(corrections.iteritems()):
+                logger.info(
+                    u"Corrected the %s enrollment count of course %s from %s to %d.",
+                    mode, course_key, stored_count, actual_count
+                )
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models import Count
+from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
+
+
+def count_enrollments(apps, schema_editor):
+    """
+    Count the active enrollments in each mode of every course.
+    """
+    CourseEnrollment = apps.get_model("student", "CourseEnrollment")
+    CourseEnrollmentCount = apps.get_model("student", "CourseEnrollmentCount")
+
+    counts = CourseEnrollment.objects.filter(is_active=True).values_list(
+        'course_id', 'mode'
+    ).order_by().annotate(Count('id'))
+    CourseEnrollmentCount.objects.bulk_create(
+        (
+            CourseEnrollmentCount(course_id=course_id, mode=mode, count=count)
+            for course_id, mode, count in counts
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('student', '0006_logoutviewconfiguration'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseEnrollmentCount',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('course_id', CourseKeyField(max_length=255, db_index=True)),
+                ('mode', models.CharField(max_length=100)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='courseenrollmentcount',
+            unique_together=set([('course_id', 'mode')]),
+        ),
+        migrations.RunPython(count_enrollments, reverse_code=migrations.RunPython.noop),
+    ]
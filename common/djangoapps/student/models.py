@@ -10,7 +10,7 @@ file and check it in at the same time as your model changes. To do that,
 2. ./manage.py lms schemamigration student --auto description_of_your_change
 3. Add the migration file created in edx-platform/common/djangoapps/student/migrations/
 """
-from collections import defaultdict, OrderedDict, namedtuple
+from collections import Counter, defaultdict, OrderedDict, namedtuple
 from datetime import datetime, timedelta
 from functools import total_ordering
 import hashlib
@@ -31,7 +31,7 @@ from django.contrib.auth.models import User
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.db import models, IntegrityError, transaction
-from django.db.models import Count
+from django.db.models import Count, F
 from django.db.models.signals import pre_save, post_save
 from django.dispatch import receiver, Signal
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
@@ -63,6 +63,11 @@ from util.milestones_helpers import is_entrance_exams_enabled
 
 UNENROLL_DONE = Signal(providing_args=["course_enrollment", "skip_refund"])
 ENROLL_STATUS_CHANGE = Signal(providing_args=["event", "user", "course_id", "mode", "cost", "currency"])
+# Sent once per batch of enrollments saved by CourseEnrollment.bulk_enroll and
+# CourseEnrollment.bulk_unenroll, which don't send post_save for each of them.
+# `old_modes` maps the ids of the enrollments to their mode before the batch,
+# which is None for the enrollments created by the batch.
+ENROLLMENTS_BULK_SAVED = Signal(providing_args=["course_id", "enrollments", "old_modes"])
 log = logging.getLogger(__name__)
 AUDIT_LOG = logging.getLogger("audit")
 SessionStore = import_module(settings.SESSION_ENGINE).SessionStore  # pylint: disable=invalid-name
@@ -887,11 +892,22 @@ class AlreadyEnrolledError(CourseEnrollmentException):
     pass
 
 
+# Named tuple for the fields of an enrollment, and of its user, which
+# reports and emails need. It is used to stream the enrollments of a
+# course without building User objects.
+EnrollmentProjection = namedtuple(
+    'EnrollmentProjection', 'user_id, username, email, name, mode, is_active, created'
+)
+
+
 class CourseEnrollmentManager(models.Manager):
     """
     Custom manager for CourseEnrollment with Table-level filter methods.
     """
 
+    # How many enrollments `enrollment_projections` fetches per query.
+    PROJECTION_CHUNK_SIZE = 5000
+
     def num_enrolled_in(self, course_id):
         """
         Returns the count of active enrollments in a course.
@@ -899,12 +915,7 @@ class CourseEnrollmentManager(models.Manager):
         'course_id' is the course_id to return enrollments
         """
 
-        enrollment_number = super(CourseEnrollmentManager, self).get_queryset().filter(
-            course_id=course_id,
-            is_active=1
-        ).count()
-
-        return enrollment_number
+        return sum(CourseEnrollmentCount.get_counts(course_id).itervalues())
 
     def num_enrolled_in_exclude_admins(self, course_id):
         """
@@ -928,10 +939,14 @@ class CourseEnrollmentManager(models.Manager):
         admins = CourseInstructorRole(course_locator).users_with_role()
         coaches = CourseCcxCoachRole(course_locator).users_with_role()
 
-        return super(CourseEnrollmentManager, self).get_queryset().filter(
+        admin_ids = list((staff | admins | coaches).values_list('id', flat=True))
+        enrolled_admins = super(CourseEnrollmentManager, self).get_queryset().filter(
             course_id=course_id,
             is_active=1,
-        ).exclude(user__in=staff).exclude(user__in=admins).exclude(user__in=coaches).count()
+            user_id__in=admin_ids,
+        ).count() if admin_ids else 0
+
+        return self.num_enrolled_in(course_id) - enrolled_admins
 
     def is_course_full(self, course):
         """
@@ -951,21 +966,46 @@ class CourseEnrollmentManager(models.Manager):
             courseenrollment__is_active=True
         )
 
+    def enrollment_projections(self, course_id, include_inactive=False, chunk_size=None):
+        """
+        Yields an EnrollmentProjection for every active enrollment in the
+        course, in the order of the enrollments' ids.
+
+        Unlike `users_enrolled_in`, no User objects are built: the
+        enrollments are fetched `chunk_size` at a time (PROJECTION_CHUNK_SIZE
+        by default) as tuples, with one query per chunk joining the users
+        and their profiles. Each chunk starts after the id of the last
+        enrollment of the previous one, so later chunks are as fast as
+        the first and the whole course is never held in memory.
+
+        'course_id' is the course_id to return enrollments
+        'include_inactive' also yields the inactive enrollments if True
+        """
+        chunk_size = chunk_size or self.PROJECTION_CHUNK_SIZE
+        enrollments = super(CourseEnrollmentManager, self).get_queryset().filter(course_id=course_id)
+        if not include_inactive:
+            enrollments = enrollments.filter(is_active=True)
+        enrollments = use_read_replica_if_available(enrollments).order_by('id').values_list(
+            'id', 'user_id', 'user__username', 'user__email', 'user__profile__name', 'mode', 'is_active', 'created'
+        )
+
+        last_id = 0
+        while True:
+            rows = list(enrollments.filter(id__gt=last_id)[:chunk_size])
+            for row in rows:
+                yield EnrollmentProjection(*row[1:])
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1][0]
+
     def enrollment_counts(self, course_id):
         """
         Returns a dictionary that stores the total enrollment count for a course, as well as the
         enrollment count for each individual mode.
         """
-        # Unfortunately, Django's "group by"-style queries look super-awkward
-        query = use_read_replica_if_available(
-            super(CourseEnrollmentManager, self).get_queryset().filter(course_id=course_id, is_active=True).values(
-                'mode').order_by().annotate(Count('mode')))
-        total = 0
         enroll_dict = defaultdict(int)
-        for item in query:
-            enroll_dict[item['mode']] = item['mode__count']
-            total += item['mode__count']
-        enroll_dict['total'] = total
+        enroll_dict.update(CourseEnrollmentCount.get_counts(course_id))
+        enroll_dict['total'] = sum(enroll_dict.itervalues())
         return enroll_dict
 
     def enrolled_and_dropped_out_users(self, course_id):
@@ -1015,6 +1055,9 @@ class CourseEnrollment(models.Model):
     # cache key format e.g enrollment.<username>.<course_key>.mode = 'honor'
     COURSE_ENROLLMENT_CACHE_KEY = u"enrollment.{}.{}.mode"
 
+    # How many enrollments bulk_enroll and bulk_unenroll save at once.
+    BULK_BATCH_SIZE = 500
+
     class Meta(object):
         unique_together = (('user', 'course_id'),)
         ordering = ('user', 'course_id')
@@ -1026,11 +1069,70 @@ class CourseEnrollment(models.Model):
         # When the property .course_overview is accessed for the first time, this variable will be set.
         self._course_overview = None
 
+        # The mode the saved enrollment is counted in by CourseEnrollmentCount, None if it isn't active.
+        # If the query which loaded the enrollment deferred its mode or is_active fields, it is only
+        # loaded when needed, see _get_saved_counted_mode.
+        self._counted_mode = None
+        self._counted_mode_deferred = False
+        if self.pk is not None:
+            if {'mode', 'is_active'} & self.get_deferred_fields():
+                self._counted_mode_deferred = True
+            else:
+                self._counted_mode = self._get_counted_mode()
+
     def __unicode__(self):
         return (
             "[CourseEnrollment] {}: {} ({}); active: ({})"
         ).format(self.user, self.course_id, self.created, self.is_active)
 
+    def save(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        """
+        Saves the enrollment, and updates the CourseEnrollmentCount of its
+        course in the same transaction if it was activated, deactivated or
+        changed mode.
+        """
+        saved_counted_mode = self._get_saved_counted_mode()
+        counted_mode = self._get_counted_mode()
+        with transaction.atomic(savepoint=False):
+            super(CourseEnrollment, self).save(*args, **kwargs)
+            if counted_mode != saved_counted_mode:
+                CourseEnrollmentCount.add(self.course_id, self._count_deltas(saved_counted_mode, counted_mode))
+        self._counted_mode = counted_mode
+
+    def _get_counted_mode(self):
+        """
+        Returns the mode the enrollment should be counted in by
+        CourseEnrollmentCount, or None if it isn't active.
+        """
+        return self.mode if self.is_active else None
+
+    def _get_saved_counted_mode(self):
+        """
+        Returns the mode the saved enrollment is counted in by
+        CourseEnrollmentCount, or None if it isn't active or saved. It is
+        read from the database if the query which loaded the enrollment
+        deferred its mode or is_active fields.
+        """
+        if self._counted_mode_deferred:
+            saved = CourseEnrollment.objects.filter(pk=self.pk).values_list('mode', 'is_active').first()
+            self._counted_mode = saved[0] if saved is not None and saved[1] else None
+            self._counted_mode_deferred = False
+        return self._counted_mode
+
+    @staticmethod
+    def _count_deltas(old_counted_mode, new_counted_mode):
+        """
+        Returns the changes to the CourseEnrollmentCount of the course of an
+        enrollment which moved from being counted in `old_counted_mode` to
+        `new_counted_mode`, either of which may be None.
+        """
+        deltas = Counter()
+        if old_counted_mode is not None:
+            deltas[old_counted_mode] -= 1
+        if new_counted_mode is not None:
+            deltas[new_counted_mode] += 1
+        return deltas
+
     @classmethod
     @transaction.atomic
     def get_or_create_enrollment(cls, user, course_key):
@@ -1387,6 +1489,224 @@ class CourseEnrollment(models.Model):
                 course_id
             )
 
+    @classmethod
+    def bulk_enroll(cls, users, course_key, mode=None):
+        """
+        Enroll several users in a course, saving their enrollments
+        BULK_BATCH_SIZE at a time.
+
+        Like `enroll` without `check_access`, the course isn't checked.
+        The post_save signal isn't sent for the enrollments; receivers
+        should listen to ENROLLMENTS_BULK_SAVED too.
+
+        `users` is a list of saved Django User objects.
+
+        `course_key` is our usual course_id string (e.g. "edX/Test101/2013_Fall)
+
+        `mode` is a string specifying what kind of enrollment this is, as
+               for `enroll`. The default is the default course mode.
+
+        Returns a dict mapping the ids of the users to pairs of the
+        CourseEnrollmentState of their enrollment before the call, and
+        their CourseEnrollment.
+        """
+        if mode is None:
+            mode = _default_course_mode(unicode(course_key))
+
+        results = {}
+        for index in xrange(0, len(users), cls.BULK_BATCH_SIZE):
+            batch = users[index:index + cls.BULK_BATCH_SIZE]
+            results.update(cls._bulk_update_enrollments(batch, course_key, is_active=True, mode=mode))
+            if badges_enabled():
+                from lms.djangoapps.badges.events.course_meta import award_enrollment_badge
+                for user in batch:
+                    award_enrollment_badge(user)
+        return results
+
+    @classmethod
+    def bulk_unenroll(cls, users, course_key, skip_refund=False):
+        """
+        Remove several users from a course, saving their enrollments
+        BULK_BATCH_SIZE at a time.
+
+        The post_save signal isn't sent for the enrollments; receivers
+        should listen to ENROLLMENTS_BULK_SAVED too.
+
+        `users` is a list of saved Django User objects.
+
+        `course_key` is our usual course_id string (e.g. "edX/Test101/2013_Fall)
+
+        `skip_refund` can be set to True to avoid the refund process.
+
+        Returns a dict mapping the ids of the users to pairs of the
+        CourseEnrollmentState of their enrollment before the call, and
+        their CourseEnrollment, which is None if they never enrolled.
+        """
+        results = {}
+        for index in xrange(0, len(users), cls.BULK_BATCH_SIZE):
+            batch = users[index:index + cls.BULK_BATCH_SIZE]
+            results.update(cls._bulk_update_enrollments(batch, course_key, is_active=False, skip_refund=skip_refund))
+        return results
+
+    @classmethod
+    def _bulk_update_enrollments(cls, users, course_key, is_active, mode=None, skip_refund=False):
+        """
+        Saves the enrollments of a batch of users, then updates the caches,
+        sends the signals and emits the events for the enrollments which
+        changed, as `update_enrollment` does for a single one.
+
+        Falls back to updating the enrollments one at a time if one of them
+        is created concurrently.
+        """
+        try:
+            with transaction.atomic():
+                results, changes = cls._save_enrollments(users, course_key, is_active, mode)
+        except IntegrityError:
+            log.warning(
+                u"Enrollments in course %s were created during a bulk update, updating them one at a time.",
+                course_key,
+            )
+            return cls._update_enrollments_one_by_one(users, course_key, is_active, mode, skip_refund)
+
+        if not changes:
+            return results
+
+        cache.delete_many([cls.cache_key_name(enrollment.user_id, course_key) for enrollment, __ in changes])
+        for enrollment, __ in changes:
+            cls._update_enrollment_in_request_cache(
+                enrollment.user,
+                course_key,
+                CourseEnrollmentState(enrollment.mode, enrollment.is_active),
+            )
+
+        ENROLLMENTS_BULK_SAVED.send(
+            sender=cls,
+            course_id=course_key,
+            enrollments=[enrollment for enrollment, __ in changes],
+            old_modes={enrollment.id: before.mode for enrollment, before in changes},
+        )
+
+        activations = Counter()
+        deactivations = Counter()
+        for enrollment, before in changes:
+            # Enrollments created by the batch have no previous state (before.mode and before.is_active
+            # are None), so they are compared as if they were inactive enrollments in the default mode.
+            if enrollment.is_active != bool(before.is_active):
+                if enrollment.is_active:
+                    enrollment.emit_event(EVENT_NAME_ENROLLMENT_ACTIVATED)
+                    activations[enrollment.mode] += 1
+                else:
+                    UNENROLL_DONE.send(sender=None, course_enrollment=enrollment, skip_refund=skip_refund)
+                    enrollment.emit_event(EVENT_NAME_ENROLLMENT_DEACTIVATED)
+                    enrollment.send_signal(EnrollStatusChange.unenroll)
+                    deactivations[enrollment.mode] += 1
+            if enrollment.mode != (before.mode or CourseMode.DEFAULT_MODE_SLUG):
+                enrollment.emit_event(EVENT_NAME_ENROLLMENT_MODE_CHANGED)
+
+        for metric, counts in (("common.student.enrollment", activations),
+                               ("common.student.unenrollment", deactivations)):
+            for enrollment_mode, count in counts.iteritems():
+                dog_stats_api.increment(
+                    metric,
+                    value=count,
+                    tags=[u"org:{}".format(course_key.org),
+                          u"offering:{}".format(course_key.offering),
+                          u"mode:{}".format(enrollment_mode)]
+                )
+        return results
+
+    @classmethod
+    def _save_enrollments(cls, users, course_key, is_active, mode):
+        """
+        Creates or updates the enrollments of a batch of users with a few
+        queries, along with their history records.
+
+        Returns the results for `bulk_enroll` and `bulk_unenroll`, and the
+        list of pairs of the enrollments which changed and the
+        CourseEnrollmentState they had before.
+        """
+        users_by_id = {user.id: user for user in users}
+        existing_enrollments = {
+            enrollment.user_id: enrollment
+            for enrollment in cls.objects.filter(course_id=course_key, user_id__in=users_by_id)
+        }
+
+        results = {}
+        changes = []
+        new_enrollments = []
+        for user_id, user in users_by_id.iteritems():
+            enrollment = existing_enrollments.get(user_id)
+            if enrollment is None:
+                results[user_id] = (CourseEnrollmentState(None, None), None)
+                if is_active:
+                    new_enrollments.append(cls(user=user, course_id=course_key, mode=mode, is_active=True))
+                continue
+
+            enrollment.user = user
+            before = CourseEnrollmentState(enrollment.mode, enrollment.is_active)
+            results[user_id] = (before, enrollment)
+            if enrollment.is_active != is_active or (mode is not None and enrollment.mode != mode):
+                enrollment.is_active = is_active
+                enrollment.mode = mode or enrollment.mode
+                changes.append((enrollment, before))
+
+        if changes:
+            updated_fields = {'is_active': is_active}
+            if mode is not None:
+                updated_fields['mode'] = mode
+            cls.objects.filter(id__in=[enrollment.id for enrollment, __ in changes]).update(**updated_fields)
+
+        if new_enrollments:
+            cls.objects.bulk_create(new_enrollments)
+            # The ids of the new rows aren't set by bulk_create on every database.
+            for enrollment in cls.objects.filter(
+                    course_id=course_key, user_id__in=[enrollment.user_id for enrollment in new_enrollments]
+            ):
+                enrollment.user = users_by_id[enrollment.user_id]
+                results[enrollment.user_id] = (results[enrollment.user_id][0], enrollment)
+                changes.append((enrollment, CourseEnrollmentState(None, None)))
+
+        deltas = Counter()
+        for enrollment, before in changes:
+            counted_mode = enrollment._get_counted_mode()  # pylint: disable=protected-access
+            deltas.update(cls._count_deltas(before.mode if before.is_active else None, counted_mode))
+            enrollment._counted_mode = counted_mode  # pylint: disable=protected-access
+            enrollment._counted_mode_deferred = False  # pylint: disable=protected-access
+        CourseEnrollmentCount.add(course_key, deltas)
+
+        history_model = cls.history.model
+        history_date = timezone.now()
+        history_model.objects.bulk_create([
+            history_model(
+                history_date=history_date,
+                history_type='~' if before.mode is not None else '+',
+                **{field.attname: getattr(enrollment, field.attname) for field in cls._meta.fields}
+            )
+            for enrollment, before in changes
+        ])
+        return results, changes
+
+    @classmethod
+    def _update_enrollments_one_by_one(cls, users, course_key, is_active, mode, skip_refund):
+        """
+        Enrolls or unenrolls each of the users in turn, returning the same
+        results as `_bulk_update_enrollments`.
+        """
+        results = {}
+        for user in users:
+            enrollment = cls.get_enrollment(user, course_key)
+            if enrollment is None:
+                before = CourseEnrollmentState(None, None)
+            else:
+                before = CourseEnrollmentState(enrollment.mode, enrollment.is_active)
+
+            if is_active:
+                enrollment = cls.enroll(user, course_key, mode)
+            elif enrollment is not None:
+                enrollment.update_enrollment(is_active=False, skip_refund=skip_refund)
+            results[user.id] = (before, enrollment)
+        return results
+
     @classmethod
     def is_enrolled(cls, user, course_key):
         """
@@ -1448,15 +1768,52 @@ class CourseEnrollment(models.Model):
         enrollment_state = cls._get_enrollment_state(user, course_id)
         return enrollment_state.mode, enrollment_state.is_active
 
+    @classmethod
+    def enrollment_modes_for_users(cls, user_ids, course_id):
+        """
+        Returns the enrollment modes of the given users for the given course,
+        fetched with a single query.
+
+        `user_ids` is an iterable of User ids
+        `course_id` is our usual course_id string (e.g. "edX/Test101/2013_Fall)
+
+        Returns a dict mapping user id to (mode, is_active).  Users without a
+        courseenrollment record are not included.
+        """
+        enrollments = cls.objects.filter(
+            user_id__in=user_ids,
+            course_id=course_id,
+        ).values_list('user_id', 'mode', 'is_active')
+        return {user_id: (mode, is_active) for user_id, mode, is_active in enrollments}
+
     @classmethod
     def enrollments_for_user(cls, user):
         return cls.objects.filter(user=user, is_active=1)
 
-    def is_paid_course(self):
+    @classmethod
+    def enrollments_for_user_with_overviews_preload(cls, user):  # pylint: disable=invalid-name
+        """
+        Returns the list of the user's active CourseEnrollments, with the
+        CourseOverviews of their courses loaded together by
+        `CourseOverview.get_many`.
+        """
+        enrollments = list(cls.enrollments_for_user(user))
+        course_overviews = CourseOverview.get_many(enrollment.course_id for enrollment in enrollments)
+        for enrollment in enrollments:
+            # Enrollments in courses that could not be loaded still fall back
+            # to CourseEnrollment.course_overview.
+            enrollment._course_overview = course_overviews.get(enrollment.course_id)  # pylint: disable=protected-access
+        return enrollments
+
+    def is_paid_course(self, modes_dict=None):
         """
         Returns True, if course is paid
+
+        Keyword Arguments:
+            modes_dict (dict): If provided, the course modes of the course,
+                as returned by `CourseMode.modes_for_course_dict`.
         """
-        paid_course = CourseMode.is_white_label(self.course_id)
+        paid_course = CourseMode.is_white_label(self.course_id, modes_dict=modes_dict)
         if paid_course or CourseMode.is_professional_slug(self.mode):
             return True
 
@@ -1476,10 +1833,20 @@ class CourseEnrollment(models.Model):
         """Changes this `CourseEnrollment` record's mode to `mode`.  Saves immediately."""
         self.update_enrollment(mode=mode)
 
-    def refundable(self):
+    def refundable(self, user_already_has_certs_for=None, order_numbers=None, modes=None):
         """
         For paid/verified certificates, students may receive a refund if they have
         a verified certificate and the deadline for refunds has not yet passed.
+
+        The keyword arguments let callers checking many enrollments at once
+        (e.g. the dashboard) load the data they stand for in bulk.
+
+        Keyword Arguments:
+            user_already_has_certs_for (set of CourseKey): If provided, the
+                courses the user has been given a certificate in.
+            order_numbers (dict): If provided, maps enrollment ids to order
+                numbers, as returned by `CourseEnrollmentAttribute.get_order_numbers`.
+            modes (list of `Mode`): If provided, the non-expired modes of the course.
         """
         # In order to support manual refunds past the deadline, set can_refund on this object.
         # On unenrolling, the "UNENROLL_DONE" signal calls CertificateItem.refund_cert_callback(),
@@ -1490,37 +1857,51 @@ class CourseEnrollment(models.Model):
             return True
 
         # If the student has already been given a certificate they should not be refunded
-        if GeneratedCertificate.certificate_for_student(self.user, self.course_id) is not None:
+        if user_already_has_certs_for is not None:
+            if self.course_id in user_already_has_certs_for:
+                return False
+        elif GeneratedCertificate.certificate_for_student(self.user, self.course_id) is not None:
             return False
 
         # If it is after the refundable cutoff date they should not be refunded.
-        refund_cutoff_date = self.refund_cutoff_date()
+        refund_cutoff_date = self.refund_cutoff_date(order_numbers=order_numbers)
         if refund_cutoff_date and datetime.now(UTC) > refund_cutoff_date:
             return False
 
-        course_mode = CourseMode.mode_for_course(self.course_id, 'verified')
+        course_mode = CourseMode.mode_for_course(self.course_id, 'verified', modes=modes)
         if course_mode is None:
             return False
         else:
             return True
 
-    def refund_cutoff_date(self):
-        """ Calculate and return the refund window end date. """
-        try:
-            attribute = self.attributes.get(namespace='order', name='order_number')
-        except ObjectDoesNotExist:
-            return None
-        except MultipleObjectsReturned:
-            # If there are multiple attributes then return the last one.
-            enrollment_id = self.get_enrollment(self.user, self.course_id).id
-            log.warning(
-                u"Multiple CourseEnrollmentAttributes found for user %s with enrollment-ID %s",
-                self.user.id,
-                enrollment_id
-            )
-            attribute = self.attributes.filter(namespace='order', name='order_number').last()
+    def refund_cutoff_date(self, order_numbers=None):
+        """
+        Calculate and return the refund window end date.
+
+        Keyword Arguments:
+            order_numbers (dict): If provided, maps enrollment ids to order
+                numbers, as returned by `CourseEnrollmentAttribute.get_order_numbers`.
+        """
+        if order_numbers is not None:
+            order_number = order_numbers.get(self.id)
+            if order_number is None:
+                return None
+        else:
+            try:
+                attribute = self.attributes.get(namespace='order', name='order_number')
+            except ObjectDoesNotExist:
+                return None
+            except MultipleObjectsReturned:
+                # If there are multiple attributes then return the last one.
+                enrollment_id = self.get_enrollment(self.user, self.course_id).id
+                log.warning(
+                    u"Multiple CourseEnrollmentAttributes found for user %s with enrollment-ID %s",
+                    self.user.id,
+                    enrollment_id
+                )
+                attribute = self.attributes.filter(namespace='order', name='order_number').last()
+            order_number = attribute.value
 
-        order_number = attribute.value
         order = ecommerce_api_client(self.user).orders(order_number).get()
         refund_window_start_date = max(
             datetime.strptime(order['date_placed'], ECOMMERCE_DATE_FORMAT),
@@ -1651,6 +2032,140 @@ def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: dis
     cache.delete(cache_key)
 
 
+@receiver(models.signals.pre_delete, sender=CourseEnrollment)
+def update_enrollment_counts_on_delete(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Stop counting an enrollment being deleted in the CourseEnrollmentCount of
+    its course. Runs in the transaction of the deletion, before the row is
+    gone, so that its counted mode can still be read if it was deferred.
+    """
+    # pylint: disable=protected-access
+    counted_mode = instance._get_saved_counted_mode()
+    if counted_mode is not None:
+        CourseEnrollmentCount.add(instance.course_id, CourseEnrollment._count_deltas(counted_mode, None))
+
+
+class CourseEnrollmentCount(models.Model):
+    """
+    The number of active enrollments in each mode of a course, so they can
+    be read without COUNT queries over the enrollments.
+
+    The counts are updated in the transactions which save or delete the
+    enrollments. Enrollments changed without going through the
+    CourseEnrollment model, e.g. with QuerySet.update(), make the counts
+    drift until `reconcile` is run, which the
+    `student.reconcile_enrollment_counts` task does periodically.
+    """
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    mode = models.CharField(max_length=100)
+    count = models.IntegerField(default=0)
+
+    class Meta(object):
+        unique_together = (('course_id', 'mode'),)
+
+    def __unicode__(self):
+        return u"[CourseEnrollmentCount] {}: {} ({})".format(self.course_id, self.count, self.mode)
+
+    @classmethod
+    def get_counts(cls, course_id):
+        """
+        Returns a dict mapping the modes of the course which have active
+        enrollments to their number.
+        """
+        return dict(cls.objects.filter(course_id=course_id, count__gt=0).values_list('mode', 'count'))
+
+    @classmethod
+    def add(cls, course_id, deltas):
+        """
+        Adds numbers, which may be negative, to the counts of a course.
+
+        `deltas` is a dict mapping modes to the numbers to add to their
+        counts. It should be called in the transaction which saves the
+        enrollments, so that the counts are committed along with them.
+        """
+        for mode, delta in deltas.iteritems():
+            if not delta:
+                continue
+            if cls.objects.filter(course_id=course_id, mode=mode).update(count=F('count') + delta):
+                continue
+            try:
+                with transaction.atomic():
+                    cls.objects.create(course_id=course_id, mode=mode, count=delta)
+            except IntegrityError:
+                # The count was created by another transaction in the meantime.
+                cls.objects.filter(course_id=course_id, mode=mode).update(count=F('count') + delta)
+
+    @classmethod
+    def reconcile(cls, course_id):
+        """
+        Recounts the active enrollments of the course, and corrects the
+        counts which drifted from them.
+
+        The counts of the course are locked while they are recounted, so
+        enrollments saved concurrently are counted exactly once.
+
+        Returns a dict mapping the modes whose count was corrected to pairs
+        of their stored and actual counts.
+        """
+        try:
+            return cls._reconcile(course_id)
+        except IntegrityError:
+            # A missing count was created by an enrollment saved in the meantime. That enrollment
+            # isn't visible in the snapshot the recount was read from, so recount in a new transaction,
+            # in which the count is locked along with the others.
+            return cls._reconcile(course_id)
+
+    @classmethod
+    def _reconcile(cls, course_id):
+        """
+        Reconciles the counts of the course in a single transaction, see
+        reconcile. Raises IntegrityError if one of the counts it creates was
+        created concurrently.
+        """
+        with transaction.atomic():
+            stored_counts = {
+                count.mode: count for count in cls.objects.select_for_update().filter(course_id=course_id)
+            }
+            actual_counts = dict(
+                CourseEnrollment.objects.filter(
+                    course_id=course_id, is_active=True
+                ).values_list('mode').order_by().annotate(Count('id'))
+            )
+
+            corrections = {}
+            for mode in set(stored_counts) | set(actual_counts):
+                actual_count = actual_counts.get(mode, 0)
+                stored_count = stored_counts.get(mode)
+                if stored_count is None:
+                    cls.objects.create(course_id=course_id, mode=mode, count=actual_count)
+                    corrections[mode] = (None, actual_count)
+                elif stored_count.count != actual_count:
+                    corrections[mode] = (stored_count.count, actual_count)
+                    stored_count.count = actual_count
+                    stored_count.save()
+        return corrections
+
+    @classmethod
+    def reconcile_all(cls):
+        """
+        Reconciles the counts of every course which has enrollments or
+        counts, logging the corrections.
+
+        Returns the number of courses whose counts were corrected.
+        """
+        # values_list returns the course ids as strings, since CourseKeyField.to_python isn't applied to them.
+        course_ids = set(CourseEnrollment.objects.values_list('course_id', flat=True).distinct())
+        course_ids.update(cls.objects.values_list('course_id', flat=True).distinct())
+
+        num_corrected = 0
+        for course_id in set(CourseKey.from_string(unicode(course_id)) for course_id in course_ids):
+            corrections = cls.reconcile(course_id)
+            if corrections:
+                num_corrected += 1
+                log.warning(u"Corrected the enrollment counts of course %s: %s", course_id, corrections)
+        return num_corrected
+
+
 class ManualEnrollmentAudit(models.Model):
     """
     Table for tracking which enrollments were performed through manual enrollment.
@@ -1675,6 +2190,23 @@ class ManualEnrollmentAudit(models.Model):
             enrollment=enrollment
         )
 
+    @classmethod
+    def bulk_create_manual_enrollment_audits(cls, user, reason, transitions):
+        """
+        saves the manual enrollment information of several students at once,
+        given a list of (email, state_transition, enrollment) tuples
+        """
+        return cls.objects.bulk_create([
+            cls(
+                enrolled_by=user,
+                enrolled_email=email,
+                state_transition=state_transition,
+                reason=reason,
+                enrollment=enrollment
+            )
+            for email, state_transition, enrollment in transitions
+        ])
+
     @classmethod
     def get_manual_enrollment_by_email(cls, email):
         """
@@ -2221,6 +2753,24 @@ class CourseEnrollmentAttribute(models.Model):
             for attribute in cls.objects.filter(enrollment=enrollment)
         ]
 
+    @classmethod
+    def get_order_numbers(cls, enrollments):
+        """Retrieve the ecommerce order numbers of several enrollments with a single query.
+
+        Args:
+            enrollments(list): 'CourseEnrollment's for which to retrieve the order numbers
+
+        Returns: dict mapping enrollment ids to order numbers. Enrollments
+            without an order number are not included. If an enrollment has
+            several order numbers, the last one is returned.
+        """
+        attributes = cls.objects.filter(
+            enrollment__in=[enrollment.id for enrollment in enrollments],
+            namespace='order',
+            name='order_number',
+        ).order_by('id').values_list('enrollment_id', 'value')
+        return dict(attributes)
+
 
 class EnrollmentRefundConfiguration(ConfigurationModel):
     """
@@ -0,0 +1,26 @@
+"""
+Periodic tasks of the student app.
+"""
+import logging
+
+from celery.task import task
+
+from student.models import CourseEnrollmentCount
+
+log = logging.getLogger(__name__)
+
+
+@task(name='student.reconcile_enrollment_counts')
+def reconcile_enrollment_counts():
+    """
+    Correct the enrollment counts of every course which drifted from the
+    enrollments, e.g. because enrollments were updated in bulk with SQL.
+
+    This task should be run on a daily basis.
+
+    Return value:
+        The number of courses whose counts were corrected.
+    """
+    num_corrected = CourseEnrollmentCount.reconcile_all()
+    log.info(u"Reconciled the enrollment counts, %d courses corrected.", num_corrected)
+    return num_corrected
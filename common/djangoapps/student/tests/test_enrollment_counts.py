@@ -0,0 +1,119 @@
+"""
+Tests of the enrollment counts maintained in CourseEnrollmentCount.
+"""
+from django.core.management import call_command
+from django.test import TestCase
+from mock import patch
+from opaque_keys.edx.locations import SlashSeparatedCourseKey
+
+from student.models import CourseEnrollment, CourseEnrollmentCount
+from student.roles import CourseStaffRole
+from student.tests.factories import UserFactory, CourseEnrollmentFactory
+
+
+class CourseEnrollmentCountTest(TestCase):
+    """
+    Tests that the enrollment counts follow the enrollments.
+    """
+    def setUp(self):
+        super(CourseEnrollmentCountTest, self).setUp()
+        self.course_id = SlashSeparatedCourseKey("edX", "Test101", "2013")
+        self.users = [UserFactory.create() for __ in range(3)]
+
+    def assert_counts(self, expected_counts):
+        """
+        Asserts that the enrollment counts of the course are `expected_counts`,
+        and match the enrollments.
+        """
+        self.assertEqual(CourseEnrollmentCount.get_counts(self.course_id), expected_counts)
+        self.assertEqual(CourseEnrollmentCount.reconcile(self.course_id), {})
+
+    def test_enroll_and_unenroll(self):
+        self.assert_counts({})
+        for user in self.users:
+            CourseEnrollment.enroll(user, self.course_id, "audit")
+        self.assert_counts({"audit": 3})
+
+        CourseEnrollment.enroll(self.users[0], self.course_id, "verified")
+        self.assert_counts({"audit": 2, "verified": 1})
+
+        CourseEnrollment.unenroll(self.users[1], self.course_id)
+        self.assert_counts({"audit": 1, "verified": 1})
+
+        CourseEnrollment.objects.get(user=self.users[2]).delete()
+        self.assert_counts({"verified": 1})
+
+        # Saving an enrollment without changing it doesn't touch the counts
+        enrollment = CourseEnrollment.objects.get(user=self.users[0])
+        with patch.object(CourseEnrollmentCount, 'add') as mock_add:
+            enrollment.save()
+        self.assertFalse(mock_add.called)
+
+    def test_deferred_fields(self):
+        for user in self.users[:2]:
+            CourseEnrollment.enroll(user, self.course_id, "audit")
+
+        enrollment = CourseEnrollment.objects.only('id', 'user', 'course_id').get(user=self.users[0])
+        enrollment.save()
+        self.assert_counts({"audit": 2})
+
+        CourseEnrollment.objects.only('id', 'user', 'course_id').get(user=self.users[1]).delete()
+        self.assert_counts({"audit": 1})
+
+    def test_factory(self):
+        CourseEnrollmentFactory.create(user=self.users[0], course_id=self.course_id, mode="honor")
+        CourseEnrollmentFactory.create(user=self.users[1], course_id=self.course_id, mode="honor", is_active=False)
+        self.assert_counts({"honor": 1})
+
+    def test_bulk_enroll_and_unenroll(self):
+        CourseEnrollment.enroll(self.users[0], self.course_id, "audit")
+        CourseEnrollment.bulk_enroll(self.users, self.course_id, "honor")
+        self.assert_counts({"honor": 3})
+
+        CourseEnrollment.bulk_unenroll(self.users[1:], self.course_id)
+        self.assert_counts({"honor": 1})
+
+    def test_manager_counts(self):
+        for user in self.users:
+            CourseEnrollment.enroll(user, self.course_id, "audit")
+        CourseEnrollment.enroll(self.users[0], self.course_id, "verified")
+        CourseStaffRole(self.course_id).add_users(self.users[1])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(CourseEnrollment.objects.num_enrolled_in(self.course_id), 3)
+        self.assertEqual(CourseEnrollment.objects.num_enrolled_in_exclude_admins(self.course_id), 2)
+        counts = CourseEnrollment.objects.enrollment_counts(self.course_id)
+        self.assertEqual(counts, {"audit": 2, "verified": 1, "total": 3})
+        self.assertEqual(counts["honor"], 0)
+
+    def test_reconcile(self):
+        for user in self.users:
+            CourseEnrollment.enroll(user, self.course_id, "audit")
+        CourseEnrollment.objects.filter(user=self.users[0]).update(mode="verified")
+        CourseEnrollment.objects.filter(user=self.users[1]).update(is_active=False)
+        CourseEnrollmentCount.objects.create(
+            course_id=SlashSeparatedCourseKey("edX", "Test102", "2013"), mode="audit", count=2
+        )
+
+        self.assertEqual(
+            CourseEnrollmentCount.reconcile(self.course_id),
+            {"audit": (3, 1), "verified": (None, 1)}
+        )
+        self.assert_counts({"audit": 1, "verified": 1})
+
+        call_command('reconcile_enrollment_counts')
+        self.assertEqual(CourseEnrollmentCount.get_counts(SlashSeparatedCourseKey("edX", "Test102", "2013")), {})
+
+    def test_reconcile_count_created_concurrently(self):
+        CourseEnrollment.enroll(self.users[0], self.course_id, "audit")
+        CourseEnrollmentCount.objects.filter(course_id=self.course_id).update(count=5)
+        select_for_update = CourseEnrollmentCount.objects.select_for_update
+        querysets = [CourseEnrollmentCount.objects.none()]
+
+        # The count is missing when the counts of the course are locked, and created before reconcile creates it.
+        with patch.object(
+            CourseEnrollmentCount.objects, 'select_for_update',
+            side_effect=lambda: querysets.pop() if querysets else select_for_update()
+        ):
+            self.assertEqual(CourseEnrollmentCount.reconcile(self.course_id), {"audit": (5, 1)})
+        self.assert_counts({"audit": 1})
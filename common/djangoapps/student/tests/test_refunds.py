@@ -14,6 +14,7 @@ from django.test.client import Client
 from django.test.utils import override_settings
 from mock import patch
 
+from course_modes.models import CourseMode
 from student.models import CourseEnrollment, CourseEnrollmentAttribute
 from student.tests.factories import UserFactory, CourseModeFactory
 from xmodule.modulestore.tests.factories import CourseFactory
@@ -112,6 +113,22 @@ class RefundableTest(SharedModuleStoreTestCase):
         self.enrollment.can_refund = True
         self.assertTrue(self.enrollment.refundable())
 
+    def test_refundable_with_preloaded_data(self):
+        """ Assert that refundable makes no queries when given the data it needs."""
+        modes = CourseMode.modes_for_course(self.course.id)
+        order_numbers = CourseEnrollmentAttribute.get_order_numbers([self.enrollment])
+        self.assertEqual(order_numbers, {})
+
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                self.enrollment.refundable(user_already_has_certs_for=set(), order_numbers=order_numbers, modes=modes)
+            )
+            self.assertFalse(
+                self.enrollment.refundable(
+                    user_already_has_certs_for={self.course.id}, order_numbers=order_numbers, modes=modes
+                )
+            )
+
     def test_refundable_with_cutoff_date(self):
         """ Assert enrollment is refundable before cutoff and not refundable after."""
         self.assertTrue(self.enrollment.refundable())
@@ -773,6 +773,78 @@ class EnrollInCourseTest(EnrollmentEventTestMixin, CacheIsolationTestCase):
         CourseEnrollment.enroll(user, course_id, "audit")
         self.assert_enrollment_mode_change_event_was_emitted(user, course_id, "audit")
 
+    def test_bulk_enrollment(self):
+        users = [UserFactory.create() for __ in range(3)]
+        course_id = SlashSeparatedCourseKey("edX", "Test101", "2013")
+        CourseEnrollment.enroll(users[0], course_id, "audit")
+        CourseEnrollment.unenroll(users[1], course_id)
+        self.mock_tracker.reset_mock()
+
+        with patch.object(CourseEnrollment, 'BULK_BATCH_SIZE', 2):
+            results = CourseEnrollment.bulk_enroll(users, course_id, "honor")
+        for user in users:
+            self.assertEquals(CourseEnrollment.enrollment_mode_for_user(user, course_id), ("honor", True))
+            self.assertEquals(results[user.id][1].mode, "honor")
+        self.assertTrue(results[users[0].id][0].is_active)
+        self.assertIsNone(results[users[2].id][0].is_active)
+        # a mode change, then an activation and a mode change for each new enrollment
+        self.assertEquals(self.mock_tracker.emit.call_count, 5)  # pylint: disable=maybe-no-member
+        self.mock_tracker.reset_mock()
+
+        # Enrolling them again in the same mode should be harmless
+        CourseEnrollment.bulk_enroll(users, course_id, "honor")
+        self.assert_no_events_were_emitted()
+
+        results = CourseEnrollment.bulk_unenroll(users[:2] + [UserFactory.create()], course_id)
+        self.assertFalse(CourseEnrollment.is_enrolled(users[0], course_id))
+        self.assertFalse(CourseEnrollment.is_enrolled(users[1], course_id))
+        self.assertTrue(CourseEnrollment.is_enrolled(users[2], course_id))
+        self.assertEquals(self.mock_tracker.emit.call_count, 2)  # pylint: disable=maybe-no-member
+        self.assertEquals(len(results), 3)
+
+    def test_enrollment_modes_for_users(self):
+        users = [UserFactory.create() for __ in range(4)]
+        course_id = SlashSeparatedCourseKey("edX", "Test101", "2013")
+        CourseEnrollment.enroll(users[0], course_id, "honor")
+        CourseEnrollment.enroll(users[1], course_id, "verified")
+        CourseEnrollment.enroll(users[2], course_id, "audit")
+        CourseEnrollment.unenroll(users[2], course_id)
+        CourseEnrollment.enroll(users[3], SlashSeparatedCourseKey("edX", "Test102", "2013"))
+
+        with self.assertNumQueries(1):
+            modes = CourseEnrollment.enrollment_modes_for_users([user.id for user in users], course_id)
+        self.assertEquals(len(modes), 3)
+        for user in users:
+            self.assertEquals(
+                modes.get(user.id, (None, None)),
+                CourseEnrollment.enrollment_mode_for_user(user, course_id)
+            )
+
+    def test_enrollment_projections(self):
+        users = [UserFactory.create() for __ in range(5)]
+        course_id = SlashSeparatedCourseKey("edX", "Test101", "2013")
+        for user in users:
+            CourseEnrollment.enroll(user, course_id, "honor")
+        CourseEnrollment.unenroll(users[1], course_id)
+        CourseEnrollment.enroll(UserFactory.create(), SlashSeparatedCourseKey("edX", "Test102", "2013"))
+
+        # one query per chunk, and one more to find that the last full chunk was the last one
+        with self.assertNumQueries(3):
+            projections = list(CourseEnrollment.objects.enrollment_projections(course_id, chunk_size=2))
+        self.assertEquals(
+            [projection.user_id for projection in projections],
+            [users[0].id] + [user.id for user in users[2:]]
+        )
+        self.assertEquals(projections[0].username, users[0].username)
+        self.assertEquals(projections[0].email, users[0].email)
+        self.assertEquals(projections[0].name, users[0].profile.name)
+        self.assertEquals(projections[0].mode, "honor")
+        self.assertTrue(projections[0].is_active)
+
+        projections = list(CourseEnrollment.objects.enrollment_projections(course_id, include_inactive=True))
+        self.assertEquals([projection.user_id for projection in projections], [user.id for user in users])
+        self.assertFalse(projections[1].is_active)
+
 
 @unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
 class ChangeEnrollmentViewTest(ModuleStoreTestCase):
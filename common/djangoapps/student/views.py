@@ -59,7 +59,12 @@ from student.forms import AccountCreationForm, PasswordResetFormNoActive, get_re
 from lms.djangoapps.commerce.utils import EcommerceService  # pylint: disable=import-error
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification  # pylint: disable=import-error
 from bulk_email.models import Optout, BulkEmailFlag  # pylint: disable=import-error
-from certificates.models import CertificateStatuses, certificate_status_for_student
+from certificates.models import (  # pylint: disable=import-error
+    CertificateStatuses,
+    GeneratedCertificate,
+    certificate_status_for_certificate,
+    certificate_status_for_student,
+)
 from certificates.api import (  # pylint: disable=import-error
     get_certificate_url,
     has_html_certificates_enabled,
@@ -275,7 +280,7 @@ def get_course_enrollments(user, org_to_include, orgs_to_exclude):
         generator[CourseEnrollment]: a sequence of enrollments to be displayed
         on the user's dashboard.
     """
-    for enrollment in CourseEnrollment.enrollments_for_user(user):
+    for enrollment in CourseEnrollment.enrollments_for_user_with_overviews_preload(user):
 
         # If the course is missing or broken, log an error and skip it.
         course_overview = enrollment.course_overview
@@ -543,6 +548,132 @@ def is_course_blocked(request, redeemed_registration_codes, course_key):
     return blocked
 
 
+class DashboardEnrollmentData(object):
+    """
+    The per-enrollment data shown on the learner dashboard.
+
+    The certificates, enrollment order numbers, bulk email authorizations and
+    redeemed registration codes of all the enrollments are each loaded with a
+    single query, so the number of queries made to render the dashboard does
+    not grow with the number of courses the user is enrolled in.
+    """
+    def __init__(self, request, course_enrollments, course_modes_by_course):
+        """
+        Arguments:
+            request (HttpRequest): The dashboard request.
+            course_enrollments (list[CourseEnrollment]): The enrollments shown on the dashboard.
+            course_modes_by_course (dict): Maps course ids to dicts of the
+                unexpired course modes of the course, keyed by slug.
+        """
+        self.request = request
+        self.user = request.user
+        self.course_enrollments = course_enrollments
+        self.course_modes_by_course = course_modes_by_course
+
+        course_ids = [enrollment.course_id for enrollment in course_enrollments]
+        self.certificates = GeneratedCertificate.certificates_for_student(self.user, course_ids)
+        self.order_numbers = CourseEnrollmentAttribute.get_order_numbers(course_enrollments)
+        self.email_enabled_courses = BulkEmailFlag.feature_enabled_courses(course_ids)
+
+        self.redeemed_registration_codes = defaultdict(list)
+        redeemed_registration_codes = CourseRegistrationCode.objects.filter(
+            course_id__in=course_ids,
+            registrationcoderedemption__redeemed_by=self.user
+        ).select_related('invoice_item__invoice')
+        for registration_code in redeemed_registration_codes:
+            self.redeemed_registration_codes[registration_code.course_id].append(registration_code)
+
+    def _course_modes(self, course_id):
+        """
+        Returns the unexpired course modes of the course, keyed by slug.
+        """
+        return self.course_modes_by_course.get(course_id, {})
+
+    def _selectable_course_modes(self, course_id):
+        """
+        Returns the unexpired course modes of the course that are shown on the
+        track selection page, like `CourseMode.modes_for_course_dict` does.
+        """
+        return {
+            slug: mode for slug, mode in self._course_modes(course_id).iteritems()
+            if slug not in CourseMode.CREDIT_MODES
+        }
+
+    def show_courseware_links_for(self):
+        """
+        Returns the ids of the courses whose courseware the user can load.
+        """
+        return frozenset(
+            enrollment.course_id for enrollment in self.course_enrollments
+            if has_access(self.user, 'load', enrollment.course_overview)
+            and has_access(self.user, 'view_courseware_with_prerequisites', enrollment.course_overview)
+        )
+
+    def cert_statuses(self):
+        """
+        Returns a dict mapping course ids to the certificate info of the
+        course, as returned by `cert_info`.
+        """
+        cert_statuses = {}
+        for enrollment in self.course_enrollments:
+            course_overview = enrollment.course_overview
+            if not course_overview.may_certify():
+                cert_statuses[enrollment.course_id] = {}
+            else:
+                cert_statuses[enrollment.course_id] = _cert_info(
+                    self.user,
+                    course_overview,
+                    certificate_status_for_certificate(self.certificates.get(enrollment.course_id)),
+                    enrollment.mode
+                )
+        return cert_statuses
+
+    def show_email_settings_for(self):
+        """
+        Returns the ids of the courses for which bulk email is turned on.
+        """
+        return frozenset(
+            enrollment.course_id for enrollment in self.course_enrollments
+            if enrollment.course_id in self.email_enabled_courses
+        )
+
+    def show_refund_option_for(self):
+        """
+        Returns the ids of the courses the user can still be refunded for.
+        """
+        return frozenset(
+            enrollment.course_id for enrollment in self.course_enrollments
+            if enrollment.refundable(
+                user_already_has_certs_for=self.certificates,
+                order_numbers=self.order_numbers,
+                modes=self._course_modes(enrollment.course_id).values()
+            )
+        )
+
+    def block_courses(self):
+        """
+        Returns the ids of the courses the user redeemed a registration code
+        of an invalid invoice for.
+        """
+        return frozenset(
+            enrollment.course_id for enrollment in self.course_enrollments
+            if is_course_blocked(
+                self.request,
+                self.redeemed_registration_codes[enrollment.course_id],
+                enrollment.course_id
+            )
+        )
+
+    def enrolled_courses_either_paid(self):
+        """
+        Returns the ids of the paid courses the user is enrolled in.
+        """
+        return frozenset(
+            enrollment.course_id for enrollment in self.course_enrollments
+            if enrollment.is_paid_course(modes_dict=self._selectable_course_modes(enrollment.course_id))
+        )
+
+
 @login_required
 @ensure_csrf_cookie
 def dashboard(request):
@@ -604,11 +735,8 @@ def dashboard(request):
         staff_access = True
         errored_courses = modulestore().get_errored_courses()
 
-    show_courseware_links_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if has_access(request.user, 'load', enrollment.course_overview)
-        and has_access(request.user, 'view_courseware_with_prerequisites', enrollment.course_overview)
-    )
+    enrollment_data = DashboardEnrollmentData(request, course_enrollments, course_modes_by_course)
+    show_courseware_links_for = enrollment_data.show_courseware_links_for()
 
     # Find programs associated with courses being displayed. This information
     # is passed in the template context to allow rendering of program-related
@@ -642,17 +770,10 @@ def dashboard(request):
     # If a course is not included in this dictionary,
     # there is no verification messaging to display.
     verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
-    cert_statuses = {
-        enrollment.course_id: cert_info(request.user, enrollment.course_overview, enrollment.mode)
-        for enrollment in course_enrollments
-    }
+    cert_statuses = enrollment_data.cert_statuses()
 
     # only show email settings for Mongo course and when bulk email is turned on
-    show_email_settings_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments if (
-            BulkEmailFlag.feature_enabled(enrollment.course_id)
-        )
-    )
+    show_email_settings_for = enrollment_data.show_email_settings_for()
 
     # Verification Attempts
     # Used to generate the "you must reverify for course x" banner
@@ -662,27 +783,11 @@ def dashboard(request):
     statuses = ["approved", "denied", "pending", "must_reverify"]
     reverifications = reverification_info(statuses)
 
-    show_refund_option_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.refundable()
-    )
+    show_refund_option_for = enrollment_data.show_refund_option_for()
 
-    block_courses = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if is_course_blocked(
-            request,
-            CourseRegistrationCode.objects.filter(
-                course_id=enrollment.course_id,
-                registrationcoderedemption__redeemed_by=request.user
-            ),
-            enrollment.course_id
-        )
-    )
+    block_courses = enrollment_data.block_courses()
 
-    enrolled_courses_either_paid = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.is_paid_course()
-    )
+    enrolled_courses_either_paid = enrollment_data.enrolled_courses_either_paid()
 
     # If there are *any* denied reverifications that have not been toggled off,
     # we'll display the banner
@@ -25,6 +25,54 @@ from xmodule.exceptions import NotFoundError
 from PIL import Image
 
 
+def is_thumbnailable(content_type):
+    """
+    Returns whether a thumbnail can be generated for content of the given mime type.
+    """
+    return content_type is not None and content_type.split('/')[0] == 'image'
+
+
+def render_thumbnail(source, content_type, dimensions=None):
+    """
+    Render the thumbnail of an image.
+
+    `source` is a file object, or a path to a file, to read the image from and
+    `content_type` is its mime type. `dimensions` is an optional (width, height)
+    tuple in pixels which defaults to (128, 128).
+
+    Returns a tuple of (thumbnail data, thumbnail mime type). This only depends on
+    its arguments, so it can be run in a worker process.
+    """
+    if content_type == 'image/svg+xml':
+        # for svg simply store the provided svg file, since vector graphics should be good enough
+        # for downscaling client-side
+        if isinstance(source, basestring):
+            with open(source) as f:
+                return f.read(), content_type
+        return source.read(), content_type
+
+    # use PIL to do the thumbnail generation (http://www.pythonware.com/products/pil/)
+    # My understanding is that PIL will maintain aspect ratios while restricting
+    # the max-height/width to be whatever you pass in as 'size'
+    # @todo: move the thumbnail size to a configuration setting?!?
+
+    # We use the context manager here to avoid leaking the inner file descriptor
+    # of the Image object -- this way it gets closed after we're done with using it.
+    thumbnail_file = StringIO.StringIO()
+    with Image.open(source) as image:
+        # I've seen some exceptions from the PIL library when trying to save palletted
+        # PNG files to JPEG. Per the google-universe, they suggest converting to RGB first.
+        thumbnail_image = image.convert('RGB')
+
+        if not dimensions:
+            dimensions = (128, 128)
+
+        thumbnail_image.thumbnail(dimensions, Image.ANTIALIAS)
+        thumbnail_image.save(thumbnail_file, 'JPEG')
+
+    return thumbnail_file.getvalue(), 'image/jpeg'
+
+
 class StaticContent(object):
     def __init__(self, loc, name, content_type, data, last_modified_at=None, thumbnail_location=None, import_path=None,
                  length=None, locked=False, content_digest=None):
@@ -311,9 +359,9 @@ class StaticContentStream(StaticContent):
                                                   length=length, locked=locked, content_digest=content_digest)
         self._stream = stream
 
-    def stream_data(self):
+    def stream_data(self, chunk_size=STREAM_DATA_CHUNK_SIZE):
         while True:
-            chunk = self._stream.read(STREAM_DATA_CHUNK_SIZE)
+            chunk = self._stream.read(chunk_size)
             if len(chunk) == 0:
                 break
             yield chunk
@@ -383,6 +431,19 @@ class ContentStore(object):
         """
         raise NotImplementedError
 
+    def get_export_policy_for_course(self, course_key):
+        """
+        Returns the policy of the course's assets, as exported to policies/assets.json
+        """
+        raise NotImplementedError
+
+    def stream_all_for_course(self, course_key):
+        """
+        Yield a (path, StaticContentStream) tuple for each of the course's assets, where path is
+        the asset's location relative to the exported static directory
+        """
+        raise NotImplementedError
+
     def generate_thumbnail(self, content, tempfile_path=None, dimensions=None):
         """Create a thumbnail for a given image.
 
@@ -398,59 +459,19 @@ class ContentStore(object):
         pixels. It defaults to None.
         """
         thumbnail_content = None
-        is_svg = content.content_type == 'image/svg+xml'
-        # use a naming convention to associate originals with the thumbnail
-        thumbnail_name = StaticContent.generate_thumbnail_name(
-            content.location.name, dimensions=dimensions, extension='.svg' if is_svg else None
-        )
-        thumbnail_file_location = StaticContent.compute_location(
-            content.location.course_key, thumbnail_name, is_thumbnail=True
-        )
+        thumbnail_file_location = self.compute_thumbnail_location(content, dimensions=dimensions)
 
         # if we're uploading an image, then let's generate a thumbnail so that we can
         # serve it up when needed without having to rescale on the fly
         try:
-            if is_svg:
-                # for svg simply store the provided svg file, since vector graphics should be good enough
-                # for downscaling client-side
-                if tempfile_path is None:
-                    thumbnail_file = StringIO.StringIO(content.data)
-                else:
-                    with open(tempfile_path) as f:
-                        thumbnail_file = StringIO.StringIO(f.read())
-                thumbnail_content = StaticContent(thumbnail_file_location, thumbnail_name,
-                                                  'image/svg+xml', thumbnail_file)
-                self.save(thumbnail_content)
-            elif content.content_type is not None and content.content_type.split('/')[0] == 'image':
-                # use PIL to do the thumbnail generation (http://www.pythonware.com/products/pil/)
-                # My understanding is that PIL will maintain aspect ratios while restricting
-                # the max-height/width to be whatever you pass in as 'size'
-                # @todo: move the thumbnail size to a configuration setting?!?
-                if tempfile_path is None:
-                    source = StringIO.StringIO(content.data)
-                else:
-                    source = tempfile_path
-
-                # We use the context manager here to avoid leaking the inner file descriptor
-                # of the Image object -- this way it gets closed after we're done with using it.
-                thumbnail_file = StringIO.StringIO()
-                with Image.open(source) as image:
-                    # I've seen some exceptions from the PIL library when trying to save palletted
-                    # PNG files to JPEG. Per the google-universe, they suggest converting to RGB first.
-                    thumbnail_image = image.convert('RGB')
-
-                    if not dimensions:
-                        dimensions = (128, 128)
-
-                    thumbnail_image.thumbnail(dimensions, Image.ANTIALIAS)
-                    thumbnail_image.save(thumbnail_file, 'JPEG')
-                    thumbnail_file.seek(0)
-
-                # store this thumbnail as any other piece of content
-                thumbnail_content = StaticContent(thumbnail_file_location, thumbnail_name,
-                                                  'image/jpeg', thumbnail_file)
-
-                self.save(thumbnail_content)
+            if is_thumbnailable(content.content_type):
+                source = StringIO.StringIO(content.data) if tempfile_path is None else tempfile_path
+                thumbnail_data, thumbnail_content_type = render_thumbnail(
+                    source, content.content_type, dimensions=dimensions
+                )
+                thumbnail_content, thumbnail_file_location = self.save_thumbnail(
+                    content, thumbnail_data, thumbnail_content_type, dimensions=dimensions
+                )
 
         except Exception, exc:  # pylint: disable=broad-except
             # log and continue as thumbnails are generally considered as optional
@@ -460,6 +481,42 @@ class ContentStore(object):
 
         return thumbnail_content, thumbnail_file_location
 
+    @staticmethod
+    def _thumbnail_name(content, dimensions=None):
+        """
+        Returns the name of the thumbnail of `content` with the given `dimensions`.
+        """
+        # use a naming convention to associate originals with the thumbnail
+        return StaticContent.generate_thumbnail_name(
+            content.location.name,
+            dimensions=dimensions,
+            extension='.svg' if content.content_type == 'image/svg+xml' else None
+        )
+
+    @classmethod
+    def compute_thumbnail_location(cls, content, dimensions=None):
+        """
+        Returns the AssetKey of the thumbnail of `content` with the given `dimensions`.
+        """
+        return StaticContent.compute_location(
+            content.location.course_key, cls._thumbnail_name(content, dimensions=dimensions), is_thumbnail=True
+        )
+
+    def save_thumbnail(self, content, thumbnail_data, thumbnail_content_type, dimensions=None):
+        """
+        Store already rendered thumbnail data (see `render_thumbnail`) as the thumbnail of `content`.
+
+        Returns a tuple of (StaticContent, AssetKey)
+        """
+        thumbnail_file_location = self.compute_thumbnail_location(content, dimensions=dimensions)
+        # store this thumbnail as any other piece of content
+        thumbnail_content = StaticContent(
+            thumbnail_file_location, self._thumbnail_name(content, dimensions=dimensions),
+            thumbnail_content_type, StringIO.StringIO(thumbnail_data)
+        )
+        self.save(thumbnail_content)
+        return thumbnail_content, thumbnail_file_location
+
     def ensure_indexes(self):
         """
         Ensure that all appropriate indexes are created that are needed by this modulestore, or raise
@@ -181,7 +181,6 @@ class MongoContentStore(ContentStore):
             assets_policy_file: the filename for the policy file which should be in the same
                 directory as the other policy files.
         """
-        policy = {}
         assets, __ = self.get_all_content_for_course(course_key)
 
         for asset in assets:
@@ -194,12 +193,46 @@ class MongoContentStore(ContentStore):
             # When debugging course exports, this might be a good place
             # to look. -- pmitros
             self.export(asset['asset_key'], output_directory)
+
+        with open(assets_policy_file, 'w') as f:
+            json.dump(self._export_policy(assets), f, sort_keys=True, indent=4)
+
+    @staticmethod
+    def _export_policy(assets):
+        """
+        Returns the assets policy (the contents of policies/assets.json) for the given assets.
+        """
+        policy = {}
+        for asset in assets:
             for attr, value in asset.iteritems():
                 if attr not in ['_id', 'md5', 'uploadDate', 'length', 'chunkSize', 'asset_key']:
                     policy.setdefault(asset['asset_key'].name, {})[attr] = value
+        return policy
 
-        with open(assets_policy_file, 'w') as f:
-            json.dump(policy, f, sort_keys=True, indent=4)
+    def get_export_policy_for_course(self, course_key):
+        """
+        Returns the assets policy that export_all_for_course writes for this course.
+        """
+        assets, __ = self.get_all_content_for_course(course_key)
+        return self._export_policy(assets)
+
+    def stream_all_for_course(self, course_key):
+        """
+        Yields a (path, StaticContentStream) tuple for each of this course's assets, where `path`
+        is where export_all_for_course would write the asset, relative to its output directory.
+
+        Each stream is closed when the next asset is requested, so consume it before that.
+        """
+        assets, __ = self.get_all_content_for_course(course_key)
+        for asset in assets:
+            content = self.find(asset['asset_key'], as_stream=True)
+            export_name = escape_invalid_characters(name=content.name, invalid_char_list=['/', '\\'])
+            if content.import_path is not None:
+                export_name = os.path.join(os.path.dirname(content.import_path), export_name)
+            try:
+                yield export_name, content
+            finally:
+                content.close()
 
     def get_all_content_thumbnails_for_course(self, course_key):
         return self._get_all_content_for_course(course_key, get_thumbnails=True)[0]
@@ -3,6 +3,7 @@ This module provides an abstraction for working with XModuleDescriptors
 that are stored in a database an accessible using their Location as an identifier
 """
 
+import bisect
 import logging
 import re
 import json
@@ -554,6 +555,62 @@ class SortedAssetList(SortedListWithKey):
             self[asset_idx] = metadata_to_insert
 
 
+class SortedAssetIndex(object):
+    """
+    Index of a list of asset metadata documents which is sorted by filename, allowing
+    to find, insert and remove assets in the list itself with O(log n) comparisons,
+    instead of copying the list into a SortedAssetList and back for each change.
+    """
+    def __init__(self, assets):
+        """
+        Arguments:
+            assets (list): asset metadata documents, sorted by filename, which are updated in place.
+
+        Raises:
+            ValueError if the assets are not sorted by filename.
+        """
+        self.assets = assets
+        self.filenames = [asset['filename'] for asset in assets]
+        if any(filename > next_filename for filename, next_filename in zip(self.filenames, self.filenames[1:])):
+            raise ValueError("Assets are not sorted by filename.")
+
+    def indexes(self, assets):
+        """
+        Return whether this index is (still) the index of `assets`.
+        """
+        return self.assets is assets and len(self.filenames) == len(assets)
+
+    @contract(asset_id=AssetKey)
+    def find(self, asset_id):
+        """
+        Find the index of a particular asset in the list.
+        Returns: Index of asset, if found. None if not found.
+        """
+        idx = bisect.bisect_left(self.filenames, asset_id.path)
+        if idx < len(self.filenames) and self.filenames[idx] == asset_id.path:
+            return idx
+        return None
+
+    def insert_or_update(self, asset_md):
+        """
+        Insert asset metadata if asset is not present. Update asset metadata if asset is already present.
+        """
+        metadata_to_insert = asset_md.to_storable()
+        idx = bisect.bisect_left(self.filenames, metadata_to_insert['filename'])
+        if idx < len(self.filenames) and self.filenames[idx] == metadata_to_insert['filename']:
+            self.assets[idx] = metadata_to_insert
+        else:
+            self.filenames.insert(idx, metadata_to_insert['filename'])
+            self.assets.insert(idx, metadata_to_insert)
+
+    def pop(self, idx):
+        """
+        Remove and return the asset at the given index.
+        """
+        self.filenames.pop(idx)
+        return self.assets.pop(idx)
+
+
 class ModuleStoreAssetBase(object):
     """
     The methods for accessing assets and their metadata
@@ -744,6 +801,39 @@ class ModuleStoreAssetWriteInterface(ModuleStoreAssetBase):
         """
         raise NotImplementedError()
 
+    @contract(asset_attrs='list(tuple(AssetKey, dict))')
+    def set_asset_metadata_attrs_list(self, asset_attrs, user_id):
+        """
+        Add/set the given dicts of attrs on the assets at the given locations.
+
+        Modulestores which can apply all the changes at once should override this method.
+
+        Arguments:
+            asset_attrs (list(tuple(AssetKey, dict))): pairs of asset identifier and attribute/value pairs to set
+            user_id (int): user ID saving the asset metadata
+
+        Raises:
+            ItemNotFoundError if any of the items does not exist
+        """
+        for asset_key, attr_dict in asset_attrs:
+            self.set_asset_metadata_attrs(asset_key, attr_dict, user_id)
+
+    @contract(asset_keys='list(AssetKey)')
+    def delete_asset_metadata_list(self, asset_keys, user_id):
+        """
+        Deletes the metadata of the given assets.
+
+        Modulestores which can apply all the changes at once should override this method.
+
+        Arguments:
+            asset_keys (list(AssetKey)): keys containing original asset filenames
+            user_id (int): user ID deleting the asset metadata
+
+        Returns:
+            Number of asset metadata entries deleted
+        """
+        return sum(self.delete_asset_metadata(asset_key, user_id) for asset_key in asset_keys)
+
     @contract(asset_key='AssetKey', attr=str)
     def set_asset_metadata_attr(self, asset_key, attr, value, user_id):
         """
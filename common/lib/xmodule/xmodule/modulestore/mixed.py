@@ -573,6 +573,41 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
         store = self._get_modulestore_for_courselike(asset_key.course_key)
         return store.set_asset_metadata_attrs(asset_key, attr_dict, user_id)
 
+    @contract(asset_attrs='list(tuple(AssetKey, dict))', user_id='int|long')
+    def set_asset_metadata_attrs_list(self, asset_attrs, user_id):
+        """
+        Add/set the given dicts of attrs on the assets at the given locations, which must all
+        belong to the same course.
+
+        Arguments:
+            asset_attrs (list(tuple(AssetKey, dict))): pairs of asset identifier and attribute/value pairs to set
+            user_id: (int|long): user setting the attributes
+
+        Raises:
+            NotFoundError if any of the items does not exist
+        """
+        if len(asset_attrs) == 0:
+            return
+        store = self._get_modulestore_for_courselike(asset_attrs[0][0].course_key)
+        return store.set_asset_metadata_attrs_list(asset_attrs, user_id)
+
+    @contract(asset_keys='list(AssetKey)', user_id='int|long')
+    def delete_asset_metadata_list(self, asset_keys, user_id):
+        """
+        Deletes the metadata of the given assets, which must all belong to the same course.
+
+        Arguments:
+            asset_keys (list(AssetKey)): locators containing original asset filenames
+            user_id (int_long): user deleting the metadata
+
+        Returns:
+            Number of asset metadata entries deleted
+        """
+        if len(asset_keys) == 0:
+            return 0
+        store = self._get_modulestore_for_courselike(asset_keys[0].course_key)
+        return store.delete_asset_metadata_list(asset_keys, user_id)
+
     @strip_key
     def get_parent_location(self, location, **kwargs):
         """
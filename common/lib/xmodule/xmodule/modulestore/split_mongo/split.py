@@ -77,7 +77,7 @@ from xmodule.modulestore.exceptions import InsufficientSpecificationError, Versi
     DuplicateCourseError, MultipleCourseBlocksFound
 from xmodule.modulestore import (
     inheritance, ModuleStoreWriteBase, ModuleStoreEnum,
-    BulkOpsRecord, BulkOperationsMixin, SortedAssetList, BlockData
+    BulkOpsRecord, BulkOperationsMixin, SortedAssetIndex, BlockData
 )
 
 from ..exceptions import ItemNotFoundError
@@ -132,6 +132,8 @@ class SplitBulkWriteRecord(BulkOpsRecord):
         self.definitions = {}
         self.definitions_in_db = set()
         self.course_key = None
+        # dict((version_guid, asset_type), SortedAssetIndex)
+        self.asset_indexes = {}
 
     # TODO: This needs to track which branches have actually been modified/versioned,
     # so that copying one branch to another doesn't update the original branch.
@@ -2753,37 +2755,53 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         return course_assets
 
-    def _update_course_assets(self, user_id, asset_key, update_function):
+    def _get_asset_index(self, course_key, structure, asset_type):
+        """
+        Return a SortedAssetIndex of the assets of the given type in the (versioned) structure.
+
+        The index is kept in the active bulk operation, so that successive changes to the
+        assets of a course within it don't have to build it again.
+        """
+        assets = structure.setdefault('assets', {}).setdefault(asset_type, [])
+        bulk_write_record = self._get_bulk_ops_record(course_key)
+        if not bulk_write_record.active:
+            return SortedAssetIndex(assets)
+
+        index_key = (structure['_id'], asset_type)
+        asset_index = bulk_write_record.asset_indexes.get(index_key)
+        if asset_index is None or not asset_index.indexes(assets):
+            asset_index = bulk_write_record.asset_indexes[index_key] = SortedAssetIndex(assets)
+        return asset_index
+
+    def _update_course_assets(self, user_id, course_key, update_function):
         """
         A wrapper for functions wanting to manipulate assets. Gets and versions the structure,
-        passes the mutable array for either 'assets' or 'thumbnails' as well as the idx to the function for it to
-        update, then persists the changed data back into the course.
+        passes a function returning the SortedAssetIndex of the structure's assets of a given
+        asset type to the update function, then persists the changed data back into the course.
 
         The update function can raise an exception if it doesn't want to actually do the commit. The
-        surrounding method probably should catch that exception.
+        surrounding method probably should catch that exception. It must raise before it changes any asset.
         """
-        with self.bulk_operations(asset_key.course_key):
-            original_structure = self._lookup_course(asset_key.course_key).structure
-            index_entry = self._get_index_if_valid(asset_key.course_key)
-            new_structure = self.version_structure(asset_key.course_key, original_structure, user_id)
-            course_assets = new_structure.setdefault('assets', {})
+        self._update_course_assets_on_branch(user_id, course_key, update_function)
 
-            asset_type = asset_key.asset_type
-            all_assets = SortedAssetList(iterable=[])
-            # Assets should be pre-sorted, so add them efficiently without sorting.
-            # extend() will raise a ValueError if the passed-in list is not sorted.
-            all_assets.extend(course_assets.setdefault(asset_type, []))
-            asset_idx = all_assets.find(asset_key)
+    def _update_course_assets_on_branch(self, user_id, course_key, update_function):
+        """
+        Implementation of :meth:`_update_course_assets` for the branch of `course_key`, which
+        the draft modulestore doesn't override to update both branches.
+        """
+        with self.bulk_operations(course_key):
+            original_structure = self._lookup_course(course_key).structure
+            index_entry = self._get_index_if_valid(course_key)
+            new_structure = self.version_structure(course_key, original_structure, user_id)
 
-            all_assets_updated = update_function(all_assets, asset_idx)
-            new_structure['assets'][asset_type] = all_assets_updated.as_list()
+            update_function(lambda asset_type: self._get_asset_index(course_key, new_structure, asset_type))
 
             # update index if appropriate and structures
-            self.update_structure(asset_key.course_key, new_structure)
+            self.update_structure(course_key, new_structure)
 
             if index_entry is not None:
                 # update the index entry if appropriate
-                self._update_head(asset_key.course_key, index_entry, asset_key.branch, new_structure['_id'])
+                self._update_head(course_key, index_entry, course_key.branch, new_structure['_id'])
 
     def save_asset_metadata_list(self, asset_metadata_list, user_id, import_only=False):
         """
@@ -2793,28 +2811,24 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         """
         # Determine course key to use in bulk operation. Use the first asset assuming that
         # all assets will be for the same course.
-        asset_key = asset_metadata_list[0].asset_id
-        course_key = asset_key.course_key
+        course_key = asset_metadata_list[0].asset_id.course_key
 
-        with self.bulk_operations(course_key):
-            original_structure = self._lookup_course(course_key).structure
-            index_entry = self._get_index_if_valid(course_key)
-            new_structure = self.version_structure(course_key, original_structure, user_id)
-            course_assets = new_structure.setdefault('assets', {})
-
-            assets_by_type = self._save_assets_by_type(
-                course_key, asset_metadata_list, course_assets, user_id, import_only
-            )
-
-            for asset_type, assets in assets_by_type.iteritems():
-                new_structure['assets'][asset_type] = assets.as_list()
-
-            # update index if appropriate and structures
-            self.update_structure(course_key, new_structure)
+        def _internal_method(asset_index_for_type):
+            """
+            Insert or update each asset of the course
+            """
+            for asset_md in asset_metadata_list:
+                if asset_md.asset_id.course_key != course_key:
+                    # pylint: disable=logging-format-interpolation
+                    log.warning("Asset's course {} does not match other assets for course {} - not saved.".format(
+                        asset_md.asset_id.course_key, course_key
+                    ))
+                    continue
+                if not import_only:
+                    asset_md.update({'edited_by': user_id, 'edited_on': datetime.datetime.now(UTC)})
+                asset_index_for_type(asset_md.asset_id.asset_type).insert_or_update(asset_md)
 
-            if index_entry is not None:
-                # update the index entry if appropriate
-                self._update_head(course_key, index_entry, asset_key.branch, new_structure['_id'])
+        self._update_course_assets_on_branch(user_id, course_key, _internal_method)
 
     def save_asset_metadata(self, asset_metadata, user_id, import_only=False):
         """
@@ -2835,23 +2849,46 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             ItemNotFoundError if no such item exists
             AttributeError is attr is one of the build in attrs.
         """
-        def _internal_method(all_assets, asset_idx):
+        self.set_asset_metadata_attrs_list([(asset_key, attr_dict)], user_id)
+
+    @contract(asset_attrs='list(tuple(AssetKey, dict))')
+    def set_asset_metadata_attrs_list(self, asset_attrs, user_id):
+        """
+        Add/set the given dicts of attrs on the assets at the given locations, which must all belong
+        to the same course, in a single version of the course structure.
+
+        Arguments:
+            asset_attrs (list(tuple(AssetKey, dict))): pairs of asset identifier and attribute/value pairs to set
+
+        Raises:
+            ItemNotFoundError if any of the items does not exist, in which case none is updated
+            AttributeError is attr is one of the build in attrs.
+        """
+        if not asset_attrs:
+            return
+
+        def _internal_method(asset_index_for_type):
             """
-            Update the found item
+            Update the found items
             """
-            if asset_idx is None:
-                raise ItemNotFoundError(asset_key)
+            updates = []
+            for asset_key, attr_dict in asset_attrs:
+                asset_index = asset_index_for_type(asset_key.asset_type)
+                asset_idx = asset_index.find(asset_key)
+                if asset_idx is None:
+                    raise ItemNotFoundError(asset_key)
 
-            # Form an AssetMetadata.
-            mdata = AssetMetadata(asset_key, asset_key.path)
-            mdata.from_storable(all_assets[asset_idx])
-            mdata.update(attr_dict)
+                # Form an AssetMetadata.
+                mdata = AssetMetadata(asset_key, asset_key.path)
+                mdata.from_storable(asset_index.assets[asset_idx])
+                mdata.update(attr_dict)
+                updates.append((asset_index, asset_idx, mdata))
 
-            # Generate a Mongo doc from the metadata and update the course asset info.
-            all_assets[asset_idx] = mdata.to_storable()
-            return all_assets
+            # Generate Mongo docs from the metadata and update the course asset info.
+            for asset_index, asset_idx, mdata in updates:
+                asset_index.assets[asset_idx] = mdata.to_storable()
 
-        self._update_course_assets(user_id, asset_key, _internal_method)
+        self._update_course_assets(user_id, asset_attrs[0][0].course_key, _internal_method)
 
     @contract(asset_key='AssetKey')
     def delete_asset_metadata(self, asset_key, user_id):
@@ -2864,21 +2901,46 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         Returns:
             Number of asset metadata entries deleted (0 or 1)
         """
-        def _internal_method(all_asset_info, asset_idx):
+        return self.delete_asset_metadata_list([asset_key], user_id)
+
+    @contract(asset_keys='list(AssetKey)')
+    def delete_asset_metadata_list(self, asset_keys, user_id):
+        """
+        Deletes the metadata of the given assets, which must all belong to the same course,
+        in a single version of the course structure.
+
+        Arguments:
+            asset_keys (list(AssetKey)): keys containing original asset filenames
+
+        Returns:
+            Number of asset metadata entries deleted
+        """
+        if not asset_keys:
+            return 0
+
+        # A set, since the draft modulestore calls _internal_method for each of its branches.
+        deleted = set()
+
+        def _internal_method(asset_index_for_type):
             """
-            Remove the item if it was found
+            Remove the items which were found
             """
-            if asset_idx is None:
-                raise ItemNotFoundError(asset_key)
-
-            all_asset_info.pop(asset_idx)
-            return all_asset_info
+            found = False
+            for asset_key in asset_keys:
+                asset_index = asset_index_for_type(asset_key.asset_type)
+                asset_idx = asset_index.find(asset_key)
+                if asset_idx is not None:
+                    asset_index.pop(asset_idx)
+                    deleted.add(asset_key)
+                    found = True
+            if not found:
+                raise ItemNotFoundError(asset_keys)
 
         try:
-            self._update_course_assets(user_id, asset_key, _internal_method)
-            return 1
+            self._update_course_assets(user_id, asset_keys[0].course_key, _internal_method)
         except ItemNotFoundError:
-            return 0
+            pass
+        return len(deleted)
 
     @contract(source_course_key='CourseKey', dest_course_key='CourseKey')
     def copy_all_asset_metadata(self, source_course_key, dest_course_key, user_id):
@@ -2895,7 +2957,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             index_entry = self._get_index_if_valid(dest_course_key)
             new_structure = self.version_structure(dest_course_key, original_structure, user_id)
 
-            new_structure['assets'] = source_structure.get('assets', {})
+            # Asset lists are updated in place, so don't share them with the source structure.
+            new_structure['assets'] = copy.deepcopy(source_structure.get('assets', {}))
             new_structure['thumbnails'] = source_structure.get('thumbnails', [])
 
             # update index if appropriate and structures
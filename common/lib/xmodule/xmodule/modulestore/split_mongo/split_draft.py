@@ -585,17 +585,17 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
             self._map_revision_to_branch(course_key), asset_type, start, maxresults, sort, **kwargs
         )
 
-    def _update_course_assets(self, user_id, asset_key, update_function):
+    def _update_course_assets(self, user_id, course_key, update_function):
         """
         Updates both the published and draft branches
         """
         # if one call gets an exception, don't do the other call but pass on the exception
         super(DraftVersioningModuleStore, self)._update_course_assets(
-            user_id, self._map_revision_to_branch(asset_key, ModuleStoreEnum.RevisionOption.published_only),
+            user_id, self._map_revision_to_branch(course_key, ModuleStoreEnum.RevisionOption.published_only),
             update_function
         )
         super(DraftVersioningModuleStore, self)._update_course_assets(
-            user_id, self._map_revision_to_branch(asset_key, ModuleStoreEnum.RevisionOption.draft_only),
+            user_id, self._map_revision_to_branch(course_key, ModuleStoreEnum.RevisionOption.draft_only),
             update_function
         )
 
@@ -11,7 +11,7 @@ import unittest
 from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import CourseLocator
 from xmodule.assetstore import AssetMetadata
-from xmodule.modulestore import ModuleStoreEnum, SortedAssetList, IncorrectlySortedList
+from xmodule.modulestore import ModuleStoreEnum, SortedAssetList, SortedAssetIndex, IncorrectlySortedList
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.modulestore.tests.factories import CourseFactory
 from xmodule.modulestore.tests.utils import (
@@ -82,6 +82,39 @@ class TestSortedAssetList(unittest.TestCase):
         )
 
 
+class TestSortedAssetIndex(unittest.TestCase):
+    """
+    Tests the SortedAssetIndex class.
+    """
+    def setUp(self):
+        super(TestSortedAssetIndex, self).setUp()
+        asset_list = [dict(zip(AssetStoreTestData.asset_fields, asset)) for asset in AssetStoreTestData.all_asset_data]
+        self.assets = list(SortedAssetList(iterable=asset_list))
+        self.asset_index = SortedAssetIndex(self.assets)
+        self.course_key = CourseLocator('org', 'course', 'run')
+
+    def test_exception_on_bad_sort(self):
+        with self.assertRaises(ValueError):
+            SortedAssetIndex(list(reversed(self.assets)))
+
+    def test_find(self):
+        self.assertEquals(self.asset_index.find(self.course_key.make_asset_key('asset', 'asset.txt')), 0)
+        self.assertIsNone(self.asset_index.find(self.course_key.make_asset_key('asset', 'burnside.jpg')))
+
+    def test_insert_update_and_pop(self):
+        asset_key = self.course_key.make_asset_key('asset', 'burnside.jpg')
+        self.asset_index.insert_or_update(AssetMetadata(asset_key, internal_name='first'))
+        self.asset_index.insert_or_update(AssetMetadata(asset_key, internal_name='second'))
+        self.assertEquals(len(self.assets), len(AssetStoreTestData.all_asset_data) + 1)
+        asset_idx = self.asset_index.find(asset_key)
+        self.assertEquals(self.assets[asset_idx]['internal_name'], 'second')
+        self.assertEquals([asset['filename'] for asset in self.assets], sorted(self.asset_index.filenames))
+
+        self.asset_index.pop(asset_idx)
+        self.assertIsNone(self.asset_index.find(asset_key))
+        self.assertTrue(self.asset_index.indexes(self.assets))
+
+
 @attr('mongo')
 @ddt.ddt
 class TestMongoAssetMetadataStorage(unittest.TestCase):
@@ -345,6 +378,50 @@ class TestMongoAssetMetadataStorage(unittest.TestCase):
                 self.assertIsNotNone(getattr(updated_asset_md, attribute, None))
                 self.assertEquals(getattr(updated_asset_md, attribute, None), value)
 
+    @ddt.data(*MODULESTORE_SETUPS)
+    def test_set_attrs_list(self, storebuilder):
+        """
+        Set attrs on several assets at once
+        """
+        with storebuilder.build() as (__, store):
+            course = CourseFactory.create(modulestore=store)
+            asset_keys = [course.id.make_asset_key(asset_type, filename) for asset_type, filename in self.alls]
+            store.save_asset_metadata_list(
+                [self._make_asset_metadata(asset_key) for asset_key in asset_keys], ModuleStoreEnum.UserID.test
+            )
+            store.set_asset_metadata_attrs_list(
+                [(asset_key, {'pathname': '/new/path', 'locked': True}) for asset_key in asset_keys],
+                ModuleStoreEnum.UserID.test
+            )
+            for asset_key in asset_keys:
+                updated_asset_md = store.find_asset_metadata(asset_key)
+                self.assertEquals(updated_asset_md.pathname, '/new/path')
+                self.assertTrue(updated_asset_md.locked)
+
+            with self.assertRaises(ItemNotFoundError):
+                store.set_asset_metadata_attrs_list(
+                    [(course.id.make_asset_key('asset', 'burnside.jpg'), {'locked': False})],
+                    ModuleStoreEnum.UserID.test
+                )
+
+    @ddt.data(*MODULESTORE_SETUPS)
+    def test_delete_list(self, storebuilder):
+        """
+        Delete several assets at once, some of which don't exist
+        """
+        with storebuilder.build() as (__, store):
+            course = CourseFactory.create(modulestore=store)
+            asset_keys = [course.id.make_asset_key(asset_type, filename) for asset_type, filename in self.alls]
+            store.save_asset_metadata_list(
+                [self._make_asset_metadata(asset_key) for asset_key in asset_keys], ModuleStoreEnum.UserID.test
+            )
+            deleted = store.delete_asset_metadata_list(
+                asset_keys[1:] + [course.id.make_asset_key('asset', 'burnside.jpg')], ModuleStoreEnum.UserID.test
+            )
+            self.assertEquals(deleted, len(asset_keys) - 1)
+            self.assertEquals(len(store.get_all_asset_metadata(course.id, None)), 1)
+            self.assertIsNotNone(store.find_asset_metadata(asset_keys[0]))
+
     @ddt.data(*MODULESTORE_SETUPS)
     def test_set_disallowed_attrs(self, storebuilder):
         """
@@ -3,6 +3,10 @@ Methods for exporting course data to XML
 """
 
 import logging
+import posixpath
+import tarfile
+import time
+import zlib
 from abc import abstractmethod
 import lxml.etree
 from xblock.fields import Scope, Reference, ReferenceList, ReferenceValueDict
@@ -13,9 +17,9 @@ from xmodule.modulestore import EdxJSONEncoder, ModuleStoreEnum
 from xmodule.modulestore.inheritance import own_metadata
 from xmodule.modulestore.store_utilities import draft_node_constructor, get_draft_subtree_roots
 from xmodule.modulestore import LIBRARY_ROOT
+from fs.memoryfs import MemoryFS
 from fs.osfs import OSFS
 from json import dumps
-import os
 
 from xmodule.modulestore.draft_and_published import DIRECT_ONLY_CATEGORIES
 from opaque_keys.edx.locator import CourseLocator, LibraryLocator
@@ -25,6 +29,9 @@ PUBLISHED_DIR = "published"
 
 DEFAULT_CONTENT_FIELDS = ['metadata', 'data']
 
+# Size of the chunks read from the contentstore when streaming an export.
+TAR_STREAM_CHUNK_SIZE = 256 * 1024
+
 
 def _export_drafts(modulestore, course_key, export_fs, xml_centric_course_key):
     """
@@ -104,7 +111,10 @@ class ExportManager(object):
     """
     Manages XML exporting for courselike objects.
     """
-    def __init__(self, modulestore, contentstore, courselike_key, root_dir, target_dir):
+    def __init__(
+            self, modulestore, contentstore, courselike_key, root_dir, target_dir,
+            root_fs=None, export_static_files=True
+    ):
         """
         Export all modules from `modulestore` and content from `contentstore` as xml to `root_dir`.
 
@@ -113,12 +123,17 @@ class ExportManager(object):
         `courselike_key`: The Locator of the Descriptor to export
         `root_dir`: The directory to write the exported xml to
         `target_dir`: The name of the directory inside `root_dir` to write the content to
+        `root_fs`: The filesystem to write to instead of `root_dir`, e.g. a `MemoryFS`
+        `export_static_files`: If False, only the policy of the static assets is exported and the
+            caller is responsible for exporting their files (see `stream_course_to_tar_gz`)
         """
         self.modulestore = modulestore
         self.contentstore = contentstore
         self.courselike_key = courselike_key
         self.root_dir = root_dir
         self.target_dir = target_dir
+        self.root_fs = root_fs
+        self.export_static_files = export_static_files
 
     @abstractmethod
     def get_key(self):
@@ -137,6 +152,22 @@ class ExportManager(object):
         Process additional content, like static assets.
         """
 
+    def export_static_assets(self, root_courselike_dir, export_fs):
+        """
+        Export the static assets from the contentstore and their policy.
+        """
+        if self.export_static_files:
+            self.contentstore.export_all_for_course(
+                self.courselike_key,
+                root_courselike_dir + '/static/',
+                root_courselike_dir + '/policies/assets.json',
+            )
+        else:
+            with export_fs.open('policies/assets.json', 'w') as assets_policy_file:
+                assets_policy_file.write(dumps(
+                    self.contentstore.get_export_policy_for_course(self.courselike_key), sort_keys=True, indent=4
+                ))
+
     def post_process(self, root, export_fs):
         """
         Perform any final processing after the other export tasks are done.
@@ -154,7 +185,7 @@ class ExportManager(object):
         """
         with self.modulestore.bulk_operations(self.courselike_key):
 
-            fsm = OSFS(self.root_dir)
+            fsm = self.root_fs if self.root_fs is not None else OSFS(self.root_dir)
             root = lxml.etree.Element('unknown')
 
             # export only the published content
@@ -171,7 +202,7 @@ class ExportManager(object):
             self.process_root(root, export_fs)
 
             # Process extra items-- drafts, assets, etc
-            root_courselike_dir = self.root_dir + '/' + self.target_dir
+            root_courselike_dir = None if self.root_dir is None else self.root_dir + '/' + self.target_dir
             self.process_extra(root, courselike, root_courselike_dir, xml_centric_courselike_key, export_fs)
 
             # Any last pass adjustments
@@ -201,26 +232,20 @@ class CourseExportManager(ExportManager):
 
     def process_extra(self, root, courselike, root_courselike_dir, xml_centric_courselike_key, export_fs):
         # Export the modulestore's asset metadata.
-        asset_dir = root_courselike_dir + '/' + AssetMetadata.EXPORTED_ASSET_DIR + '/'
-        if not os.path.isdir(asset_dir):
-            os.makedirs(asset_dir)
+        asset_dir = export_fs.makeopendir(AssetMetadata.EXPORTED_ASSET_DIR)
         asset_root = lxml.etree.Element(AssetMetadata.ALL_ASSETS_XML_TAG)
         course_assets = self.modulestore.get_all_asset_metadata(self.courselike_key, None)
         for asset_md in course_assets:
             # All asset types are exported using the "asset" tag - but their asset type is specified in each asset key.
             asset = lxml.etree.SubElement(asset_root, AssetMetadata.ASSET_XML_TAG)
             asset_md.to_xml(asset)
-        with OSFS(asset_dir).open(AssetMetadata.EXPORTED_ASSET_FILENAME, 'w') as asset_xml_file:
+        with asset_dir.open(AssetMetadata.EXPORTED_ASSET_FILENAME, 'w') as asset_xml_file:
             lxml.etree.ElementTree(asset_root).write(asset_xml_file)
 
         # export the static assets
         policies_dir = export_fs.makeopendir('policies')
         if self.contentstore:
-            self.contentstore.export_all_for_course(
-                self.courselike_key,
-                root_courselike_dir + '/static/',
-                root_courselike_dir + '/policies/assets.json',
-            )
+            self.export_static_assets(root_courselike_dir, export_fs)
 
             # If we are using the default course image, export it to the
             # legacy location to support backwards compatibility.
@@ -235,10 +260,8 @@ class CourseExportManager(ExportManager):
                 except NotFoundError:
                     pass
                 else:
-                    output_dir = root_courselike_dir + '/static/images/'
-                    if not os.path.isdir(output_dir):
-                        os.makedirs(output_dir)
-                    with OSFS(output_dir).open('course_image.jpg', 'wb') as course_image_file:
+                    export_fs.makedir('static/images', recursive=True, allow_recreate=True)
+                    with export_fs.open('static/images/course_image.jpg', 'wb') as course_image_file:
                         course_image_file.write(course_image.data)
 
         # export the static tabs
@@ -318,11 +341,7 @@ class LibraryExportManager(ExportManager):
         export_fs.makeopendir('policies')
 
         if self.contentstore:
-            self.contentstore.export_all_for_course(
-                self.courselike_key,
-                self.root_dir + '/' + self.target_dir + '/static/',
-                self.root_dir + '/' + self.target_dir + '/policies/assets.json',
-            )
+            self.export_static_assets(root_courselike_dir, export_fs)
 
     def post_process(self, root, export_fs):
         """
@@ -351,6 +370,100 @@ def export_library_to_xml(modulestore, contentstore, library_key, root_dir, libr
     LibraryExportManager(modulestore, contentstore, library_key, root_dir, library_dir).export()
 
 
+def stream_course_to_tar_gz(modulestore, contentstore, course_key, course_dir):
+    """
+    Export a course as a gzipped tarball of `course_dir`, returned as an iterator of chunks.
+
+    The course xml is serialized into memory before this returns, so serialization errors
+    are raised right away. The static assets are read from `contentstore` as the chunks are
+    consumed, so the export doesn't need any temporary files.
+    """
+    return _stream_courselike_to_tar_gz(CourseExportManager, modulestore, contentstore, course_key, course_dir)
+
+
+def stream_library_to_tar_gz(modulestore, contentstore, library_key, library_dir):
+    """
+    Export a library as a gzipped tarball of `library_dir`. See stream_course_to_tar_gz for details.
+    """
+    return _stream_courselike_to_tar_gz(LibraryExportManager, modulestore, contentstore, library_key, library_dir)
+
+
+def _stream_courselike_to_tar_gz(export_manager_class, modulestore, contentstore, courselike_key, target_dir):
+    """
+    Export the courselike xml into memory, and return the gzipped tar stream of it and its assets.
+    """
+    xml_fs = MemoryFS()
+    export_manager_class(
+        modulestore, contentstore, courselike_key, None, target_dir, root_fs=xml_fs, export_static_files=False
+    ).export()
+    return _gzip_chunks(_tar_chunks(_export_tar_members(xml_fs, contentstore, courselike_key, target_dir)))
+
+
+def _export_tar_members(xml_fs, contentstore, courselike_key, target_dir):
+    """
+    Yield a (name, size, chunks) tuple for each file of the export.
+    """
+    # The static assets go first: the xml export may write files into the static directory
+    # (e.g. the legacy course image), and those must win as they do in an export to disk.
+    if contentstore:
+        for export_path, content in contentstore.stream_all_for_course(courselike_key):
+            yield (
+                u'{}/static/{}'.format(target_dir, export_path),
+                content.length,
+                content.stream_data(chunk_size=TAR_STREAM_CHUNK_SIZE),
+            )
+
+    for dir_path, filenames in xml_fs.walk():
+        for filename in filenames:
+            file_path = posixpath.join(dir_path, filename)
+            data = xml_fs.getcontents(file_path)
+            yield file_path.lstrip('/'), len(data), [data]
+
+
+def _tar_chunks(members):
+    """
+    Yield the chunks of an uncompressed tar archive of the given (name, size, chunks) members.
+    """
+    offset = 0
+    mtime = time.time()
+    for name, size, chunks in members:
+        tar_info = tarfile.TarInfo(name.encode('utf-8') if isinstance(name, unicode) else name)
+        tar_info.size = size
+        tar_info.mtime = mtime
+        tar_info.mode = 0644
+        header = tar_info.tobuf(tarfile.GNU_FORMAT)
+        yield header
+
+        written = 0
+        for chunk in chunks:
+            written += len(chunk)
+            yield chunk
+        if written != size:
+            raise ValueError(u"Expected {} bytes for {}, got {}".format(size, name, written))
+
+        padding = -size % tarfile.BLOCKSIZE
+        if padding:
+            yield tarfile.NUL * padding
+        offset += len(header) + size + padding
+
+    # An archive ends with two empty blocks, padded to a whole record.
+    end_of_archive = tarfile.NUL * (2 * tarfile.BLOCKSIZE)
+    offset += len(end_of_archive)
+    yield end_of_archive + tarfile.NUL * (-offset % tarfile.RECORDSIZE)
+
+
+def _gzip_chunks(chunks):
+    """
+    Gzip the given chunks on the fly.
+    """
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
 def adapt_references(subtree, destination_course_key, export_fs):
     """
     Map every reference in the subtree into destination_course_key and set it back into the xblock fields
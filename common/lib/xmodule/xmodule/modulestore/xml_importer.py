@@ -21,7 +21,13 @@ Modulestore virtual   |          XML physical (draft, published)
              (a, b)   |  (a, b) | (x, b) | (x, x) | (x, y) | (a, x)
 """
 import logging
+import multiprocessing
+import time
 from abc import abstractmethod
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+from django.conf import settings
 from opaque_keys.edx.locator import LibraryLocator
 import os
 import mimetypes
@@ -36,7 +42,7 @@ from xblock.runtime import KvsFieldData, DictKeyValueStore
 from xmodule.x_module import XModuleDescriptor, XModuleMixin
 from opaque_keys.edx.keys import UsageKey
 from xblock.fields import Scope, Reference, ReferenceList, ReferenceValueDict
-from xmodule.contentstore.content import StaticContent
+from xmodule.contentstore.content import StaticContent, is_thumbnailable, render_thumbnail
 from .inheritance import own_metadata
 from xmodule.errortracker import make_error_tracker
 from .store_utilities import rewrite_nonportable_content_links
@@ -55,28 +61,23 @@ from xmodule.util.misc import escape_invalid_characters
 log = logging.getLogger(__name__)
 
 
-def import_static_content(
-        course_data_path, static_content_store,
-        target_id, subpath='static', verbose=False):
-
-    remap_dict = {}
+# Static files are read in chunks of the default GridFS chunk size.
+STATIC_CONTENT_READ_CHUNK_SIZE = 255 * 1024
 
-    # now import all static assets
-    static_dir = course_data_path / subpath
-    try:
-        with open(course_data_path / 'policies/assets.json') as f:
-            policy = json.load(f)
-    except (IOError, ValueError) as err:
-        # xml backed courses won't have this file, only exported courses;
-        # so, its absence is not really an exception.
-        policy = {}
+StaticAsset = namedtuple('StaticAsset', [
+    'content_path', 'filename', 'import_path', 'asset_key', 'displayname', 'mime_type', 'locked',
+])
 
-    verbose = True
 
+def _find_static_assets(static_dir, target_id, policy, verbose=False):
+    """
+    Walk `static_dir` and return a list of StaticAsset tuples for the files to import.
+    """
     mimetypes.add_type('application/octet-stream', '.sjson')
     mimetypes.add_type('application/octet-stream', '.srt')
     mimetypes_list = mimetypes.types_map.values()
 
+    assets = []
     for dirname, _, filenames in os.walk(static_dir):
         for filename in filenames:
 
@@ -87,20 +88,6 @@ def import_static_content(
                     log.debug('skipping static content %s...', content_path)
                 continue
 
-            if verbose:
-                log.debug('importing static content %s...', content_path)
-
-            try:
-                with open(content_path, 'rb') as f:
-                    data = f.read()
-            except IOError:
-                if filename.startswith('._'):
-                    # OS X "companion files". See
-                    # http://www.diigo.com/annotated/0c936fda5da4aa1159c189cea227e174
-                    continue
-                # Not a 'hidden file', then re-raise exception
-                raise
-
             # strip away leading path from the name
             fullname_with_subpath = content_path.replace(static_dir, '')
             if fullname_with_subpath.startswith('/'):
@@ -120,30 +107,151 @@ def import_static_content(
             # Check extracted contentType in list of all valid mimetypes
             if not mime_type or mime_type not in mimetypes_list:
                 mime_type = mimetypes.guess_type(filename)[0]   # Assign guessed mimetype
-            content = StaticContent(
-                asset_key, displayname, mime_type, data,
-                import_path=fullname_with_subpath, locked=locked
-            )
 
-            # first let's save a thumbnail so we can get back a thumbnail location
-            thumbnail_content, thumbnail_location = static_content_store.generate_thumbnail(content)
+            assets.append(StaticAsset(
+                content_path, filename, fullname_with_subpath, asset_key, displayname, mime_type, locked
+            ))
+    return assets
+
 
-            if thumbnail_content is not None:
-                content.thumbnail_location = thumbnail_location
+def _read_in_chunks(static_file):
+    """
+    Yield the contents of the open `static_file` in GridFS sized chunks, closing it once
+    the contents have been consumed (or the generator is discarded).
+    """
+    try:
+        while True:
+            chunk = static_file.read(STATIC_CONTENT_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        static_file.close()
+
+
+def _render_asset_thumbnail(content_path, mime_type):
+    """
+    Render the thumbnail of an asset file. Runs in a thumbnail worker process.
+    """
+    return render_thumbnail(content_path, mime_type)
 
-            # then commit the content
+
+def _can_use_worker_processes():
+    """
+    Daemonic processes (e.g. celery prefork workers) are not allowed to have children.
+    """
+    return not multiprocessing.current_process().daemon
+
+
+def import_static_content(
+        course_data_path, static_content_store,
+        target_id, subpath='static', verbose=False,
+        import_threads=None, thumbnail_processes=None):
+    """
+    Import the files under `course_data_path`/`subpath` into `static_content_store`.
+
+    Files are streamed into the content store in chunks from `import_threads` threads
+    (default: the STATIC_CONTENT_IMPORT_THREADS setting). Image thumbnails are rendered
+    in the import threads, unless `thumbnail_processes` (default: the
+    THUMBNAIL_IMPORT_PROCESSES setting) enables a pool of worker processes for them.
+
+    Returns a dict mapping the path of each imported file to its asset key.
+    """
+    if import_threads is None:
+        import_threads = getattr(settings, 'STATIC_CONTENT_IMPORT_THREADS', 8)
+    if thumbnail_processes is None:
+        thumbnail_processes = getattr(settings, 'THUMBNAIL_IMPORT_PROCESSES', 0)
+
+    # now import all static assets
+    static_dir = course_data_path / subpath
+    try:
+        with open(course_data_path / 'policies/assets.json') as f:
+            policy = json.load(f)
+    except (IOError, ValueError):
+        # xml backed courses won't have this file, only exported courses;
+        # so, its absence is not really an exception.
+        policy = {}
+
+    verbose = True
+
+    assets = _find_static_assets(static_dir, target_id, policy, verbose=verbose)
+    if not assets:
+        return {}
+
+    # Forking a multithreaded process is unsafe (e.g. when the caller runs other threads,
+    # like a web server does), so worker processes are only used when explicitly enabled.
+    thumbnail_pool = None
+    if thumbnail_processes and _can_use_worker_processes() and any(
+            is_thumbnailable(asset.mime_type) for asset in assets
+    ):
+        thumbnail_pool = multiprocessing.Pool(thumbnail_processes)
+    pending_thumbnails = {}
+    if thumbnail_pool is not None:
+        for asset in assets:
+            if is_thumbnailable(asset.mime_type):
+                pending_thumbnails[asset.import_path] = thumbnail_pool.apply_async(
+                    _render_asset_thumbnail, (asset.content_path, asset.mime_type)
+                )
+
+    def import_asset(asset):
+        """
+        Save one asset, and its thumbnail, into the content store.
+        Returns the asset, or None if the file should be skipped.
+        """
+        if verbose:
+            log.debug('importing static content %s...', asset.content_path)
+
+        try:
+            static_file = open(asset.content_path, 'rb')
+        except IOError:
+            if asset.filename.startswith('._'):
+                # OS X "companion files". See
+                # http://www.diigo.com/annotated/0c936fda5da4aa1159c189cea227e174
+                return None
+            # Not a 'hidden file', then re-raise exception
+            raise
+
+        content = StaticContent(
+            asset.asset_key, asset.displayname, asset.mime_type, _read_in_chunks(static_file),
+            import_path=asset.import_path, locked=asset.locked
+        )
+
+        # first let's save a thumbnail so we can get back a thumbnail location
+        if is_thumbnailable(asset.mime_type):
             try:
-                static_content_store.save(content)
-            except Exception as err:
-                log.exception(u'Error importing {0}, error={1}'.format(
-                    fullname_with_subpath, err
-                ))
+                if asset.import_path in pending_thumbnails:
+                    thumbnail_data, thumbnail_content_type = pending_thumbnails[asset.import_path].get()
+                else:
+                    thumbnail_data, thumbnail_content_type = render_thumbnail(asset.content_path, asset.mime_type)
+                _, content.thumbnail_location = static_content_store.save_thumbnail(
+                    content, thumbnail_data, thumbnail_content_type
+                )
+            except Exception, exc:  # pylint: disable=broad-except
+                # log and continue as thumbnails are generally considered as optional
+                log.exception(u"Failed to generate thumbnail for %s. Exception: %s", asset.asset_key, exc)
 
-            # store the remapping information which will be needed
-            # to subsitute in the module data
-            remap_dict[fullname_with_subpath] = asset_key
+        # then commit the content, replacing any previous version of it
+        try:
+            static_content_store.save(content)
+        except Exception as err:
+            log.exception(u'Error importing {0}, error={1}'.format(
+                asset.import_path, err
+            ))
+        return asset
+
+    import_pool = ThreadPool(max(import_threads, 1))
+    try:
+        imported_assets = import_pool.map(import_asset, assets)
+    finally:
+        import_pool.close()
+        import_pool.join()
+        if thumbnail_pool is not None:
+            thumbnail_pool.terminate()
+            thumbnail_pool.join()
 
-    return remap_dict
+    # store the remapping information which will be needed
+    # to subsitute in the module data
+    return {asset.import_path: asset.asset_key for asset in imported_assets if asset is not None}
 
 
 class ImportManager(object):
@@ -210,6 +318,21 @@ class ImportManager(object):
             target_course_id=target_id,
         )
         self.logger, self.errors = make_error_tracker()
+        # Seconds spent in each import phase, keyed by destination id and then by phase name.
+        self.phase_timings = {}
+
+    @contextmanager
+    def timed_phase(self, dest_id, phase):
+        """
+        Record and log how long the wrapped import `phase` of `dest_id` takes.
+        """
+        start = time.time()
+        try:
+            yield
+        finally:
+            duration = time.time() - start
+            self.phase_timings.setdefault(dest_id, OrderedDict())[phase] = duration
+            log.info(u"Import of %s: %s took %.2f seconds", dest_id, phase, duration)
 
     def preflight(self):
         """
@@ -437,16 +560,20 @@ class ImportManager(object):
             # This bulk operation wraps all the operations to populate the published branch.
             with self.store.bulk_operations(dest_id):
                 # Retrieve the course itself.
-                source_courselike, courselike, data_path = self.get_courselike(courselike_key, runtime, dest_id)
+                with self.timed_phase(dest_id, 'courselike'):
+                    source_courselike, courselike, data_path = self.get_courselike(courselike_key, runtime, dest_id)
 
                 # Import all static pieces.
-                self.import_static(data_path, dest_id)
+                with self.timed_phase(dest_id, 'static'):
+                    self.import_static(data_path, dest_id)
 
                 # Import asset metadata stored in XML.
-                self.import_asset_metadata(data_path, dest_id)
+                with self.timed_phase(dest_id, 'asset_metadata'):
+                    self.import_asset_metadata(data_path, dest_id)
 
                 # Import all children
-                self.import_children(source_courselike, courselike, courselike_key, dest_id)
+                with self.timed_phase(dest_id, 'children'):
+                    self.import_children(source_courselike, courselike, courselike_key, dest_id)
 
             # This bulk operation wraps all the operations to populate the draft branch with any items
             # from the /drafts subdirectory.
@@ -455,7 +582,8 @@ class ImportManager(object):
             # and then publishing it.
             with self.store.bulk_operations(dest_id):
                 # Import all draft items into the courselike.
-                courselike = self.import_drafts(courselike, courselike_key, data_path, dest_id)
+                with self.timed_phase(dest_id, 'drafts'):
+                    courselike = self.import_drafts(courselike, courselike_key, data_path, dest_id)
 
             yield courselike
 
@@ -14,10 +14,10 @@ class IgnoredFilesTestCase(unittest.TestCase):
         course_dir = DATA_DIR / "tilde"
         course_id = SlashSeparatedCourseKey("edX", "tilde", "Fall_2012")
         content_store = Mock()
-        content_store.generate_thumbnail.return_value = ("content", "location")
+        content_store.save_thumbnail.return_value = ("content", "location")
         import_static_content(course_dir, content_store, course_id)
         saved_static_content = [call[0][0] for call in content_store.save.call_args_list]
-        name_val = {sc.name: sc.data for sc in saved_static_content}
+        name_val = {sc.name: "".join(sc.data) for sc in saved_static_content}
         self.assertIn("example.txt", name_val)
         self.assertNotIn("example.txt~", name_val)
         self.assertIn("GREEN", name_val["example.txt"])
@@ -29,13 +29,24 @@ class IgnoredFilesTestCase(unittest.TestCase):
         course_dir = DATA_DIR / "dot-underscore"
         course_id = SlashSeparatedCourseKey("edX", "dot-underscore", "2014_Fall")
         content_store = Mock()
-        content_store.generate_thumbnail.return_value = ("content", "location")
+        content_store.save_thumbnail.return_value = ("content", "location")
         import_static_content(course_dir, content_store, course_id)
         saved_static_content = [call[0][0] for call in content_store.save.call_args_list]
-        name_val = {sc.name: sc.data for sc in saved_static_content}
+        name_val = {sc.name: "".join(sc.data) for sc in saved_static_content}
         self.assertIn("example.txt", name_val)
         self.assertIn(".example.txt", name_val)
         self.assertNotIn("._example.txt", name_val)
         self.assertNotIn(".DS_Store", name_val)
         self.assertIn("GREEN", name_val["example.txt"])
         self.assertIn("BLUE", name_val[".example.txt"])
+
+    def test_all_assets_saved(self):
+        """
+        Test that each imported asset is saved to the content store.
+        """
+        course_dir = DATA_DIR / "tilde"
+        course_id = SlashSeparatedCourseKey("edX", "tilde", "Fall_2012")
+        content_store = Mock()
+        remap_dict = import_static_content(course_dir, content_store, course_id, import_threads=2)
+        saved_locations = [call[0][0].location for call in content_store.save.call_args_list]
+        self.assertItemsEqual(saved_locations, remap_dict.values())
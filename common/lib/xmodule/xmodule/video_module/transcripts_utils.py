@@ -4,6 +4,7 @@ Utility functions for transcripts.
 """
 import os
 import copy
+import hashlib
 import json
 import requests
 import logging
@@ -17,9 +18,18 @@ from xmodule.contentstore.django import contentstore
 
 from .bumper_utils import get_bumper_settings
 
+try:
+    from django.core.cache import caches, InvalidCacheBackendError
+    DJANGO_AVAILABLE = True
+except ImportError:
+    DJANGO_AVAILABLE = False
+
 
 log = logging.getLogger(__name__)
 
+# Converted transcripts are keyed by the digest of their source asset, so they never go stale.
+TRANSCRIPT_CONVERSION_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 class TranscriptException(Exception):  # pylint: disable=missing-docstring
     pass
@@ -256,24 +266,36 @@ def generate_srt_from_sjson(sjson_subs, speed):
     :returns: "srt" subs.
     """
 
-    output = ''
+    return u''.join(iter_srt_from_sjson(sjson_subs, speed))
+
 
+def iter_srt_from_sjson(sjson_subs, speed):
+    """Generate transcripts with speed = 1.0 from sjson to SubRip (*.srt),
+    one subtitle at a time, rescaling the timestamps as they are generated
+    rather than in a copy of the whole transcript.
+
+    :param sjson_subs: "sjson" subs.
+    :param speed: speed of `sjson_subs`.
+    :returns: iterator over the "srt" subs.
+    """
     equal_len = len(sjson_subs['start']) == len(sjson_subs['end']) == len(sjson_subs['text'])
     if not equal_len:
-        return output
+        return
 
-    sjson_speed_1 = generate_subs(speed, 1, sjson_subs)
+    def to_speed_1(timestamp):
+        """
+        Same as `generate_subs(speed, 1, ...)`, for a single timestamp.
+        """
+        return timestamp if speed == 1 else int(round(timestamp * 1.0 * speed))
 
-    for i in range(len(sjson_speed_1['start'])):
+    for i, (start, end, text) in enumerate(zip(sjson_subs['start'], sjson_subs['end'], sjson_subs['text'])):
         item = SubRipItem(
             index=i,
-            start=SubRipTime(milliseconds=sjson_speed_1['start'][i]),
-            end=SubRipTime(milliseconds=sjson_speed_1['end'][i]),
-            text=sjson_speed_1['text'][i]
+            start=SubRipTime(milliseconds=to_speed_1(start)),
+            end=SubRipTime(milliseconds=to_speed_1(end)),
+            text=text
         )
-        output += (unicode(item))
-        output += '\n'
-    return output
+        yield unicode(item) + u'\n'
 
 
 def copy_or_rename_transcript(new_name, old_name, item, delete_old=False, user=None):
@@ -467,6 +489,18 @@ def get_or_create_sjson(item, transcripts):
     return sjson_transcript
 
 
+def get_transcript_conversion_cache():
+    """
+    Return the cache in which converted transcripts are kept, or None if there is none.
+    """
+    if not DJANGO_AVAILABLE:
+        return None
+    try:
+        return caches['default']
+    except InvalidCacheBackendError:
+        return None
+
+
 class Transcript(object):
     """
     Container for transcript methods.
@@ -509,6 +543,32 @@ class Transcript(object):
             elif output_format == 'srt':
                 return generate_srt_from_sjson(json.loads(content), speed=1.0)
 
+    @staticmethod
+    def convert_asset(asset, input_format, output_format):
+        """
+        Convert the transcript in the `asset` content from `input_format` to `output_format`.
+
+        Conversions are cached by the digest of the asset content, so that a transcript
+        is converted once rather than on every download.
+        """
+        if input_format == output_format:
+            return asset.data
+
+        cache = get_transcript_conversion_cache()
+        if cache is None:
+            return Transcript.convert(asset.data, input_format, output_format)
+
+        cache_key = u'transcripts.converted.{digest}.{input_format}.{output_format}'.format(
+            digest=asset.content_digest or hashlib.md5(asset.data).hexdigest(),
+            input_format=input_format,
+            output_format=output_format,
+        )
+        content = cache.get(cache_key)
+        if content is None:
+            content = Transcript.convert(asset.data, input_format, output_format)
+            cache.set(cache_key, content, TRANSCRIPT_CONVERSION_CACHE_TIMEOUT)
+        return content
+
     @staticmethod
     def asset(location, subs_id, lang='en', filename=None):
         """
@@ -632,13 +692,13 @@ class VideoTranscriptsMixin(object):
                 log.debug("No subtitles for 'en' language")
                 raise ValueError
 
-            data = Transcript.asset(self.location, transcript_name, lang).data
+            asset = Transcript.asset(self.location, transcript_name, lang)
             filename = u'{}.{}'.format(transcript_name, transcript_format)
-            content = Transcript.convert(data, 'sjson', transcript_format)
+            content = Transcript.convert_asset(asset, 'sjson', transcript_format)
         else:
-            data = Transcript.asset(self.location, None, None, other_lang[lang]).data
+            asset = Transcript.asset(self.location, None, None, other_lang[lang])
             filename = u'{}.{}'.format(os.path.splitext(other_lang[lang])[0], transcript_format)
-            content = Transcript.convert(data, 'srt', transcript_format)
+            content = Transcript.convert_asset(asset, 'srt', transcript_format)
 
         if not content:
             log.debug('no subtitles produced in get_transcript')
@@ -331,6 +331,90 @@ class CourseEmailTemplate(models.Model):
                 context[key] = markupsafe.escape(value)
         return CourseEmailTemplate._render(self.html_template, htmltext, context)
 
+    def compile(self, plaintext, htmltext, global_context):
+        """
+        Prepare this template for rendering the given message bodies to many recipients.
+
+        `global_context` holds the values that are the same for all recipients.
+        Returns a CompiledCourseEmailTemplate.
+        """
+        return CompiledCourseEmailTemplate(self, plaintext, htmltext, global_context)
+
+
+def _escape_context(context):
+    """
+    Return a copy of `context` with its string values HTML-escaped.
+    """
+    return {
+        key: markupsafe.escape(value) if isinstance(value, basestring) else value
+        for key, value in context.iteritems()
+    }
+
+
+class CompiledCourseEmailTemplate(object):
+    """
+    A CourseEmailTemplate bound to a message, for rendering it to many recipients.
+
+    The templates are split around the message body tag and the recipient-independent
+    context is HTML-escaped once, so that rendering a message for a recipient only
+    formats the template halves with that recipient's values and substitutes any
+    %%-encoded keywords in the body.  The output is the same as that of
+    `CourseEmailTemplate.render_plaintext` and `CourseEmailTemplate.render_htmltext`.
+    """
+    def __init__(self, template, plaintext, htmltext, global_context):
+        self.plain_template = self._split_template(template.plain_template)
+        self.html_template = self._split_template(template.html_template)
+        self.plaintext = plaintext
+        self.htmltext = htmltext
+        self.plain_context = dict(global_context)
+        self.html_context = _escape_context(global_context)
+
+    @staticmethod
+    def _split_template(format_string):
+        """
+        Split a template into the format strings before and after the message body tag.
+
+        If the template has no body tag, the whole template is returned as the first
+        format string and the second is None.
+        """
+        head, tag, tail = format_string.partition(COURSE_EMAIL_MESSAGE_BODY_TAG)
+        return (head, tail) if tag else (head, None)
+
+    @staticmethod
+    def _render(template, message_body, context):
+        """
+        Render a split template with the given message body and complete context.
+        """
+        if '%%' in message_body and 'user_id' in context and 'course_id' in context:
+            message_body = substitute_keywords_with_data(message_body, context)
+
+        head, tail = template
+        if tail is None:
+            result = head.format(**context)
+        else:
+            result = head.format(**context) + message_body + tail.format(**context)
+        return wrap_message(result)
+
+    def render_plaintext(self, recipient_context):
+        """
+        Create the plain text message for a recipient.
+
+        `recipient_context` holds the recipient-specific values (name, email, user_id and course_id).
+        """
+        context = dict(self.plain_context)
+        context.update(recipient_context)
+        return self._render(self.plain_template, self.plaintext, context)
+
+    def render_htmltext(self, recipient_context):
+        """
+        Create the HTML message for a recipient.
+
+        `recipient_context` holds the recipient-specific values (name, email, user_id and course_id).
+        """
+        context = dict(self.html_context)
+        context.update(_escape_context(recipient_context))
+        return self._render(self.html_template, self.htmltext, context)
+
 
 class CourseAuthorization(models.Model):
     """
@@ -356,6 +440,19 @@ class CourseAuthorization(models.Model):
         except cls.DoesNotExist:
             return False
 
+    @classmethod
+    def instructor_email_enabled_courses(cls, course_ids):
+        """
+        Returns the set of the given course ids for which email is enabled, with a single query.
+        """
+        # Read the ids from model instances, since values_list() returns them as strings rather than CourseKeys.
+        return set(
+            course_authorization.course_id
+            for course_authorization in cls.objects.filter(
+                course_id__in=list(course_ids), email_enabled=True
+            ).only('course_id')
+        )
+
     def __unicode__(self):
         not_en = "Not "
         if self.email_enabled:
@@ -397,6 +494,21 @@ class BulkEmailFlag(ConfigurationModel):
         else:  # implies enabled == True and require_course_email == False, so email is globally enabled
             return True
 
+    @classmethod
+    def feature_enabled_courses(cls, course_ids):
+        """
+        Returns the set of the given course ids for which the bulk email feature is
+        available, as determined by `feature_enabled`, with at most one query
+        for the course-specific authorizations.
+        """
+        course_ids = list(course_ids)
+        if not BulkEmailFlag.is_enabled():
+            return set()
+        elif BulkEmailFlag.current().require_course_email_auth:
+            return CourseAuthorization.instructor_email_enabled_courses(course_ids)
+        else:
+            return set(course_ids)
+
     class Meta(object):
         app_label = "bulk_email"
 
@@ -45,6 +45,7 @@ from instructor_task.subtasks import (
     queue_subtasks_for_query,
     check_subtask_is_valid,
     update_subtask_status,
+    filter_queryset_by_pk_range,
 )
 from util.date_utils import get_default_time_display
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
@@ -92,6 +93,9 @@ BULK_EMAIL_FAILURE_ERRORS = (
     SMTPException,
 )
 
+# Fields of the User model that are fetched for each recipient, in addition to 'pk'.
+RECIPIENT_FIELDS = ['profile__name', 'email']
+
 
 def _get_course_email_context(course):
     """
@@ -119,6 +123,38 @@ def _get_course_email_context(course):
     return email_context
 
 
+def _get_recipient_queryset(course_id, user_id, targets):
+    """
+    Returns a queryset of the users who should receive an email sent to `targets`.
+    """
+    combined_set = User.objects.none()
+    for target in targets:
+        combined_set |= target.get_users(course_id, user_id)
+    return combined_set.distinct()
+
+
+def _get_recipients_in_range(entry_id, email_id, recipient_pk_range):
+    """
+    Fetches the recipients of an email whose user ids are in the given range.
+
+    Users who have opted out of email from the course are excluded by the query
+    itself.  Returns the list of recipients, as well as the number of users in
+    the range who have opted out.
+    """
+    requester_id = InstructorTask.objects.get(pk=entry_id).requester_id
+    course_email = CourseEmail.objects.get(id=email_id)
+    course_id = course_email.course_id
+    recipients = filter_queryset_by_pk_range(
+        _get_recipient_queryset(course_id, requester_id, course_email.targets.all()),
+        recipient_pk_range,
+    )
+    to_list = list(
+        recipients.exclude(optout__course_id=course_id).order_by('pk').values('pk', *RECIPIENT_FIELDS)
+    )
+    num_optout = recipients.filter(optout__course_id=course_id).count()
+    return to_list, num_optout
+
+
 def perform_delegate_email_batches(entry_id, course_id, task_input, action_name):
     """
     Delegates emails by querying for the list of recipients who should
@@ -172,15 +208,7 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
     targets = email_obj.targets.all()
     global_email_context = _get_course_email_context(course)
 
-    recipient_qsets = [
-        target.get_users(course_id, user_id)
-        for target in targets
-    ]
-    combined_set = User.objects.none()
-    for qset in recipient_qsets:
-        combined_set |= qset
-    combined_set = combined_set.distinct()
-    recipient_fields = ['profile__name', 'email']
+    combined_set = _get_recipient_queryset(course_id, user_id, targets)
 
     log.info(u"Task %s: Preparing to queue subtasks for sending emails for course %s, email %s",
              task_id, course_id, email_id)
@@ -200,16 +228,22 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
         log.warning(msg)
         raise ValueError(msg)
 
-    def _create_send_email_subtask(to_list, initial_subtask_status):
-        """Creates a subtask to send email to a given recipient list."""
+    def _create_send_email_subtask(recipient_pk_range, initial_subtask_status):
+        """
+        Creates a subtask to send email to the recipients in a given range of user ids.
+
+        The subtask fetches its own recipients, so that the task message does not
+        contain the recipient list.
+        """
         subtask_id = initial_subtask_status.task_id
         new_subtask = send_course_email.subtask(
             (
                 entry_id,
                 email_id,
-                to_list,
+                [],
                 global_email_context,
                 initial_subtask_status.to_dict(),
+                recipient_pk_range,
             ),
             task_id=subtask_id,
             routing_key=routing_key,
@@ -221,9 +255,10 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
         action_name,
         _create_send_email_subtask,
         [combined_set],
-        recipient_fields,
+        RECIPIENT_FIELDS,
         settings.BULK_EMAIL_EMAILS_PER_TASK,
         total_recipients,
+        dispatch_item_ranges=True,
     )
 
     # We want to return progress here, as this is what will be stored in the
@@ -235,7 +270,7 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
 
 
 @task(default_retry_delay=settings.BULK_EMAIL_DEFAULT_RETRY_DELAY, max_retries=settings.BULK_EMAIL_MAX_RETRIES)
-def send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status_dict):
+def send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status_dict, recipient_pk_range=None):
     """
     Sends an email to a list of recipients.
 
@@ -265,16 +300,17 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
         Most values will be zero on initial call, but may be different when the task is
         invoked as part of a retry.
 
+      * `recipient_pk_range`: if provided, a (lower_pk, upper_pk) range of user ids, as generated by
+        `queue_subtasks_for_query`.  The recipients are then the users in that range who should receive
+        the email and have not opted out, and `to_list` is ignored.  Retries are always passed the
+        explicit `to_list` of recipients remaining to be emailed.
+
     Sends to all addresses contained in to_list that are not also in the Optout table.
     Emails are sent multi-part, in both plain text and html.  Updates InstructorTask object
     with status information (sends, failures, skips) and updates number of subtasks completed.
     """
     subtask_status = SubtaskStatus.from_dict(subtask_status_dict)
     current_task_id = subtask_status.task_id
-    num_to_send = len(to_list)
-    log.info((u"Preparing to send email %s to %d recipients as subtask %s "
-              u"for instructor task %d: context = %s, status=%s"),
-             email_id, num_to_send, current_task_id, entry_id, global_email_context, subtask_status)
 
     # Check that the requested subtask is actually known to the current InstructorTask entry.
     # If this fails, it throws an exception, which should fail this subtask immediately.
@@ -287,9 +323,21 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
     # To deal with that, we need to confirm that the task has not already been completed.
     check_subtask_is_valid(entry_id, current_task_id, subtask_status)
 
+    # Optouts are excluded when fetching the recipients in a range, rather than filtered from the list.
+    filter_optouts = recipient_pk_range is None
+    num_to_send = len(to_list)
     send_exception = None
     new_subtask_status = None
     try:
+        if not filter_optouts:
+            to_list, num_optout = _get_recipients_in_range(entry_id, email_id, recipient_pk_range)
+            subtask_status.increment(skipped=num_optout)
+            num_to_send = len(to_list)
+
+        log.info((u"Preparing to send email %s to %d recipients as subtask %s "
+                  u"for instructor task %d: context = %s, status=%s"),
+                 email_id, num_to_send, current_task_id, entry_id, global_email_context, subtask_status)
+
         course_title = global_email_context['course_title']
         with dog_stats_api.timer('course_email.single_task.time.overall', tags=[_statsd_tag(course_title)]):
             new_subtask_status, send_exception = _send_course_email(
@@ -298,6 +346,7 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
                 to_list,
                 global_email_context,
                 subtask_status,
+                filter_optouts=filter_optouts,
             )
     except Exception:
         # Unexpected exception. Try to write out the failure to the entry before failing.
@@ -408,7 +457,7 @@ def _get_source_address(course_id, course_title, truncate=True):
     return from_addr
 
 
-def _send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status):
+def _send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status, filter_optouts=True):
     """
     Performs the email sending task.
 
@@ -425,6 +474,7 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         for all recipients of this email.  This dict is to be used to fill in slots in email
         template.  It does not include 'name' and 'email', which will be provided by the to_list.
       * `subtask_status` : object of class SubtaskStatus representing current status.
+      * `filter_optouts` : whether recipients in the Optout table still need to be removed from `to_list`.
 
     Sends to all addresses contained in to_list that are not also in the Optout table.
     Emails are sent multi-part, in both plain text and html.
@@ -470,7 +520,7 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
     # attempt.  Anyone on the to_list on a retry has already passed the filter
     # that existed at that time, and we don't need to keep checking for changes
     # in the Optout list.
-    if subtask_status.get_retry_count() == 0:
+    if filter_optouts and subtask_status.get_retry_count() == 0:
         to_list, num_optout = _filter_optouts_from_recipients(to_list, course_email.course_id)
         subtask_status.increment(skipped=num_optout)
 
@@ -480,140 +530,143 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
     from_addr = course_email.from_addr if course_email.from_addr else \
         _get_source_address(course_email.course_id, course_title)
 
-    # use the CourseEmailTemplate that was associated with the CourseEmail
-    course_email_template = course_email.get_template()
+    # use the CourseEmailTemplate that was associated with the CourseEmail,
+    # compiled once for all of the recipients of this subtask
+    course_email_template = course_email.get_template().compile(
+        course_email.text_message, course_email.html_message, global_email_context
+    )
+    batch_size = max(settings.BULK_EMAIL_SEND_BATCH_SIZE, 1)
     try:
         connection = get_connection()
         connection.open()
 
-        # Define context values to use in all course emails:
-        email_context = {'name': '', 'email': ''}
-        email_context.update(global_email_context)
-
         while to_list:
-            # Update context with user-specific values from the user at the end of the list.
-            # At the end of processing this user, they will be popped off of the to_list.
-            # That way, the to_list will always contain the recipients remaining to be emailed.
-            # This is convenient for retries, which will need to send to those who haven't
-            # yet been emailed, but not send to those who have already been sent to.
-            recipient_num += 1
-            current_recipient = to_list[-1]
-            email = current_recipient['email']
-            email_context['email'] = email
-            email_context['name'] = current_recipient['profile__name']
-            email_context['user_id'] = current_recipient['pk']
-            email_context['course_id'] = course_email.course_id
-
-            # Construct message content using templates and context:
-            plaintext_msg = course_email_template.render_plaintext(course_email.text_message, email_context)
-            html_msg = course_email_template.render_htmltext(course_email.html_message, email_context)
-
-            # Create email:
-            email_msg = EmailMultiAlternatives(
-                course_email.subject,
-                plaintext_msg,
-                from_addr,
-                [email],
-                connection=connection
-            )
-            email_msg.attach_alternative(html_msg, 'text/html')
-
-            # Throttle if we have gotten the rate limiter.  This is not very high-tech,
-            # but if a task has been retried for rate-limiting reasons, then we sleep
-            # for a period of time between all emails within this task.  Choice of
-            # the value depends on the number of workers that might be sending email in
-            # parallel, and what the SES throttle rate is.
-            if subtask_status.retried_nomax > 0:
-                sleep(settings.BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS)
-
+            # Recipients are sent to over the same connection in batches.  Logging and
+            # statsd reporting are aggregated per batch rather than per recipient.
+            batch = _EmailBatch(recipient_num)
             try:
-                log.info(
-                    "BulkEmail ==> Task: %s, SubTask: %s, EmailId: %s, Recipient num: %s/%s, \
-                    Recipient name: %s, Email address: %s",
-                    parent_task_id,
-                    task_id,
-                    email_id,
-                    recipient_num,
-                    total_recipients,
-                    current_recipient['profile__name'],
-                    email
-                )
-                with dog_stats_api.timer('course_email.single_send.time.overall', tags=[_statsd_tag(course_title)]):
-                    connection.send_messages([email_msg])
-
-            except SMTPDataError as exc:
-                # According to SMTP spec, we'll retry error codes in the 4xx range.  5xx range indicates hard failure.
-                total_recipients_failed += 1
-                log.error(
-                    "BulkEmail ==> Status: Failed(SMTPDataError), Task: %s, SubTask: %s, EmailId: %s, \
-                    Recipient num: %s/%s, Email address: %s",
-                    parent_task_id,
-                    task_id,
-                    email_id,
-                    recipient_num,
-                    total_recipients,
-                    email
-                )
-                if exc.smtp_code >= 400 and exc.smtp_code < 500:
-                    # This will cause the outer handler to catch the exception and retry the entire task.
-                    raise exc
-                else:
-                    # This will fall through and not retry the message.
-                    log.warning(
-                        'BulkEmail ==> Task: %s, SubTask: %s, EmailId: %s, Recipient num: %s/%s, \
-                        Email not delivered to %s due to error %s',
-                        parent_task_id,
-                        task_id,
-                        email_id,
-                        recipient_num,
-                        total_recipients,
-                        email,
-                        exc.smtp_error
+                while to_list and batch.size < batch_size:
+                    # Build the message for the user at the end of the list.
+                    # At the end of processing this user, they will be popped off of the to_list.
+                    # That way, the to_list will always contain the recipients remaining to be emailed.
+                    # This is convenient for retries, which will need to send to those who haven't
+                    # yet been emailed, but not send to those who have already been sent to.
+                    recipient_num += 1
+                    current_recipient = to_list[-1]
+                    email = current_recipient['email']
+                    recipient_context = {
+                        'name': current_recipient['profile__name'],
+                        'email': email,
+                        'user_id': current_recipient['pk'],
+                        'course_id': course_email.course_id,
+                    }
+
+                    # Construct message content using the compiled templates and recipient's values:
+                    plaintext_msg = course_email_template.render_plaintext(recipient_context)
+                    html_msg = course_email_template.render_htmltext(recipient_context)
+
+                    # Create email:
+                    email_msg = EmailMultiAlternatives(
+                        course_email.subject,
+                        plaintext_msg,
+                        from_addr,
+                        [email],
+                        connection=connection
                     )
-                    dog_stats_api.increment('course_email.error', tags=[_statsd_tag(course_title)])
-                    subtask_status.increment(failed=1)
-
-            except SINGLE_EMAIL_FAILURE_ERRORS as exc:
-                # This will fall through and not retry the message.
-                total_recipients_failed += 1
-                log.error(
-                    "BulkEmail ==> Status: Failed(SINGLE_EMAIL_FAILURE_ERRORS), Task: %s, SubTask: %s, \
-                    EmailId: %s, Recipient num: %s/%s, Email address: %s, Exception: %s",
-                    parent_task_id,
-                    task_id,
-                    email_id,
-                    recipient_num,
-                    total_recipients,
-                    email,
-                    exc
-                )
-                dog_stats_api.increment('course_email.error', tags=[_statsd_tag(course_title)])
-                subtask_status.increment(failed=1)
-
-            else:
-                total_recipients_successful += 1
-                log.info(
-                    "BulkEmail ==> Status: Success, Task: %s, SubTask: %s, EmailId: %s, \
-                    Recipient num: %s/%s, Email address: %s,",
-                    parent_task_id,
-                    task_id,
-                    email_id,
-                    recipient_num,
-                    total_recipients,
-                    email
-                )
-                dog_stats_api.increment('course_email.sent', tags=[_statsd_tag(course_title)])
-                if settings.BULK_EMAIL_LOG_SENT_EMAILS:
-                    log.info('Email with id %s sent to %s', email_id, email)
-                else:
-                    log.debug('Email with id %s sent to %s', email_id, email)
-                subtask_status.increment(succeeded=1)
-
-            # Pop the user that was emailed off the end of the list only once they have
-            # successfully been processed.  (That way, if there were a failure that
-            # needed to be retried, the user is still on the list.)
-            recipients_info[email] += 1
-            to_list.pop()
+                    email_msg.attach_alternative(html_msg, 'text/html')
+
+                    # Throttle if we have gotten the rate limiter.  This is not very high-tech,
+                    # but if a task has been retried for rate-limiting reasons, then we sleep
+                    # for a period of time between all emails within this task.  Choice of
+                    # the value depends on the number of workers that might be sending email in
+                    # parallel, and what the SES throttle rate is.
+                    if subtask_status.retried_nomax > 0:
+                        sleep(settings.BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS)
+
+                    try:
+                        log.debug(
+                            "BulkEmail ==> Task: %s, SubTask: %s, EmailId: %s, Recipient num: %s/%s, \
+                            Recipient name: %s, Email address: %s",
+                            parent_task_id,
+                            task_id,
+                            email_id,
+                            recipient_num,
+                            total_recipients,
+                            current_recipient['profile__name'],
+                            email
+                        )
+                        with dog_stats_api.timer(
+                            'course_email.single_send.time.overall', tags=[_statsd_tag(course_title)]
+                        ):
+                            connection.send_messages([email_msg])
+
+                    except SMTPDataError as exc:
+                        # According to SMTP spec, we'll retry error codes in the 4xx range.
+                        # 5xx range indicates hard failure.
+                        total_recipients_failed += 1
+                        log.error(
+                            "BulkEmail ==> Status: Failed(SMTPDataError), Task: %s, SubTask: %s, EmailId: %s, \
+                            Recipient num: %s/%s, Email address: %s",
+                            parent_task_id,
+                            task_id,
+                            email_id,
+                            recipient_num,
+                            total_recipients,
+                            email
+                        )
+                        if exc.smtp_code >= 400 and exc.smtp_code < 500:
+                            # This will cause the outer handler to catch the exception and retry the entire task.
+                            raise exc
+                        else:
+                            # This will fall through and not retry the message.
+                            log.warning(
+                                'BulkEmail ==> Task: %s, SubTask: %s, EmailId: %s, Recipient num: %s/%s, \
+                                Email not delivered to %s due to error %s',
+                                parent_task_id,
+                                task_id,
+                                email_id,
+                                recipient_num,
+                                total_recipients,
+                                email,
+                                exc.smtp_error
+                            )
+                            batch.failed += 1
+                            subtask_status.increment(failed=1)
+
+                    except SINGLE_EMAIL_FAILURE_ERRORS as exc:
+                        # This will fall through and not retry the message.
+                        total_recipients_failed += 1
+                        log.error(
+                            "BulkEmail ==> Status: Failed(SINGLE_EMAIL_FAILURE_ERRORS), Task: %s, SubTask: %s, \
+                            EmailId: %s, Recipient num: %s/%s, Email address: %s, Exception: %s",
+                            parent_task_id,
+                            task_id,
+                            email_id,
+                            recipient_num,
+                            total_recipients,
+                            email,
+                            exc
+                        )
+                        batch.failed += 1
+                        subtask_status.increment(failed=1)
+
+                    else:
+                        total_recipients_successful += 1
+                        batch.succeeded += 1
+                        if settings.BULK_EMAIL_LOG_SENT_EMAILS:
+                            log.info('Email with id %s sent to %s', email_id, email)
+                        else:
+                            log.debug('Email with id %s sent to %s', email_id, email)
+                        subtask_status.increment(succeeded=1)
+
+                    # Pop the user that was emailed off the end of the list only once they have
+                    # successfully been processed.  (That way, if there were a failure that
+                    # needed to be retried, the user is still on the list.)
+                    recipients_info[email] += 1
+                    to_list.pop()
+            finally:
+                # Report whatever was processed, even if the batch was interrupted by an error.
+                _report_email_batch(batch, parent_task_id, task_id, email_id, total_recipients, course_title)
 
         log.info(
             "BulkEmail ==> Task: %s, SubTask: %s, EmailId: %s, Total Successful Recipients: %s/%s, \
@@ -697,6 +750,45 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         connection.close()
 
 
+class _EmailBatch(object):
+    """
+    Counts the outcome of sending a batch of emails within a subtask.
+    """
+    def __init__(self, first_recipient_num):
+        self.first_recipient_num = first_recipient_num + 1
+        self.succeeded = 0
+        self.failed = 0
+
+    @property
+    def size(self):
+        """ Number of recipients processed in this batch so far. """
+        return self.succeeded + self.failed
+
+
+def _report_email_batch(batch, parent_task_id, task_id, email_id, total_recipients, course_title):
+    """
+    Log and report to statsd the outcome of a batch of emails.
+    """
+    if not batch.size:
+        return
+    log.info(
+        "BulkEmail ==> Status: Batch sent, Task: %s, SubTask: %s, EmailId: %s, Recipient nums: %s-%s/%s, \
+        Successful: %s, Failed: %s",
+        parent_task_id,
+        task_id,
+        email_id,
+        batch.first_recipient_num,
+        batch.first_recipient_num + batch.size - 1,
+        total_recipients,
+        batch.succeeded,
+        batch.failed
+    )
+    if batch.succeeded:
+        dog_stats_api.increment('course_email.sent', batch.succeeded, tags=[_statsd_tag(course_title)])
+    if batch.failed:
+        dog_stats_api.increment('course_email.error', batch.failed, tags=[_statsd_tag(course_title)])
+
+
 def _get_current_task():
     """
     Stub to make it easier to test without actually running Celery.
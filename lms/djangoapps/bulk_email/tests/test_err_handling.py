@@ -4,7 +4,7 @@ Unit tests for handling email sending errors
 """
 from itertools import cycle
 
-from celery.states import SUCCESS, RETRY  # pylint: disable=no-name-in-module, import-error
+from celery.states import SUCCESS, RETRY, FAILURE  # pylint: disable=no-name-in-module, import-error
 from django.conf import settings
 from django.core.management import call_command
 from django.core.urlresolvers import reverse
@@ -350,6 +350,23 @@ class TestEmailErrors(ModuleStoreTestCase):
                 send_course_email(entry_id, bogus_email_id, to_list, global_email_context, subtask_status.to_dict())
             self.assertEquals(mock_task_save.call_count, MAX_DATABASE_LOCK_RETRIES)
 
+    def test_send_email_recipients_fetch_failure(self):
+        # a failure fetching the recipients of a range should still mark the subtask as failed.
+        entry = InstructorTask.create(self.course.id, "task_type", "task_key", "task_input", self.instructor)
+        entry_id = entry.id
+        subtask_id = "subtask-id-recipients-fetch-failure"
+        initialize_subtask_info(entry, "emailed", 100, [subtask_id])
+        subtask_status = SubtaskStatus.create(subtask_id)
+        global_email_context = {'course_title': 'dummy course'}
+        with patch('bulk_email.tasks._get_recipients_in_range', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                send_course_email(entry_id, 1001, [], global_email_context, subtask_status.to_dict(), (1, 100))
+
+        subtask_info = json.loads(InstructorTask.objects.get(id=entry_id).subtasks)
+        self.assertEquals(subtask_info['status'][subtask_id]['state'], FAILURE)
+        self.assertEquals(subtask_info['failed'], 1)
+        self.assertEquals(subtask_info['succeeded'], 0)
+
     def test_send_email_undefined_email(self):
         # test at a lower level, to ensure that the course gets checked down below too.
         entry = InstructorTask.create(self.course.id, "task_type", "task_key", "task_input", self.instructor)
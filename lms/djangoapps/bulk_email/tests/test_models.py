@@ -189,6 +189,25 @@ class CourseEmailTemplateTest(TestCase):
         self.assertIn(context['course_title'], message)
         self.assertIn(context['name'], message)
 
+    def test_compiled_template_matches_render(self):
+        template = CourseEmailTemplate.get_template()
+        context = self._add_xss_fields(self._get_sample_html_context())
+        plaintext = "Dear %%USER_FULLNAME%%, thanks for enrolling in %%COURSE_DISPLAY_NAME%%."
+        htmltext = "<p>Dear %%USER_FULLNAME%%, thanks for enrolling in %%COURSE_DISPLAY_NAME%%.</p>"
+        recipient_keys = ('name', 'email', 'user_id', 'course_id')
+        recipient_context = {key: context[key] for key in recipient_keys}
+        global_context = {key: value for key, value in context.iteritems() if key not in recipient_keys}
+
+        compiled = template.compile(plaintext, htmltext, global_context)
+        self.assertEqual(
+            compiled.render_plaintext(recipient_context),
+            template.render_plaintext(plaintext, dict(context))
+        )
+        self.assertEqual(
+            compiled.render_htmltext(recipient_context),
+            template.render_htmltext(htmltext, dict(context))
+        )
+
 
 @attr(shard=1)
 class CourseAuthorizationTest(TestCase):
@@ -224,6 +243,21 @@ class CourseAuthorizationTest(TestCase):
             "Course 'abc/123/doremi': Instructor Email Not Enabled"
         )
 
+    def test_feature_enabled_courses(self):
+        course_ids = [CourseKey.from_string('abc/123/doremi'), CourseKey.from_string('abc/456/doremi')]
+        CourseAuthorization.objects.create(course_id=course_ids[0], email_enabled=True)
+        CourseAuthorization.objects.create(course_id=CourseKey.from_string('abc/789/doremi'), email_enabled=True)
+        self.assertEqual(BulkEmailFlag.feature_enabled_courses(course_ids), set())
+
+        BulkEmailFlag.objects.create(enabled=True, require_course_email_auth=True)
+        enabled_courses = BulkEmailFlag.feature_enabled_courses(course_ids)
+        self.assertEqual(enabled_courses, {course_ids[0]})
+        self.assertIn(course_ids[0], enabled_courses)
+        self.assertNotIn(course_ids[1], enabled_courses)
+
+        BulkEmailFlag.objects.create(enabled=True, require_course_email_auth=False)
+        self.assertEqual(BulkEmailFlag.feature_enabled_courses(course_ids), set(course_ids))
+
     def test_creation_auth_off(self):
         BulkEmailFlag.objects.create(enabled=True, require_course_email_auth=False)
         course_id = CourseKey.from_string('blahx/blah101/ehhhhhhh')
@@ -0,0 +1,21 @@
+"""
+Middleware for the custom courses feature.
+"""
+from lms.djangoapps.ccx.overrides import bump_pending_ccx_overrides_versions
+
+
+class CcxOverridesVersionMiddleware(object):
+    """
+    Invalidates, once the transaction of the request is committed, the
+    shared cache of the overrides of the CCXs changed by the request.
+
+    The view's transaction is committed before the responses are
+    processed. It must come after RequestCache in MIDDLEWARE_CLASSES, so
+    that it processes the response before the request cache is cleared.
+    """
+    def process_response(self, request, response):  # pylint: disable=unused-argument
+        """
+        Bumps the override versions of the CCXs changed by the request.
+        """
+        bump_pending_ccx_overrides_versions()
+        return response
@@ -4,12 +4,19 @@ by the individual custom courses feature.
 """
 import json
 import logging
+from uuid import uuid4
 
+from django.core.cache import cache
 from django.db import transaction
 
 import request_cache
 
-from courseware.field_overrides import FieldOverrideProvider
+from courseware.field_overrides import (
+    ALL_BLOCKS,
+    FieldOverrideProvider,
+    clear_override_lookup_plans,
+    lookup_plan_block_key,
+)
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from ccx_keys.locator import CCXLocator, CCXBlockUsageLocator
 
@@ -18,6 +25,11 @@ from lms.djangoapps.ccx.models import CcxFieldOverride, CustomCourseForEdX
 
 log = logging.getLogger(__name__)
 
+# How long the decoded overrides of a CCX are kept in the shared cache. Entries
+# are keyed by the CCX's override version, so this only bounds how long
+# superseded versions linger.
+CCX_OVERRIDES_CACHE_TIMEOUT = 24 * 60 * 60
+
 
 class CustomCoursesForEdxOverrideProvider(FieldOverrideProvider):
     """
@@ -49,6 +61,24 @@ class CustomCoursesForEdxOverrideProvider(FieldOverrideProvider):
             return get_override_for_ccx(ccx, block, name, default)
         return default
 
+    def overridden_fields(self, course_key):
+        """
+        Returns the fields overridden by the current CCX of the course, if any.
+        """
+        ccx = get_current_ccx(course_key)
+        if not ccx:
+            return {}
+
+        # See get_override_for_ccx.
+        overridden_fields = {'course_edit_method': ALL_BLOCKS}
+        for location, block_overrides in _get_overrides_for_ccx(ccx).iteritems():
+            block_key = lookup_plan_block_key(location)
+            for name in block_overrides:
+                # The map also holds the ids and instances of the overrides.
+                if name + "_id" in block_overrides:
+                    overridden_fields.setdefault(name, set()).add(block_key)
+        return overridden_fields
+
     @classmethod
     def enabled_for(cls, block):
         """
@@ -122,26 +152,82 @@ def _get_overrides_for_ccx(ccx):
     """
     Returns a dictionary mapping field name to overriden value for any
     overrides set on this block for this CCX.
+
+    The overrides are memoized in the request cache and, across requests, in
+    the shared cache under the CCX's current override version (see
+    _bump_ccx_overrides_version).
     """
     overrides_cache = request_cache.get_cache('ccx-overrides')
 
     if ccx not in overrides_cache:
-        overrides = {}
-        query = CcxFieldOverride.objects.filter(
-            ccx=ccx,
-        )
+        shared_cache_key = u'ccx-overrides.{}.{}'.format(ccx.id, _get_ccx_overrides_version(ccx))
+        overrides = cache.get(shared_cache_key)
 
-        for override in query:
-            block_overrides = overrides.setdefault(override.location, {})
-            block_overrides[override.field] = json.loads(override.value)
-            block_overrides[override.field + "_id"] = override.id
-            block_overrides[override.field + "_instance"] = override
+        if overrides is None:
+            overrides = {}
+            query = CcxFieldOverride.objects.filter(
+                ccx=ccx,
+            ).values_list('id', 'location', 'field', 'value')
+
+            for override_id, location, field, value in query:
+                # values_list() bypasses the key field's to_python().
+                block_overrides = overrides.setdefault(UsageKey.from_string(location), {})
+                block_overrides[field] = json.loads(value)
+                block_overrides[field + "_id"] = override_id
+
+            cache.set(shared_cache_key, overrides, CCX_OVERRIDES_CACHE_TIMEOUT)
 
         overrides_cache[ccx] = overrides
 
     return overrides_cache[ccx]
 
 
+def _get_ccx_overrides_version_cache_key(ccx):
+    """
+    Returns the shared cache key of the version of the CCX's overrides.
+    """
+    return u'ccx-overrides-version.{}'.format(ccx.id)
+
+
+def _get_ccx_overrides_version(ccx):
+    """
+    Returns the current version of the CCX's overrides in the shared cache.
+    """
+    version_cache_key = _get_ccx_overrides_version_cache_key(ccx)
+    version = cache.get(version_cache_key)
+    if version is None:
+        # add() keeps the version set by a concurrent request, if any.
+        cache.add(version_cache_key, uuid4().hex, None)
+        version = cache.get(version_cache_key)
+    return version
+
+
+def _bump_ccx_overrides_version(ccx):
+    """
+    Invalidates the overrides of the CCX held in the shared cache, by moving
+    the CCX to a new override version.
+
+    When called in a transaction, other requests can still read the
+    overrides from before the transaction and cache them under the new
+    version until it is committed, so the version is bumped again by
+    `bump_pending_ccx_overrides_versions` at the end of the request.
+    """
+    cache.set(_get_ccx_overrides_version_cache_key(ccx), uuid4().hex, None)
+    if transaction.get_connection().in_atomic_block:
+        request_cache.get_cache('ccx-overrides-pending-bumps')[ccx.id] = ccx
+
+
+def bump_pending_ccx_overrides_versions():
+    """
+    Bumps again the override versions of the CCXs whose overrides were
+    changed in a transaction, once it is committed.
+    """
+    pending_bumps = request_cache.get_cache('ccx-overrides-pending-bumps')
+    for ccx in pending_bumps.values():
+        cache.set(_get_ccx_overrides_version_cache_key(ccx), uuid4().hex, None)
+    pending_bumps.clear()
+
+
 @transaction.atomic
 def override_field_for_ccx(ccx, block, name, value):
     """
@@ -168,15 +254,18 @@ def override_field_for_ccx(ccx, block, name, value):
         )
         if created:
             _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name + "_id"] = override.id
+            _bump_ccx_overrides_version(ccx)
         else:
             override_has_changes = serialized_value != override.value
 
     if override_has_changes:
         override.value = serialized_value
         override.save()
+        _bump_ccx_overrides_version(ccx)
 
     _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name] = value_json
     _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name + "_instance"] = override
+    clear_override_lookup_plans()
 
 
 def clear_override_for_ccx(ccx, block, name):
@@ -193,6 +282,8 @@ def clear_override_for_ccx(ccx, block, name):
             field=name).delete()
 
         clear_ccx_field_info_from_ccx_map(ccx, block, name)
+        _bump_ccx_overrides_version(ccx)
+        clear_override_lookup_plans()
 
     except CcxFieldOverride.DoesNotExist:
         pass
@@ -220,3 +311,5 @@ def bulk_delete_ccx_override_fields(ccx, ids):
     ids = list(set(ids))
     if ids:
         CcxFieldOverride.objects.filter(ccx=ccx, id__in=ids).delete()
+        _bump_ccx_overrides_version(ccx)
+        clear_override_lookup_plans()
@@ -7,8 +7,11 @@ import itertools
 import mock
 from nose.plugins.skip import SkipTest
 
+from courseware.courses import get_course_by_id
 from courseware.views.views import progress
-from courseware.field_overrides import OverrideFieldData
+from courseware.field_overrides import OverrideFieldData, resolve_dotted
+from courseware.model_data import FieldDataCache
+from courseware.module_render import get_module_for_descriptor
 from courseware.testutils import FieldOverrideTestMixin
 from datetime import datetime
 from django.conf import settings
@@ -24,11 +27,14 @@ from student.tests.factories import UserFactory
 from xblock.core import XBlock
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase, \
     TEST_DATA_SPLIT_MODULESTORE, TEST_DATA_MONGO_MODULESTORE
-from xmodule.modulestore.tests.factories import check_mongo_calls, CourseFactory, check_sum_of_calls
+from xmodule.modulestore.tests.factories import check_mongo_calls, CourseFactory, ItemFactory, check_sum_of_calls
 from xmodule.modulestore.tests.utils import ProceduralCourseTestMixin
+from xmodule.x_module import STUDENT_VIEW
 from ccx_keys.locator import CCXLocator
+from lms.djangoapps.ccx.overrides import override_field_for_ccx
 from lms.djangoapps.ccx.tests.factories import CcxFactory
 from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
+from openedx.core.djangoapps.self_paced.models import SelfPacedConfiguration
 
 
 @attr(shard=3)
@@ -268,3 +274,88 @@ class TestFieldOverrideSplitPerformance(FieldOverridePerformanceTestCase):
         ('ccx', 2, False, False): (22, 3),
         ('ccx', 3, False, False): (22, 3),
     }
+
+
+@attr(shard=3)
+@override_settings(
+    XBLOCK_FIELD_DATA_WRAPPERS=['lms.djangoapps.courseware.field_overrides:OverrideModulestoreFieldData.wrap'],
+    MODULESTORE_FIELD_OVERRIDE_PROVIDERS=[
+        'ccx.overrides.CustomCoursesForEdxOverrideProvider',
+        'courseware.self_paced_overrides.SelfPacedDateOverrideProvider',
+    ],
+)
+class FieldOverrideLookupBenchmark(FieldOverrideTestMixin, ModuleStoreTestCase):
+    """
+    Benchmarks the field override lookups made while rendering a sequence of
+    a self-paced CCX, recording which fields each provider is consulted for.
+    """
+    MODULESTORE = TEST_DATA_SPLIT_MODULESTORE
+
+    def setUp(self):
+        super(FieldOverrideLookupBenchmark, self).setUp()
+        SelfPacedConfiguration(enabled=True).save()
+
+        self.student = UserFactory.create()
+        self.request = RequestFactory().get("foo")
+        self.request.user = self.student
+
+        patcher = mock.patch('edxmako.request_context.get_current_request', return_value=self.request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        course = CourseFactory.create(enable_ccx=True, self_paced=True)
+        chapter = ItemFactory.create(parent=course, category='chapter')
+        sequential = ItemFactory.create(parent=chapter, category='sequential')
+        for __ in range(3):
+            vertical = ItemFactory.create(parent=sequential, category='vertical')
+            ItemFactory.create(parent=vertical, category='html')
+            ItemFactory.create(parent=vertical, category='problem')
+
+        ccx = CcxFactory.create(course_id=course.id)
+        override_field_for_ccx(ccx, sequential, 'display_name', u'CCX sequence')
+        self.ccx_key = CCXLocator.from_course_locator(course.id, ccx.id)
+        CourseEnrollment.enroll(self.student, self.ccx_key)
+
+    def render_sequence(self):
+        """
+        Renders the sequence of the CCX, as a new request would.
+        """
+        RequestCache.clear_request_cache()
+        course = get_course_by_id(self.ccx_key, depth=None)
+        sequential = course.get_children()[0].get_children()[0]
+        field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
+            self.ccx_key, self.student, sequential, depth=None
+        )
+        module = get_module_for_descriptor(
+            self.student, self.request, sequential, field_data_cache, self.ccx_key, course=course
+        )
+        return module.render(STUDENT_VIEW)
+
+    def record_lookups(self, provider_class, lookups):
+        """
+        Patches `provider_class` to record the names of the fields it is
+        consulted for into the `lookups` set.
+        """
+        original_get = provider_class.get
+
+        def get(provider, block, name, default):
+            """Records the lookup, then performs it."""
+            lookups.add(name)
+            return original_get(provider, block, name, default)
+
+        return mock.patch.object(provider_class, 'get', get)
+
+    def test_sequence_render_lookups(self):
+        ccx_provider, self_paced_provider = [
+            resolve_dotted(name) for name in settings.MODULESTORE_FIELD_OVERRIDE_PROVIDERS
+        ]
+        ccx_lookups, self_paced_lookups = set(), set()
+
+        with self.record_lookups(ccx_provider, ccx_lookups):
+            with self.record_lookups(self_paced_provider, self_paced_lookups):
+                self.render_sequence()
+
+        # Only the fields reported up front by each provider are looked up.
+        self.assertLessEqual(ccx_lookups, {'course_edit_method', 'display_name'})
+        self.assertLessEqual(self_paced_lookups, {'due', 'start'})
+        self.assertIn('start', self_paced_lookups)
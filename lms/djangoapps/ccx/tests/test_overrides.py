@@ -2,6 +2,7 @@
 """
 tests for overrides
 """
+import copy
 import datetime
 import mock
 import pytz
@@ -11,6 +12,7 @@ from ccx_keys.locator import CCXLocator
 from courseware.courses import get_course_by_id
 from courseware.field_overrides import OverrideFieldData
 from courseware.testutils import FieldOverrideTestMixin
+from django.core.cache import cache
 from django.test.utils import override_settings
 from lms.djangoapps.courseware.tests.test_field_overrides import inject_field_overrides
 from request_cache.middleware import RequestCache
@@ -20,8 +22,10 @@ from xmodule.modulestore.tests.django_utils import (
     TEST_DATA_SPLIT_MODULESTORE)
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 
+from lms.djangoapps.ccx.middleware import CcxOverridesVersionMiddleware
 from lms.djangoapps.ccx.models import CustomCourseForEdX
-from lms.djangoapps.ccx.overrides import override_field_for_ccx
+from lms.djangoapps.ccx import overrides
+from lms.djangoapps.ccx.overrides import get_override_for_ccx, override_field_for_ccx
 
 from lms.djangoapps.ccx.tests.utils import flatten, iter_blocks
 
@@ -151,6 +155,56 @@ class TestFieldOverrides(FieldOverrideTestMixin, SharedModuleStoreTestCase):
         with self.assertNumQueries(6):
             override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
 
+    def test_overrides_reused_across_requests(self):
+        """
+        Test that overrides loaded in one request are served from the shared
+        cache in the next, and are reloaded once they change.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        new_ccx_start = datetime.datetime(2015, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+
+        RequestCache.clear_request_cache()
+        self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), ccx_start)
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(0):
+            self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), ccx_start)
+
+        override_field_for_ccx(self.ccx, chapter, 'start', new_ccx_start)
+        RequestCache.clear_request_cache()
+        self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), new_ccx_start)
+
+    def test_overrides_reloaded_after_commit(self):
+        """
+        Test that overrides cached by a concurrent request before the
+        transaction which changes them is committed are reloaded once it is.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        new_ccx_start = datetime.datetime(2015, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        CcxOverridesVersionMiddleware().process_response(None, None)
+        RequestCache.clear_request_cache()
+        committed_overrides = copy.deepcopy(overrides._get_overrides_for_ccx(self.ccx))  # pylint: disable=protected-access
+        RequestCache.clear_request_cache()
+
+        override_field_for_ccx(self.ccx, chapter, 'start', new_ccx_start)
+        # A concurrent request caches the committed overrides under the new version
+        cache.set(
+            u'ccx-overrides.{}.{}'.format(
+                self.ccx.id, overrides._get_ccx_overrides_version(self.ccx)  # pylint: disable=protected-access
+            ),
+            committed_overrides
+        )
+        RequestCache.clear_request_cache()
+        self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), ccx_start)
+
+        # The transaction is committed, then the response is processed
+        CcxOverridesVersionMiddleware().process_response(None, None)
+        RequestCache.clear_request_cache()
+        self.assertEquals(get_override_for_ccx(self.ccx, chapter, 'start'), new_ccx_start)
+
     def test_override_is_inherited(self):
         """
         Test that sequentials inherit overridden start date from chapter.
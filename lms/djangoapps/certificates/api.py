@@ -164,6 +164,48 @@ def generate_user_certificates(student, course_key, course=None, insecure=False,
     if cert is None:
         return
 
+    _emit_certificate_created_event(student, course_key, course, cert, generation_mode)
+    return cert.status
+
+
+def generate_user_certificates_in_bulk(students, course_key, course=None, insecure=False, generation_mode='batch',
+                                       forced_grade=None):
+    """
+    Bulk version of `generate_user_certificates`, which adds the add-cert
+    requests of many students of the course into the xqueue at once.  See
+    `XQueueCertInterface.add_certs`.
+
+    Returns a dict mapping the id of each student to the status of their
+    certificate, or to None if no certificate could be requested for them.
+    """
+    xqueue = XQueueCertInterface()
+    if insecure:
+        xqueue.use_https = False
+    generate_pdf = not has_html_certificates_enabled(course_key, course)
+    certs = xqueue.add_certs(
+        students,
+        course_key,
+        course=course,
+        generate_pdf=generate_pdf,
+        forced_grade=forced_grade
+    )
+
+    statuses = {}
+    for student in students:
+        cert = certs[student.id]
+        if cert is None:
+            statuses[student.id] = None
+            continue
+
+        _emit_certificate_created_event(student, course_key, course, cert, generation_mode)
+        statuses[student.id] = cert.status
+    return statuses
+
+
+def _emit_certificate_created_event(student, course_key, course, cert, generation_mode):
+    """
+    Emits the `edx.certificate.created` event if the student passed the course.
+    """
     if CertificateStatuses.is_passing_status(cert.status):
         emit_certificate_event('created', student, course_key, course, {
             'user_id': student.id,
@@ -172,7 +214,6 @@ def generate_user_certificates(student, course_key, course=None, insecure=False,
             'enrollment_mode': cert.mode,
             'generation_mode': generation_mode
         })
-    return cert.status
 
 
 def regenerate_user_certificates(student, course_key, course=None,
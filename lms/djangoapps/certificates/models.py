@@ -53,7 +53,7 @@ import os
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
+from django.db import IntegrityError, models, transaction
 from django.db.models import Count
 from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
@@ -258,6 +258,18 @@ class GeneratedCertificate(models.Model):
 
         return None
 
+    @classmethod
+    def certificates_for_student(cls, student, course_ids):
+        """
+        This returns the certificates of a student in several courses with a
+        single query, as a dict mapping course ids to certificates. Courses
+        the student has no certificate in are not included.
+        """
+        return {
+            certificate.course_id: certificate
+            for certificate in cls.objects.filter(user=student, course_id__in=list(course_ids))
+        }
+
     @classmethod
     def get_unique_statuses(cls, course_key=None, flat=False):
         """
@@ -314,6 +326,13 @@ class GeneratedCertificate(models.Model):
         signal iff we are saving a record of a learner passing the course.
         """
         super(GeneratedCertificate, self).save(*args, **kwargs)
+        self._send_cert_awarded_signal()
+
+    def _send_cert_awarded_signal(self):
+        """
+        Fire the COURSE_CERT_AWARDED signal if this is a record of a learner
+        passing the course.
+        """
         if CertificateStatuses.is_passing_status(self.status):
             COURSE_CERT_AWARDED.send_robust(
                 sender=self.__class__,
@@ -323,6 +342,47 @@ class GeneratedCertificate(models.Model):
                 status=self.status,
             )
 
+    @classmethod
+    def bulk_create_for_course(cls, course_id, certificates):
+        """
+        Insert the given new certificates of the course with a single query,
+        then fire the COURSE_CERT_AWARDED signal for the passing ones, as
+        save() would.  The ids of the certificates are set afterwards.
+
+        If some of the certificates were created concurrently, falls back to
+        saving each certificate over any existing record, keeping the
+        creation date of the record.
+        """
+        if not certificates:
+            return
+
+        try:
+            with transaction.atomic():
+                cls.objects.bulk_create(certificates)
+        except IntegrityError:
+            update_fields = [
+                field.name for field in cls._meta.concrete_fields  # pylint: disable=no-member
+                if field.name not in ('id', 'created_date')
+            ]
+            for certificate in certificates:
+                existing_certificate = cls.objects.get_or_create(user_id=certificate.user_id, course_id=course_id)[0]
+                certificate.id = existing_certificate.id
+                certificate.created_date = existing_certificate.created_date
+                certificate._state.adding = False  # pylint: disable=protected-access
+                certificate.save(update_fields=update_fields)
+            return
+
+        # bulk_create() only sets the ids of the new rows on some databases.
+        certificates_by_user = {certificate.user_id: certificate for certificate in certificates}
+        ids = cls.objects.filter(
+            course_id=course_id, user_id__in=certificates_by_user.keys()
+        ).values_list('user_id', 'id')
+        for user_id, certificate_id in ids:
+            certificates_by_user[user_id].id = certificate_id
+        for certificate in certificates:
+            certificate._state.adding = False  # pylint: disable=protected-access
+            certificate._send_cert_awarded_signal()  # pylint: disable=protected-access
+
 
 class CertificateGenerationHistory(TimeStampedModel):
     """
@@ -498,42 +558,88 @@ def certificate_status_for_student(student, course_id):
     If the student has been graded, the dictionary also contains their
     grade for the course with the key "grade".
     '''
-    # Import here instead of top of file since this module gets imported before
-    # the course_modes app is loaded, resulting in a Django deprecation warning.
-    from course_modes.models import CourseMode
-
     try:
         generated_certificate = GeneratedCertificate.objects.get(  # pylint: disable=no-member
             user=student, course_id=course_id)
-        cert_status = {
-            'status': generated_certificate.status,
-            'mode': generated_certificate.mode,
-            'uuid': generated_certificate.verify_uuid,
-        }
-        if generated_certificate.grade:
-            cert_status['grade'] = generated_certificate.grade
+    except GeneratedCertificate.DoesNotExist:
+        return _unavailable_certificate_status()
+    return _certificate_status(generated_certificate)
+
 
-        if generated_certificate.mode == 'audit':
-            course_mode_slugs = [mode.slug for mode in CourseMode.modes_for_course(course_id)]
-            # Short term fix to make sure old audit users with certs still see their certs
-            # only do this if there if no honor mode
-            if 'honor' not in course_mode_slugs:
-                cert_status['status'] = CertificateStatuses.auditing
-                return cert_status
+def certificate_statuses_for_students(user_ids, course_id):
+    """
+    Returns the certificate status of each of the given users, as returned
+    by certificate_status_for_student, with a single query.
 
-        if generated_certificate.status == CertificateStatuses.downloadable:
-            cert_status['download_url'] = generated_certificate.download_url
+    Returns a dict mapping each user id to a certificate status dictionary.
+    """
+    user_ids = list(user_ids)
+    generated_certificates = GeneratedCertificate.objects.filter(  # pylint: disable=no-member
+        user_id__in=user_ids, course_id=course_id)
+    statuses = {
+        generated_certificate.user_id: _certificate_status(generated_certificate)
+        for generated_certificate in generated_certificates
+    }
+    for user_id in user_ids:
+        if user_id not in statuses:
+            statuses[user_id] = _unavailable_certificate_status()
+    return statuses
 
-        return cert_status
 
-    except GeneratedCertificate.DoesNotExist:
-        pass
+def certificate_status_for_certificate(generated_certificate):
+    """
+    Returns the certificate status of an already loaded GeneratedCertificate,
+    as returned by certificate_status_for_student, or the status of an
+    unavailable certificate if `generated_certificate` is None.
+    """
+    if generated_certificate is None:
+        return _unavailable_certificate_status()
+    return _certificate_status(generated_certificate)
+
+
+def _unavailable_certificate_status():
+    """
+    Returns the status dictionary for a student who has no certificate.
+    """
     return {'status': CertificateStatuses.unavailable, 'mode': GeneratedCertificate.MODES.honor, 'uuid': None}
 
 
-def certificate_info_for_user(user, course_id, grade, user_is_whitelisted=None):
+def _certificate_status(generated_certificate):
+    """
+    Returns the status dictionary for the given GeneratedCertificate (see certificate_status_for_student).
+    """
+    # Import here instead of top of file since this module gets imported before
+    # the course_modes app is loaded, resulting in a Django deprecation warning.
+    from course_modes.models import CourseMode
+
+    cert_status = {
+        'status': generated_certificate.status,
+        'mode': generated_certificate.mode,
+        'uuid': generated_certificate.verify_uuid,
+    }
+    if generated_certificate.grade:
+        cert_status['grade'] = generated_certificate.grade
+
+    if generated_certificate.mode == 'audit':
+        course_mode_slugs = [mode.slug for mode in CourseMode.modes_for_course(generated_certificate.course_id)]
+        # Short term fix to make sure old audit users with certs still see their certs
+        # only do this if there if no honor mode
+        if 'honor' not in course_mode_slugs:
+            cert_status['status'] = CertificateStatuses.auditing
+            return cert_status
+
+    if generated_certificate.status == CertificateStatuses.downloadable:
+        cert_status['download_url'] = generated_certificate.download_url
+
+    return cert_status
+
+
+def certificate_info_for_user(user, course_id, grade, user_is_whitelisted=None, certificate_status=None):
     """
     Returns the certificate info for a user for grade report.
+
+    `certificate_status` may be passed in if it has already been fetched,
+    e.g. with certificate_statuses_for_students.
     """
     if user_is_whitelisted is None:
         user_is_whitelisted = CertificateWhitelist.objects.filter(
@@ -545,7 +651,8 @@ def certificate_info_for_user(user, course_id, grade, user_is_whitelisted=None):
     eligible_for_certificate = 'Y' if (user_is_whitelisted or grade is not None) and user.profile.allow_certificate \
         else 'N'
 
-    certificate_status = certificate_status_for_student(user, course_id)
+    if certificate_status is None:
+        certificate_status = certificate_status_for_student(user, course_id)
     certificate_generated = certificate_status['status'] == CertificateStatuses.downloadable
     if certificate_generated:
         certificate_is_delivered = 'Y'
@@ -3,7 +3,9 @@ import json
 import random
 import logging
 import lxml.html
+from datetime import datetime
 from lxml.etree import XMLSyntaxError, ParserError
+from pytz import UTC
 from uuid import uuid4
 
 from django.test.client import RequestFactory
@@ -23,6 +25,7 @@ from certificates.models import (
     CertificateStatuses,
     GeneratedCertificate,
     certificate_status_for_student,
+    certificate_statuses_for_students,
     CertificateStatuses as status,
     CertificateWhitelist,
     ExampleCertificate
@@ -104,7 +107,6 @@ class XQueueCertInterface(object):
             requests_auth,
         )
         self.whitelist = CertificateWhitelist.objects.all()
-        self.restricted = UserProfile.objects.filter(allow_certificate=False)
         self.use_https = True
 
     def regen_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
@@ -183,7 +185,6 @@ class XQueueCertInterface(object):
 
         raise NotImplementedError
 
-    # pylint: disable=too-many-statements
     def add_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
         """
         Request a new certificate for a student.
@@ -214,6 +215,130 @@ class XQueueCertInterface(object):
         Returns the newly created certificate instance
         """
 
+        cert_status = certificate_status_for_student(student, course_id)['status']
+        if not self._can_add_cert(student, course_id, cert_status):
+            return None
+
+        # The caller can optionally pass a course in to avoid
+        # re-fetching it from Mongo. If they have not provided one,
+        # get it from the modulestore.
+        if course is None:
+            course = modulestore().get_course(course_id, depth=0)
+
+        profile = UserProfile.objects.get(user=student)
+
+        is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
+        grade = self._grade(student, course)
+        enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
+        user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
+        course_has_honor_mode = (
+            enrollment_mode in GeneratedCertificate.VERIFIED_CERTS_MODES and
+            not user_is_verified and
+            bool(CourseMode.mode_for_course(course_id, CourseMode.HONOR))
+        )
+
+        cert, __ = GeneratedCertificate.objects.get_or_create(user=student, course_id=course_id)  # pylint: disable=no-member
+        contents = self._update_cert(
+            cert, student, course, grade, profile,
+            enrollment_mode=enrollment_mode,
+            is_whitelisted=is_whitelisted,
+            user_is_verified=user_is_verified,
+            course_has_honor_mode=course_has_honor_mode,
+            forced_grade=forced_grade,
+            template_file=template_file,
+            generate_pdf=generate_pdf,
+        )
+        cert.save()
+
+        if contents is not None and generate_pdf:
+            self._queue_cert(cert, student, contents)
+        return cert
+
+    def add_certs(self, students, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
+        """
+        Request new certificates for many students of a course at once.
+
+        Behaves as calling `add_cert` for each of the students, except that
+        their certificates, profiles, whitelist entries, enrollment modes and
+        ID verifications are loaded with a single query each, the missing
+        certificate records are inserted together, and the certificate
+        generation tasks are sent to the XQueue once all the records are
+        written.
+
+        Returns a dict mapping the id of each student to their certificate,
+        or to None if no certificate could be requested for them.
+        """
+        students = list(students)
+        user_ids = [student.id for student in students]
+
+        if course is None:
+            course = modulestore().get_course(course_id, depth=0)
+
+        cert_statuses = certificate_statuses_for_students(user_ids, course_id)
+        existing_certs = {
+            cert.user_id: cert
+            for cert in GeneratedCertificate.objects.filter(user_id__in=user_ids, course_id=course_id)  # pylint: disable=no-member
+        }
+        profiles = {profile.user_id: profile for profile in UserProfile.objects.filter(user_id__in=user_ids)}
+        whitelisted_user_ids = set(self.whitelist.filter(
+            user_id__in=user_ids, course_id=course_id, whitelist=True
+        ).values_list('user_id', flat=True))
+        enrollment_modes = CourseEnrollment.enrollment_modes_for_users(user_ids, course_id)
+        verified_user_ids = SoftwareSecurePhotoVerification.verified_user_ids(user_ids)
+        course_has_honor_mode = None
+
+        certs = {}
+        new_certs = []
+        generation_contents = []
+        for student in students:
+            certs[student.id] = None
+            if not self._can_add_cert(student, course_id, cert_statuses[student.id]['status']):
+                continue
+
+            profile = profiles.get(student.id)
+            if profile is None:
+                raise UserProfile.DoesNotExist(u"User {} has no profile.".format(student.id))
+
+            grade = self._grade(student, course)
+            enrollment_mode = enrollment_modes.get(student.id, (None, None))[0]
+            user_is_verified = student.id in verified_user_ids
+            if course_has_honor_mode is None and (
+                    enrollment_mode in GeneratedCertificate.VERIFIED_CERTS_MODES and not user_is_verified
+            ):
+                course_has_honor_mode = bool(CourseMode.mode_for_course(course_id, CourseMode.HONOR))
+
+            cert = existing_certs.get(student.id)
+            if cert is None:
+                cert = GeneratedCertificate(user=student, course_id=course_id, created_date=datetime.now(UTC))
+                new_certs.append(cert)
+
+            contents = self._update_cert(
+                cert, student, course, grade, profile,
+                enrollment_mode=enrollment_mode,
+                is_whitelisted=student.id in whitelisted_user_ids,
+                user_is_verified=user_is_verified,
+                course_has_honor_mode=bool(course_has_honor_mode),
+                forced_grade=forced_grade,
+                template_file=template_file,
+                generate_pdf=generate_pdf,
+            )
+            if cert.id is not None:
+                cert.save()
+            certs[student.id] = cert
+            if contents is not None and generate_pdf:
+                generation_contents.append((cert, student, contents))
+
+        GeneratedCertificate.bulk_create_for_course(course_id, new_certs)
+
+        for cert, student, contents in generation_contents:
+            self._queue_cert(cert, student, contents)
+        return certs
+
+    def _can_add_cert(self, student, course_id, cert_status):
+        """
+        Returns whether a new certificate may be requested for the student,
+        given the status of their current certificate, if any.
+        """
         valid_statuses = [
             status.generating,
             status.unavailable,
@@ -226,9 +351,6 @@ class XQueueCertInterface(object):
             status.audit_notpassing,
         ]
 
-        cert_status = certificate_status_for_student(student, course_id)['status']
-        cert = None
-
         if cert_status not in valid_statuses:
             LOGGER.warning(
                 (
@@ -241,26 +363,34 @@ class XQueueCertInterface(object):
                 cert_status,
                 unicode(valid_statuses)
             )
-            return None
-
-        # The caller can optionally pass a course in to avoid
-        # re-fetching it from Mongo. If they have not provided one,
-        # get it from the modulestore.
-        if course is None:
-            course = modulestore().get_course(course_id, depth=0)
-
-        profile = UserProfile.objects.get(user=student)
-        profile_name = profile.name
+            return False
+        return True
 
+    def _grade(self, student, course):
+        """
+        Returns the grade summary of the student for the course.
+        """
         # Needed for access control in grading.
         self.request.user = student
         self.request.session = {}
 
-        is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
-        grade = course_grades.summary(student, course)
-        enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
+        return course_grades.summary(student, course)
+
+    # pylint: disable=too-many-statements
+    def _update_cert(
+            self, cert, student, course, grade, profile, enrollment_mode, is_whitelisted,
+            user_is_verified, course_has_honor_mode, forced_grade, template_file, generate_pdf,
+    ):
+        """
+        Updates the given certificate of the student, without saving it,
+        according to their grade, profile, enrollment mode, whitelisting and
+        ID verification (see `add_cert`).
+
+        Returns the contents of the certificate generation task to send to
+        the XQueue if the certificate is to be generated, None otherwise.
+        """
+        course_id = cert.course_id
         mode_is_verified = enrollment_mode in GeneratedCertificate.VERIFIED_CERTS_MODES
-        user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
         cert_mode = enrollment_mode
         is_eligible_for_certificate = is_whitelisted or CourseMode.is_eligible_for_certificate(enrollment_mode)
         unverified = False
@@ -274,7 +404,7 @@ class XQueueCertInterface(object):
             template_pdf = "certificate-template-{id.org}-{id.course}-verified.pdf".format(id=course_id)
         elif mode_is_verified and not user_is_verified:
             template_pdf = "certificate-template-{id.org}-{id.course}.pdf".format(id=course_id)
-            if CourseMode.mode_for_course(course_id, CourseMode.HONOR):
+            if course_has_honor_mode:
                 cert_mode = GeneratedCertificate.MODES.honor
             else:
                 unverified = True
@@ -299,13 +429,10 @@ class XQueueCertInterface(object):
             mode_is_verified
         )
 
-        cert, created = GeneratedCertificate.objects.get_or_create(user=student, course_id=course_id)  # pylint: disable=no-member
-
         cert.mode = cert_mode
         cert.user = student
         cert.grade = grade['percent']
-        cert.course_id = course_id
-        cert.name = profile_name
+        cert.name = profile.name
         cert.download_url = ''
 
         # Strip HTML from grade range label
@@ -347,17 +474,15 @@ class XQueueCertInterface(object):
         cutoff = settings.AUDIT_CERT_CUTOFF_DATE
         if (cutoff and cert.created_date >= cutoff) and not is_eligible_for_certificate:
             cert.status = CertificateStatuses.audit_passing if passing else CertificateStatuses.audit_notpassing
-            cert.save()
             LOGGER.info(
                 u"Student %s with enrollment mode %s is not eligible for a certificate.",
                 student.id,
                 enrollment_mode
             )
-            return cert
+            return None
         # If they are not passing, short-circuit and don't generate cert
         elif not passing:
             cert.status = status.notpassing
-            cert.save()
 
             LOGGER.info(
                 (
@@ -369,14 +494,13 @@ class XQueueCertInterface(object):
                 unicode(course_id),
                 cert.status
             )
-            return cert
+            return None
 
         # Check to see whether the student is on the the embargoed
         # country restricted list. If so, they should not receive a
         # certificate -- set their status to restricted and log it.
-        if self.restricted.filter(user=student).exists():
+        if not profile.allow_certificate:
             cert.status = status.restricted
-            cert.save()
 
             LOGGER.info(
                 (
@@ -389,11 +513,10 @@ class XQueueCertInterface(object):
                 cert.status,
                 unicode(course_id)
             )
-            return cert
+            return None
 
         if unverified:
             cert.status = status.unverified
-            cert.save()
             LOGGER.info(
                 (
                     u"User %s has a verified enrollment in course %s "
@@ -403,20 +526,21 @@ class XQueueCertInterface(object):
                 student.id,
                 unicode(course_id),
             )
-            return cert
+            return None
 
-        # Finally, generate the certificate and send it off.
-        return self._generate_cert(cert, course, student, grade_contents, template_pdf, generate_pdf)
+        # Finally, generate the certificate.
+        return self._prepare_cert_generation(cert, course, student, grade_contents, template_pdf, generate_pdf)
 
-    def _generate_cert(self, cert, course, student, grade_contents, template_pdf, generate_pdf):
+    def _prepare_cert_generation(self, cert, course, student, grade_contents, template_pdf, generate_pdf):
         """
-        Generate a certificate for the student. If `generate_pdf` is True,
-        sends a request to XQueue.
+        Marks the certificate of the student as being generated, or as
+        downloadable if `generate_pdf` is False, without saving it.
+
+        Returns the contents of the certificate generation task.
         """
         course_id = unicode(course.id)
 
-        key = make_hashkey(random.random())
-        cert.key = key
+        cert.key = make_hashkey(random.random())
         contents = {
             'action': 'create',
             'username': student.username,
@@ -431,35 +555,37 @@ class XQueueCertInterface(object):
         else:
             cert.status = status.downloadable
             cert.verify_uuid = uuid4().hex
+        return contents
 
-        cert.save()
-
-        if generate_pdf:
-            try:
-                self._send_to_xqueue(contents, key)
-            except XQueueAddToQueueError as exc:
-                cert.status = ExampleCertificate.STATUS_ERROR
-                cert.error_reason = unicode(exc)
-                cert.save()
-                LOGGER.critical(
-                    (
-                        u"Could not add certificate task to XQueue.  "
-                        u"The course was '%s' and the student was '%s'."
-                        u"The certificate task status has been marked as 'error' "
-                        u"and can be re-submitted with a management command."
-                    ), course_id, student.id
-                )
-            else:
-                LOGGER.info(
-                    (
-                        u"The certificate status has been set to '%s'.  "
-                        u"Sent a certificate grading task to the XQueue "
-                        u"with the key '%s'. "
-                    ),
-                    cert.status,
-                    key
-                )
-        return cert
+    def _queue_cert(self, cert, student, contents):
+        """
+        Sends the generation task of the saved certificate of the student to
+        the XQueue, marking the certificate with an error if that fails.
+        """
+        try:
+            self._send_to_xqueue(contents, cert.key)
+        except XQueueAddToQueueError as exc:
+            cert.status = ExampleCertificate.STATUS_ERROR
+            cert.error_reason = unicode(exc)
+            cert.save()
+            LOGGER.critical(
+                (
+                    u"Could not add certificate task to XQueue.  "
+                    u"The course was '%s' and the student was '%s'."
+                    u"The certificate task status has been marked as 'error' "
+                    u"and can be re-submitted with a management command."
+                ), contents['course_id'], student.id
+            )
+        else:
+            LOGGER.info(
+                (
+                    u"The certificate status has been set to '%s'.  "
+                    u"Sent a certificate grading task to the XQueue "
+                    u"with the key '%s'. "
+                ),
+                cert.status,
+                cert.key
+            )
 
     def add_example_cert(self, example_cert):
         """Add a task to create an example certificate.
@@ -134,6 +134,36 @@ class XQueueCertInterfaceAddCertificateTest(ModuleStoreTestCase):
         self.assertIsNotNone(certificate)
         self.assertEqual(certificate.mode, 'audit')
 
+    def test_add_certs(self):
+        """
+        Test that the certificates of several students are requested
+        together, both for new and existing certificate records.
+        """
+        CourseEnrollmentFactory(
+            user=self.user_2,
+            course_id=self.course.id,
+            is_active=True,
+            mode='verified'
+        )
+        GeneratedCertificateFactory(
+            user=self.user,
+            course_id=self.course.id,
+            status=CertificateStatuses.notpassing,
+        )
+
+        with mock_passing_grade():
+            with patch.object(XQueueInterface, 'send_to_queue') as mock_send:
+                mock_send.return_value = (0, None)
+                certs = self.xqueue.add_certs([self.user, self.user_2], self.course.id)
+
+        self.assertEqual(mock_send.call_count, 2)
+        for user, mode in ((self.user, 'honor'), (self.user_2, 'verified')):
+            certificate = GeneratedCertificate.eligible_certificates.get(user=user, course_id=self.course.id)
+            self.assertEqual(certificate.id, certs[user.id].id)
+            self.assertEqual(certificate.status, CertificateStatuses.generating)
+            self.assertEqual(certificate.mode, mode)
+            self.assertEqual(certificate.key, certs[user.id].key)
+
     def add_cert_to_queue(self, mode):
         """
         Dry method for course enrollment and adding request to
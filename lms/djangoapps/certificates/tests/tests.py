@@ -1,10 +1,12 @@
 """
 Tests for the certificates models.
 """
+from datetime import datetime, timedelta
 from ddt import ddt, data, unpack
 from mock import patch
 from django.conf import settings
 from nose.plugins.attrib import attr
+import pytz
 
 from badges.tests.factories import CourseCompleteImageConfigurationFactory
 from xmodule.modulestore.tests.factories import CourseFactory
@@ -15,6 +17,7 @@ from certificates.models import (
     CertificateStatuses,
     GeneratedCertificate,
     certificate_status_for_student,
+    certificate_statuses_for_students,
     certificate_info_for_user
 )
 from certificates.tests.factories import GeneratedCertificateFactory
@@ -41,6 +44,49 @@ class CertificatesModelTest(ModuleStoreTestCase, MilestonesTestCaseMixin):
         self.assertEqual(certificate_status['status'], CertificateStatuses.unavailable)
         self.assertEqual(certificate_status['mode'], GeneratedCertificate.MODES.honor)
 
+    def test_certificate_statuses_for_students(self):
+        students = [UserFactory() for __ in range(4)]
+        course = CourseFactory.create(org='edx', number='verified', display_name='Verified Course')
+        GeneratedCertificateFactory.create(
+            user=students[0], course_id=course.id, status=CertificateStatuses.downloadable,
+            mode='honor', grade='0.9', download_url='http://www.example.com/certificate.pdf'
+        )
+        GeneratedCertificateFactory.create(
+            user=students[1], course_id=course.id, status=CertificateStatuses.downloadable, mode='audit'
+        )
+        GeneratedCertificateFactory.create(
+            user=students[2], course_id=course.id, status=CertificateStatuses.notpassing, mode='verified'
+        )
+
+        certificate_statuses = certificate_statuses_for_students([student.id for student in students], course.id)
+        self.assertEqual(certificate_statuses, {
+            student.id: certificate_status_for_student(student, course.id) for student in students
+        })
+        self.assertEqual(certificate_statuses[students[1].id]['status'], CertificateStatuses.auditing)
+        self.assertEqual(certificate_statuses[students[3].id]['status'], CertificateStatuses.unavailable)
+
+    def test_bulk_create_for_course_existing_certificate(self):
+        students = [UserFactory() for __ in range(2)]
+        course = CourseFactory.create(org='edx', number='verified', display_name='Verified Course')
+        existing_certificate = GeneratedCertificateFactory.create(
+            user=students[0], course_id=course.id, status=CertificateStatuses.generating
+        )
+        created_date = datetime.now(pytz.UTC).replace(microsecond=0) - timedelta(days=1)
+        GeneratedCertificate.objects.filter(id=existing_certificate.id).update(created_date=created_date)
+
+        # The certificate of the first student was created after they were looked up
+        GeneratedCertificate.bulk_create_for_course(course.id, [
+            GeneratedCertificate(user=student, course_id=course.id, status=CertificateStatuses.notpassing)
+            for student in students
+        ])
+
+        certificates = GeneratedCertificate.objects.filter(course_id=course.id).order_by('user_id')
+        self.assertEqual(len(certificates), 2)
+        self.assertEqual(certificates[0].id, existing_certificate.id)
+        self.assertEqual(certificates[0].created_date, created_date)
+        for certificate in certificates:
+            self.assertEqual(certificate.status, CertificateStatuses.notpassing)
+
     @unpack
     @data(
         {'allow_certificate': False, 'whitelisted': False, 'grade': None, 'output': ['N', 'N', 'N/A']},
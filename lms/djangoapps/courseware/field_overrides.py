@@ -26,8 +26,11 @@ from xmodule.modulestore.inheritance import InheritanceMixin
 
 
 NOTSET = object()
+# Not a sentinel object, as this module may be imported under two names.
+ALL_BLOCKS = u'all-blocks'
 ENABLED_OVERRIDE_PROVIDERS_KEY = u'courseware.field_overrides.enabled_providers.{course_id}'
 ENABLED_MODULESTORE_OVERRIDE_PROVIDERS_KEY = u'courseware.modulestore_field_overrides.enabled_providers.{course_id}'
+OVERRIDE_LOOKUP_PLANS_KEY = u'courseware.field_overrides.lookup_plans'
 
 
 def resolve_dotted(name):
@@ -90,6 +93,24 @@ def overrides_disabled():
     return bool(_OVERRIDES_DISABLED.disabled)
 
 
+def clear_override_lookup_plans():
+    """
+    Discards the lookup plans computed during the current request.  Must be
+    called whenever an override is set or cleared, so that subsequent field
+    lookups take it into account.  See `FieldOverrideProvider.overridden_fields`.
+    """
+    RequestCache.get_request_cache().data.pop(OVERRIDE_LOOKUP_PLANS_KEY, None)
+
+
+def lookup_plan_block_key(location):
+    """
+    Returns the key identifying the block at the given location in a lookup
+    plan.  Block types and ids are stable across branches, versions and CCXs
+    of a course.
+    """
+    return (location.block_type, location.block_id)
+
+
 class FieldOverrideProvider(object):
     """
     Abstract class which defines the interface that a `FieldOverrideProvider`
@@ -130,6 +151,58 @@ class FieldOverrideProvider(object):
         """
         return False
 
+    def overridden_fields(self, course_key):
+        """
+        Describe up front which fields this provider may override in the
+        course identified by `course_key`, so that lookups of other fields
+        can skip the provider altogether.
+
+        Returns a dictionary mapping the name of each such field to either
+        the set of `(block_type, block_id)` pairs of the blocks it may be
+        overridden for, or `ALL_BLOCKS`.  Returns `None`, the default, if the
+        provider can't tell in advance, in which case it is consulted for
+        every field lookup.
+        """
+        return None
+
+
+class _OverrideLookupPlan(object):
+    """
+    The fields that each of the providers for a course may override for a
+    user, as reported by `FieldOverrideProvider.overridden_fields`.
+    """
+    def __init__(self, providers, course_key):
+        self.provider_fields = tuple(provider.overridden_fields(course_key) for provider in providers)
+        if any(fields is None for fields in self.provider_fields):
+            self.field_names = None
+        else:
+            self.field_names = frozenset(name for fields in self.provider_fields for name in fields)
+
+    def may_override(self, name):
+        """
+        Returns whether any provider may override the field named `name` on
+        any block of the course.
+        """
+        return self.field_names is None or name in self.field_names
+
+    def providers_for(self, providers, block, name):
+        """
+        Yields the providers, out of `providers`, that may override the field
+        named `name` in `block`.
+        """
+        block_key = None
+        for provider, fields in zip(providers, self.provider_fields):
+            if fields is not None:
+                blocks = fields.get(name)
+                if blocks is None:
+                    continue
+                if blocks != ALL_BLOCKS:
+                    if block_key is None:
+                        block_key = lookup_plan_block_key(block.location)
+                    if block_key not in blocks:
+                        continue
+            yield provider
+
 
 class OverrideFieldData(FieldData):
     """
@@ -197,15 +270,53 @@ class OverrideFieldData(FieldData):
 
     def __init__(self, user, fallback, providers):
         self.fallback = fallback
+        self.user_id = getattr(user, 'id', None)
         self.providers = tuple(provider(user) for provider in providers)
 
+    def _get_lookup_plan(self, block):
+        """
+        Returns the lookup plan of the providers for the course of `block`,
+        computed once per course and user per request, or `None` if the
+        block has no location to tell the course by.
+        """
+        location = getattr(block, 'location', None)
+        if location is None:
+            return None
+
+        course_key = location.course_key
+        if hasattr(course_key, 'version_agnostic'):
+            course_key = course_key.for_branch(None).version_agnostic()
+
+        lookup_plans = RequestCache.get_request_cache().data.setdefault(OVERRIDE_LOOKUP_PLANS_KEY, {})
+        plan_key = (self.__class__.__name__, unicode(course_key), self.user_id)
+        lookup_plan = lookup_plans.get(plan_key)
+        if lookup_plan is None:
+            lookup_plan = lookup_plans[plan_key] = _OverrideLookupPlan(self.providers, course_key)
+        return lookup_plan
+
+    def _may_override(self, block, name):
+        """
+        Returns whether any provider may override the field named `name` on
+        some block of the course of `block`.
+        """
+        lookup_plan = self._get_lookup_plan(block)
+        return lookup_plan is None or lookup_plan.may_override(name)
+
     def get_override(self, block, name):
         """
         Checks for an override for the field identified by `name` in `block`.
         Returns the overridden value or `NOTSET` if no override is found.
         """
         if not overrides_disabled():
-            for provider in self.providers:
+            lookup_plan = self._get_lookup_plan(block)
+            if lookup_plan is None:
+                providers = self.providers
+            elif lookup_plan.may_override(name):
+                providers = lookup_plan.providers_for(self.providers, block, name)
+            else:
+                return NOTSET
+
+            for provider in providers:
                 value = provider.get(block, name, NOTSET)
                 if value is not NOTSET:
                     return value
@@ -233,7 +344,7 @@ class OverrideFieldData(FieldData):
             # then we want to return False here, so the field_data uses the
             # override and not the original value for this block.
             inheritable = InheritanceMixin.fields.keys()
-            if name in inheritable:
+            if name in inheritable and self._may_override(block, name):
                 for ancestor in _lineage(block):
                     if self.get_override(ancestor, name) is not NOTSET:
                         return False
@@ -248,7 +359,7 @@ class OverrideFieldData(FieldData):
         # also handle inheritance.
         if self.providers and not overrides_disabled():
             inheritable = InheritanceMixin.fields.keys()
-            if name in inheritable:
+            if name in inheritable and self._may_override(block, name):
                 for ancestor in _lineage(block):
                     value = self.get_override(ancestor, name)
                     if value is not NOTSET:
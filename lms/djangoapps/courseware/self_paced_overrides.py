@@ -3,7 +3,7 @@ Field overrides for self-paced courses. This allows overriding due
 dates for each block in the course.
 """
 
-from .field_overrides import FieldOverrideProvider
+from .field_overrides import ALL_BLOCKS, FieldOverrideProvider
 from openedx.core.djangoapps.self_paced.models import SelfPacedConfiguration
 
 
@@ -23,6 +23,10 @@ class SelfPacedDateOverrideProvider(FieldOverrideProvider):
 
         return default
 
+    def overridden_fields(self, course_key):
+        """Due and release dates may be removed from any block."""
+        return {'due': ALL_BLOCKS, 'start': ALL_BLOCKS}
+
     @classmethod
     def enabled_for(cls, block):
         """This provider is enabled for self-paced courses only."""
@@ -4,7 +4,10 @@ by the individual due dates feature.
 """
 import json
 
-from .field_overrides import FieldOverrideProvider
+from opaque_keys.edx.keys import UsageKey
+from request_cache.middleware import RequestCache
+
+from .field_overrides import FieldOverrideProvider, clear_override_lookup_plans, lookup_plan_block_key
 from .models import StudentFieldOverride
 
 
@@ -17,6 +20,18 @@ class IndividualStudentOverrideProvider(FieldOverrideProvider):
     def get(self, block, name, default):
         return get_override_for_user(self.user, block, name, default)
 
+    def overridden_fields(self, course_key):
+        """
+        Returns the fields overridden for the user in the course, loaded with
+        all of the user's overrides in the course.
+        """
+        overridden_fields = {}
+        for location, block_overrides in _get_course_overrides_for_user(self.user, course_key).iteritems():
+            block_key = lookup_plan_block_key(UsageKey.from_string(location))
+            for name in block_overrides:
+                overridden_fields.setdefault(name, set()).add(block_key)
+        return overridden_fields
+
     @classmethod
     def enabled_for(cls, course):
         """This simple override provider is always enabled"""
@@ -43,19 +58,52 @@ def _get_overrides_for_user(user, block):
     Gets all of the individual student overrides for given user and block.
     Returns a dictionary of field override values keyed by field name.
     """
-    query = StudentFieldOverride.objects.filter(
-        course_id=block.runtime.course_id,
-        location=block.location,
-        student_id=user.id,
-    )
+    course_overrides = _get_course_overrides_for_user(user, block.runtime.course_id)
     overrides = {}
-    for override in query:
-        field = block.fields[override.field]
-        value = field.from_json(json.loads(override.value))
-        overrides[override.field] = value
+    for field_name, value in course_overrides.get(_serialize_location(block.location), {}).iteritems():
+        overrides[field_name] = block.fields[field_name].from_json(value)
     return overrides
 
 
+def _get_course_overrides_for_user(user, course_id):
+    """
+    Gets all of the individual student overrides for the given user in the
+    course, with a single query per request.  Returns a dictionary mapping
+    serialized block locations to dictionaries of JSON decoded override values
+    keyed by field name.
+    """
+    cache_key = _get_request_cache_key(user, course_id)
+    request_cache = RequestCache.get_request_cache()
+    course_overrides = request_cache.data.get(cache_key)
+    if course_overrides is None:
+        course_overrides = {}
+        query = StudentFieldOverride.objects.filter(
+            course_id=course_id,
+            student_id=user.id,
+        ).values_list('location', 'field', 'value')
+        for location, field, value in query:
+            course_overrides.setdefault(_serialize_location(location), {})[field] = json.loads(value)
+        request_cache.data[cache_key] = course_overrides
+    return course_overrides
+
+
+def _get_request_cache_key(user, course_id):
+    """
+    Returns the key of the user's overrides for the course in the request cache.
+    """
+    return u'courseware.student_field_overrides.{}.{}'.format(course_id, user.id)
+
+
+def _serialize_location(location):
+    """
+    Serializes the given block location as it is stored in the database,
+    i.e. without any version and branch information.
+    """
+    if hasattr(location, 'version_agnostic') and hasattr(location, 'for_branch'):
+        location = location.for_branch(None).version_agnostic()
+    return unicode(location)
+
+
 def override_field_for_user(user, block, name, value):
     """
     Overrides a field for the `user`.  `block` and `name` specify the block
@@ -70,6 +118,8 @@ def override_field_for_user(user, block, name, value):
     field = block.fields[name]
     override.value = json.dumps(field.to_json(value))
     override.save()
+    RequestCache.get_request_cache().data.pop(_get_request_cache_key(user, block.runtime.course_id), None)
+    clear_override_lookup_plans()
 
 
 def clear_override_for_user(user, block, name):
@@ -87,3 +137,5 @@ def clear_override_for_user(user, block, name):
             field=name).delete()
     except StudentFieldOverride.DoesNotExist:
         pass
+    RequestCache.get_request_cache().data.pop(_get_request_cache_key(user, block.runtime.course_id), None)
+    clear_override_lookup_plans()
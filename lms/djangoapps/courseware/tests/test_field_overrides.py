@@ -3,14 +3,17 @@ Tests for `field_overrides` module.
 """
 # pylint: disable=missing-docstring
 import unittest
+import mock
 from nose.plugins.attrib import attr
 
 from django.test.utils import override_settings
+from request_cache.middleware import RequestCache
 from xblock.field_data import DictFieldData
 from xmodule.modulestore.tests.factories import CourseFactory
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 
 from ..field_overrides import (
+    ALL_BLOCKS,
     resolve_dotted,
     disable_overrides,
     FieldOverrideProvider,
@@ -45,6 +48,27 @@ class TestOverrideProvider(FieldOverrideProvider):
         return True
 
 
+class PlannedOverrideProvider(FieldOverrideProvider):
+    """
+    A concrete implementation of `FieldOverrideProvider` for testing, which
+    reports the fields it overrides up front.
+    """
+    lookups = []
+
+    def get(self, block, name, default):
+        self.lookups.append(name)
+        if name == 'foo':
+            return 'fu'
+        return default
+
+    def overridden_fields(self, course_key):
+        return {'foo': ALL_BLOCKS}
+
+    @classmethod
+    def enabled_for(cls, course):
+        return True
+
+
 @attr(shard=1)
 @override_settings(FIELD_OVERRIDE_PROVIDERS=(
     'courseware.tests.test_field_overrides.TestOverrideProvider',))
@@ -142,6 +166,53 @@ class OverrideModulestoreFieldDataTests(FieldOverrideTestMixin, OverrideFieldDat
         self.assertIsInstance(data, DictFieldData)
 
 
+@attr(shard=1)
+@override_settings(FIELD_OVERRIDE_PROVIDERS=(
+    'courseware.tests.test_field_overrides.PlannedOverrideProvider',))
+class OverrideLookupPlanTests(SharedModuleStoreTestCase):
+    """
+    Tests for the lookup plans of `OverrideFieldData`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(OverrideLookupPlanTests, cls).setUpClass()
+        cls.course = CourseFactory.create(enable_ccx=True)
+
+    def setUp(self):
+        super(OverrideLookupPlanTests, self).setUp()
+        OverrideFieldData.provider_classes = None
+        PlannedOverrideProvider.lookups = []
+        RequestCache.clear_request_cache()
+
+    def tearDown(self):
+        super(OverrideLookupPlanTests, self).tearDown()
+        OverrideFieldData.provider_classes = None
+
+    def make_one(self):
+        """
+        Factory method.
+        """
+        return OverrideFieldData.wrap(TESTUSER, self.course, DictFieldData({
+            'foo': 'bar',
+            'bees': 'knees',
+        }))
+
+    def test_get(self):
+        data = self.make_one()
+        self.assertEqual(data.get(self.course, 'foo'), 'fu')
+        self.assertEqual(data.get(self.course, 'bees'), 'knees')
+        self.assertEqual(PlannedOverrideProvider.lookups, ['foo'])
+
+    def test_has_skips_lineage_of_unplanned_fields(self):
+        data = self.make_one()
+        with mock.patch('courseware.field_overrides._lineage') as lineage:
+            self.assertTrue(data.has(self.course, 'bees'))
+            self.assertFalse(data.has(self.course, 'due'))
+        self.assertFalse(lineage.called)
+        self.assertEqual(PlannedOverrideProvider.lookups, [])
+
+
 @attr(shard=1)
 class ResolveDottedTests(unittest.TestCase):
     """
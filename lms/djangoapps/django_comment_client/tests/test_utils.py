@@ -23,6 +23,7 @@ from openedx.core.djangoapps.course_groups.tests.helpers import config_course_co
 from student.tests.factories import UserFactory, AdminFactory, CourseEnrollmentFactory
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from openedx.core.djangoapps.util.testing import ContentGroupTestCase
+from request_cache.middleware import RequestCache
 from student.roles import CourseStaffRole
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory, ToyCourseFactory
@@ -1022,6 +1023,73 @@ class CategoryMapTestCase(CategoryMapTestMixin, ModuleStoreTestCase):
         )
 
 
+@attr(shard=1)
+class DiscussionCategorySkeletonCacheTestCase(ModuleStoreTestCase):
+    """
+    Tests the caching of the user-independent discussion category skeleton.
+    """
+    def setUp(self):
+        super(DiscussionCategorySkeletonCacheTestCase, self).setUp()
+        self.course = CourseFactory.create(
+            default_store=ModuleStoreEnum.Type.split,
+            start=datetime.datetime(2012, 2, 3, tzinfo=UTC)
+        )
+        self.create_discussion("discussion1", "Chapter", "Discussion 1")
+
+    def create_discussion(self, discussion_id, discussion_category, discussion_target):
+        """
+        Creates a discussion xblock at the top level of the course.
+        """
+        ItemFactory.create(
+            parent_location=self.course.location,
+            category="discussion",
+            discussion_id=discussion_id,
+            discussion_category=discussion_category,
+            discussion_target=discussion_target,
+        )
+
+    def get_skeleton_ids(self):
+        """
+        Returns the discussion ids in the skeleton of the latest course version.
+        """
+        course = self.store.get_course(self.course.id)
+        return [entry["id"] for entry in utils.get_discussion_category_skeleton(course)]
+
+    def test_skeleton_is_cached_per_course_version(self):
+        self.assertEqual(self.get_skeleton_ids(), ["discussion1"])
+        RequestCache.clear_request_cache()
+
+        with mock.patch('django_comment_client.utils._build_discussion_category_skeleton') as mock_build:
+            self.assertEqual(self.get_skeleton_ids(), ["discussion1"])
+            self.assertFalse(mock_build.called)
+
+        # Publishing a change bumps the course version, which rebuilds the skeleton.
+        self.create_discussion("discussion2", "Chapter", "Discussion 2")
+        self.assertEqual(self.get_skeleton_ids(), ["discussion1", "discussion2"])
+
+    def test_staff_only_entries_are_filtered_per_user(self):
+        ItemFactory.create(
+            parent_location=self.course.location,
+            category="discussion",
+            discussion_id="staff_discussion",
+            discussion_category="Chapter",
+            discussion_target="Staff Discussion",
+            visible_to_staff_only=True,
+        )
+        course = self.store.get_course(self.course.id)
+        student = UserFactory.create()
+        staff = AdminFactory.create()
+
+        self.assertEqual(
+            utils.get_discussion_category_map(course, student)["subcategories"]["Chapter"]["children"],
+            ["Discussion 1"]
+        )
+        self.assertEqual(
+            utils.get_discussion_category_map(course, staff)["subcategories"]["Chapter"]["children"],
+            ["Discussion 1", "Staff Discussion"]
+        )
+
+
 @attr(shard=1)
 class ContentGroupCategoryMapTestCase(CategoryMapTestMixin, ContentGroupTestCase):
     """
@@ -5,23 +5,29 @@ import logging
 from django.conf import settings
 
 import pytz
+from ccx_keys.locator import CCXLocator
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.db import connection
 from django.http import HttpResponse
 from django.utils.timezone import UTC
 import pystache_custom as pystache
 from opaque_keys.edx.locations import i4xEncoder
-from opaque_keys.edx.keys import CourseKey
+from opaque_keys.edx.keys import CourseKey, UsageKey
+from request_cache.middleware import RequestCache
+from util import milestones_helpers
 from xmodule.modulestore.django import modulestore
 
 from django_comment_common.models import Role, FORUM_ROLE_STUDENT
+from django_comment_common.utils import get_discussion_category_skeleton_cache_key
 from django_comment_client.permissions import check_permissions_by_view, has_permission, get_team
 from django_comment_client.settings import MAX_COMMENT_DEPTH
 from edxmako import lookup_template
 
 from courseware import courses
 from courseware.access import has_access
+from courseware.access_utils import in_preview_mode
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from openedx.core.djangoapps.course_groups.cohorts import (
     get_course_cohort_settings, get_cohort_by_id, get_cohort_id, is_course_cohorted
@@ -31,6 +37,11 @@ from openedx.core.djangoapps.course_groups.models import CourseUserGroup
 
 log = logging.getLogger(__name__)
 
+# How long a course's discussion category skeleton is kept in the django cache.
+# Entries are keyed by published course version and evicted on publish, so this
+# only bounds how long an unused skeleton lingers.
+DISCUSSION_CATEGORY_SKELETON_CACHE_TIMEOUT = 24 * 60 * 60
+
 
 def extract(dic, keys):
     """
@@ -253,6 +264,96 @@ def _sort_map_entries(category_map, sort_alpha):
     category_map["children"] = [x[0] for x in sorted(things, key=lambda x: x[1]["sort_key"])]
 
 
+def _build_discussion_category_skeleton(course):
+    """
+    Returns the user-independent list of discussion entries of `course`, in
+    xblock order. Each entry carries everything get_discussion_category_map
+    needs, plus the xblock location and whether the xblock is restricted to
+    some users (staff only or group access).
+    """
+    skeleton = []
+    for xblock in get_accessible_discussion_xblocks(course, None, include_all=True):
+        skeleton.append({
+            "id": xblock.discussion_id,
+            "title": xblock.discussion_target,
+            "sort_key": xblock.sort_key,
+            "category": " / ".join([x.strip() for x in xblock.discussion_category.split("/")]),
+            # Handle case where xblock.start is None
+            "start_date": xblock.start if xblock.start else datetime.max.replace(tzinfo=pytz.UTC),
+            "location": unicode(xblock.location),
+            "is_restricted": bool(xblock.visible_to_staff_only or xblock.merged_group_access),
+        })
+    return skeleton
+
+
+def get_discussion_category_skeleton(course):
+    """
+    Returns the discussion category skeleton of `course` (see
+    _build_discussion_category_skeleton).
+
+    The skeleton is cached for the current request and, across requests, in the
+    django cache under the course's published version. Courses without a
+    version (old mongo) and CCX courses, whose blocks carry per-CCX overrides,
+    are rebuilt every time.
+    """
+    version = getattr(course, 'course_version', None)
+    if version is None or isinstance(course.id, CCXLocator):
+        return _build_discussion_category_skeleton(course)
+
+    cache_key = get_discussion_category_skeleton_cache_key(course.id)
+    request_cache_key = u"{}.{}".format(cache_key, version)
+    request_cache = RequestCache.get_request_cache()
+    skeleton = request_cache.data.get(request_cache_key)
+    if skeleton is not None:
+        return skeleton
+
+    cached = cache.get(cache_key)
+    if cached is not None and cached["version"] == unicode(version):
+        skeleton = cached["skeleton"]
+    else:
+        skeleton = _build_discussion_category_skeleton(course)
+        cache.set(
+            cache_key,
+            {"version": unicode(version), "skeleton": skeleton},
+            DISCUSSION_CATEGORY_SKELETON_CACHE_TIMEOUT
+        )
+
+    request_cache.data[request_cache_key] = skeleton
+    return skeleton
+
+
+def _get_accessible_skeleton_entries(course, user, skeleton):
+    """
+    Returns the entries of `skeleton` whose discussion xblock `user` can load.
+
+    Unrestricted, started entries without content milestones are visible to
+    everyone, so only the remaining entries have their xblock loaded for a full
+    has_access check.
+    """
+    if in_preview_mode():
+        accessible_locations = set(
+            unicode(xblock.location) for xblock in get_accessible_discussion_xblocks(course, user)
+        )
+        return [entry for entry in skeleton if entry["location"] in accessible_locations]
+
+    now = datetime.now(UTC())
+    store = modulestore()
+    accessible_entries = []
+    with store.bulk_operations(course.id):
+        for entry in skeleton:
+            needs_access_check = (
+                entry["is_restricted"] or
+                entry["start_date"] > now or
+                milestones_helpers.get_course_content_milestones(course.id, entry["location"], 'requires', user.id)
+            )
+            if needs_access_check:
+                xblock = store.get_item(UsageKey.from_string(entry["location"]))
+                if not has_access(user, 'load', xblock, course.id):
+                    continue
+            accessible_entries.append(entry)
+    return accessible_entries
+
+
 def get_discussion_category_map(course, user, cohorted_if_in_list=False, exclude_unstarted=True):
     """
     Transform the list of this course's discussion xblocks into a recursive dictionary structure.  This is used
@@ -300,21 +401,15 @@ def get_discussion_category_map(course, user, cohorted_if_in_list=False, exclude
     """
     unexpanded_category_map = defaultdict(list)
 
-    xblocks = get_accessible_discussion_xblocks(course, user)
+    accessible_entries = _get_accessible_skeleton_entries(course, user, get_discussion_category_skeleton(course))
 
     course_cohort_settings = get_course_cohort_settings(course.id)
 
-    for xblock in xblocks:
-        discussion_id = xblock.discussion_id
-        title = xblock.discussion_target
-        sort_key = xblock.sort_key
-        category = " / ".join([x.strip() for x in xblock.discussion_category.split("/")])
-        # Handle case where xblock.start is None
-        entry_start_date = xblock.start if xblock.start else datetime.max.replace(tzinfo=pytz.UTC)
-        unexpanded_category_map[category].append({"title": title,
-                                                  "id": discussion_id,
-                                                  "sort_key": sort_key,
-                                                  "start_date": entry_start_date})
+    for entry in accessible_entries:
+        unexpanded_category_map[entry["category"]].append({"title": entry["title"],
+                                                           "id": entry["id"],
+                                                           "sort_key": entry["sort_key"],
+                                                           "start_date": entry["start_date"]})
 
     category_map = {"entries": defaultdict(dict), "subcategories": defaultdict(dict)}
     for category_path, entries in unexpanded_category_map.items():
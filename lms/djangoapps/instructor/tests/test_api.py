@@ -5001,3 +5001,73 @@ class TestBulkCohorting(SharedModuleStoreTestCase):
         self.verify_success_on_file_content(
             'username,email,cohort\r\nfoo_username,bar_email,baz_cohort', mock_store_upload, mock_cohort_task
         )
+
+
+@attr(shard=1)
+class TestBulkEnrollmentCSV(SharedModuleStoreTestCase):
+    """
+    Test enrolling and unenrolling users in bulk via CSV upload.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(TestBulkEnrollmentCSV, cls).setUpClass()
+        cls.course = CourseFactory.create()
+
+    def setUp(self):
+        super(TestBulkEnrollmentCSV, self).setUp()
+        self.staff_user = StaffFactory(course_key=self.course.id)
+        self.tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tempdir)
+        self.client.login(username=self.staff_user.username, password='test')
+
+    def call_update_enrollment_from_csv(self, csv_data, **params):
+        """
+        Call `students_update_enrollment_from_csv` with a file generated from `csv_data`.
+        """
+        __, file_name = tempfile.mkstemp(suffix='.csv', dir=self.tempdir)
+        with open(file_name, 'w') as file_pointer:
+            file_pointer.write(csv_data.encode('utf-8'))
+        with open(file_name, 'r') as file_pointer:
+            url = reverse('students_update_enrollment_from_csv', kwargs={'course_id': unicode(self.course.id)})
+            params['uploaded-file'] = file_pointer
+            return self.client.post(url, params)
+
+    def expect_error(self, response, error):
+        """
+        Verify that the response is a 400 with the given error.
+        """
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content)['error'], error)
+
+    def test_no_username_or_email_field(self):
+        self.expect_error(
+            self.call_update_enrollment_from_csv('name\n', action='enroll'),
+            "The file must contain a 'username' column, an 'email' column, or both."
+        )
+
+    def test_unknown_action(self):
+        self.expect_error(
+            self.call_update_enrollment_from_csv('email\n', action='forget'),
+            "Unrecognized action 'forget'."
+        )
+
+    def test_unknown_mode(self):
+        self.expect_error(
+            self.call_update_enrollment_from_csv('email\n', action='enroll', mode='verified'),
+            "The course has no 'verified' mode."
+        )
+
+    @patch('instructor.views.api.instructor_task.api.submit_enroll_students')
+    @patch('instructor.views.api.store_uploaded_file')
+    def test_success(self, mock_store_upload, mock_enroll_task):
+        mock_store_upload.return_value = (None, 'fake_file_name.csv')
+        CourseModeFactory.create(course_id=self.course.id, mode_slug='verified')
+        response = self.call_update_enrollment_from_csv(
+            'email\nfoo@example.com', action='enroll', mode='verified', reason='partner'
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(mock_enroll_task.call_count, 1)
+        self.assertEqual(
+            mock_enroll_task.call_args[0][2:],
+            ('fake_file_name.csv', 'enroll', 'verified', 'partner')
+        )
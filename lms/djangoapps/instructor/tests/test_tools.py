@@ -12,6 +12,7 @@ from django.test.utils import override_settings
 from nose.plugins.attrib import attr
 
 from courseware.field_overrides import OverrideFieldData
+from request_cache.middleware import RequestCache
 from lms.djangoapps.ccx.tests.test_overrides import inject_field_overrides
 from student.tests.factories import UserFactory
 from xmodule.fields import Date
@@ -246,6 +247,17 @@ class TestSetDueDateExtension(ModuleStoreTestCase):
             tools.set_due_date_extension(self.course, self.week1, self.user, extended)
             self._clear_field_data_cache()
 
+    def test_due_date_extensions_loaded_in_one_query(self):
+        extended = datetime.datetime(2013, 12, 25, 0, 0, tzinfo=utc)
+        tools.set_due_date_extension(self.course, self.week1, self.user, extended)
+        tools.set_due_date_extension(self.course, self.week2, self.user, extended)
+        self._clear_field_data_cache()
+        RequestCache.clear_request_cache()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.week1.due, extended)
+            self.assertEqual(self.week2.due, extended)
+            self.assertEqual(self.assignment.due, extended)
+
     def test_set_due_date_extension_invalid_date(self):
         extended = datetime.datetime(2009, 1, 1, 0, 0, tzinfo=utc)
         with self.assertRaises(tools.DashboardError):
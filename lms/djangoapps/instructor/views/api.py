@@ -1352,6 +1352,69 @@ def add_users_to_cohorts(request, course_id):
     return JsonResponse()
 
 
+@transaction.non_atomic_requests
+@ensure_csrf_cookie
+@cache_control(no_cache=True, no_store=True, must_revalidate=True)
+@require_POST
+@require_level('staff')
+@common_exceptions_400
+@require_post_params(action="enroll or unenroll")
+def students_update_enrollment_from_csv(request, course_id):
+    """
+    View method that accepts an uploaded file (using key "uploaded-file")
+    containing the emails and/or usernames of students to enroll or unenroll.
+    This method spawns a celery task to update the enrollments in bulk, and a
+    CSV file with results is provided via data downloads.
+
+    Query Parameters:
+    - action in ['enroll', 'unenroll']
+    - mode is the mode to enroll the students in (defaults to the default mode of the course)
+    - reason is the reason for the manual enrollment, required for white label courses
+    """
+    course_key = SlashSeparatedCourseKey.from_string(course_id)
+    action = request.POST.get('action')
+    mode = request.POST.get('mode') or None
+    reason = request.POST.get('reason')
+
+    if action not in ('enroll', 'unenroll'):
+        return JsonResponse({"error": _("Unrecognized action '{action}'.").format(action=action)}, status=400)
+    if mode is not None:
+        modes = CourseMode.modes_for_course_dict(course_key, include_expired=True, only_selectable=False)
+        if mode not in modes:
+            return JsonResponse({"error": _("The course has no '{mode}' mode.").format(mode=mode)}, status=400)
+    if CourseMode.is_white_label(course_key) and not reason:
+        return JsonResponse({"error": _("A reason is required to change enrollments in this course.")}, status=400)
+
+    try:
+        def validator(file_storage, file_to_validate):
+            """
+            Verifies that the expected columns are present.
+            """
+            with file_storage.open(file_to_validate) as f:
+                reader = unicodecsv.reader(UniversalNewlineIterator(f), encoding='utf-8')
+                try:
+                    fieldnames = next(reader)
+                except StopIteration:
+                    fieldnames = []
+                if "email" not in fieldnames and "username" not in fieldnames:
+                    raise FileValidationException(
+                        _("The file must contain a 'username' column, an 'email' column, or both.")
+                    )
+
+        __, filename = store_uploaded_file(
+            request, 'uploaded-file', ['.csv'],
+            course_and_time_based_filename_generator(course_key, "enrollments"),
+            max_file_size=5000000,  # limit to 5 MB
+            validator=validator
+        )
+        # The task will assume the default file storage.
+        instructor_task.api.submit_enroll_students(request, course_key, filename, action, mode, reason)
+    except (FileValidationException, PermissionDenied) as err:
+        return JsonResponse({"error": unicode(err)}, status=400)
+
+    return JsonResponse()
+
+
 @ensure_csrf_cookie
 @cache_control(no_cache=True, no_store=True, must_revalidate=True)
 @require_level('staff')
@@ -9,6 +9,8 @@ urlpatterns = patterns(
 
     url(r'^students_update_enrollment$',
         'instructor.views.api.students_update_enrollment', name="students_update_enrollment"),
+    url(r'^students_update_enrollment_from_csv$',
+        'instructor.views.api.students_update_enrollment_from_csv', name="students_update_enrollment_from_csv"),
     url(r'^register_and_enroll_students$',
         'instructor.views.api.register_and_enroll_students', name="register_and_enroll_students"),
     url(r'^list_course_role_members$',
@@ -17,7 +17,7 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.core.urlresolvers import reverse
 from opaque_keys.edx.keys import UsageKey
 import xmodule.graders as xmgraders
-from student.models import CourseEnrollmentAllowed
+from student.models import CourseEnrollment, CourseEnrollmentAllowed
 from edx_proctoring.api import get_all_exam_attempts
 from courseware.models import StudentModule
 from certificates.models import GeneratedCertificate
@@ -31,6 +31,8 @@ STUDENT_FEATURES = ('id', 'username', 'first_name', 'last_name', 'is_staff', 'em
 PROFILE_FEATURES = ('name', 'language', 'location', 'year_of_birth', 'gender',
                     'level_of_education', 'mailing_address', 'goals', 'meta',
                     'city', 'country')
+# Features which can be read from the enrollment projections, without building User objects.
+PROJECTION_FEATURES = {'id': 'user_id', 'username': 'username', 'email': 'email', 'name': 'name'}
 ORDER_ITEM_FEATURES = ('list_price', 'unit_cost', 'status')
 ORDER_FEATURES = ('purchase_time',)
 
@@ -211,6 +213,16 @@ def enrolled_students_features(course_key, features):
         {'username': 'username3', 'first_name': 'firstname3'}
     ]
     """
+    if all(feature in PROJECTION_FEATURES for feature in features):
+        enrollments = sorted(
+            CourseEnrollment.objects.enrollment_projections(course_key),
+            key=lambda enrollment: enrollment.username
+        )
+        return [
+            dict((feature, getattr(enrollment, PROJECTION_FEATURES[feature])) for feature in features)
+            for enrollment in enrollments
+        ]
+
     include_cohort_column = 'cohort' in features
     include_team_column = 'team' in features
 
@@ -127,6 +127,22 @@ class TestAnalyticsBasic(ModuleStoreTestCase):
             self.assertEqual(userreport['city'], user.profile.city)
             self.assertEqual(userreport['country'], user.profile.country)
 
+    def test_enrolled_students_projection_features(self):
+        query_features = ('id', 'username', 'email', 'name')
+        CourseEnrollment.unenroll(self.users[0], self.course_key)
+        with self.assertNumQueries(1):
+            userreports = enrolled_students_features(self.course_key, query_features)
+
+        users = sorted(self.users[1:], key=lambda u: u.username)
+        self.assertEqual([userreport['username'] for userreport in userreports], [user.username for user in users])
+        for userreport, user in zip(userreports, users):
+            self.assertEqual(userreport, {
+                'id': user.id,
+                'username': user.username,
+                'email': user.email,
+                'name': user.profile.name,
+            })
+
     def test_enrolled_student_with_no_country_city(self):
         userreports = enrolled_students_features(self.course_key, ('username', 'city', 'country',))
         for userreport in userreports:
@@ -24,6 +24,7 @@ from instructor_task.tasks import (
     calculate_problem_grade_report,
     calculate_students_features_csv,
     cohort_students,
+    enroll_students,
     enrollment_report_features_csv,
     calculate_may_enroll_csv,
     exec_summary_report_csv,
@@ -435,6 +436,20 @@ def submit_cohort_students(request, course_key, file_name):
     return submit_task(request, task_type, task_class, course_key, task_input, task_key)
 
 
+def submit_enroll_students(request, course_key, file_name, action, mode=None, reason=None):
+    """
+    Request to have the students listed in a file enrolled or unenrolled in bulk.
+
+    Raises AlreadyRunningError if students are currently being enrolled.
+    """
+    task_type = 'enroll_students'
+    task_class = enroll_students
+    task_input = {'file_name': file_name, 'action': action, 'mode': mode, 'reason': reason}
+    task_key = ""
+
+    return submit_task(request, task_type, task_class, course_key, task_input, task_key)
+
+
 def submit_export_ora2_data(request, course_key):
     """
     AlreadyRunningError is raised if an ora2 report is already being generated.
@@ -24,6 +24,8 @@ SUBTASK_LOCK_EXPIRE = 60 * 10  # Lock expires in 10 minutes
 # Number of times to retry if a subtask update encounters a lock on the InstructorTask.
 # (These are recursive retries, so don't make this number too large.)
 MAX_DATABASE_LOCK_RETRIES = 5
+# Number of items fetched by each query when paging through the items for subtasks.
+ITEMS_PER_QUERY = 1000
 
 
 class DuplicateTaskException(Exception):
@@ -70,6 +72,27 @@ def track_memory_usage(metric, course_id):
         )
 
 
+def _iterate_items_by_pk(queryset, item_fields, items_per_query):
+    """
+    Yields the dicts of `item_fields` for each item in `queryset`, ordered by primary key.
+
+    The queryset is paged through by primary key (keyset pagination): each page is a
+    separate query for at most `items_per_query` items with a primary key greater than
+    the last one seen, so no cursor or temporary table is held open over the whole set.
+    `item_fields` must include 'pk'.
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        page_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        page = list(page_queryset.values(*item_fields)[:items_per_query])
+        for item in page:
+            yield item
+        if len(page) < items_per_query:
+            return
+        last_pk = page[-1]['pk']
+
+
 def _generate_items_for_subtask(
     item_querysets,  # pylint: disable=bad-continuation
     item_fields,
@@ -77,6 +100,7 @@ def _generate_items_for_subtask(
     items_per_task,
     total_num_subtasks,
     course_id,
+    items_per_query=ITEMS_PER_QUERY,
 ):
     """
     Generates a chunk of "items" that should be passed into a subtask.
@@ -86,9 +110,9 @@ def _generate_items_for_subtask(
         `item_fields` : the fields that should be included in the dict that is returned.
             These are in addition to the 'pk' field.
         `total_num_items` : the result of summing the count of each queryset in `item_querysets`.
-        `items_per_query` : size of chunks to break the query operation into.
         `items_per_task` : maximum size of chunks to break each query chunk into for use by a subtask.
         `course_id` : course_id of the course. Only needed for the track_memory_usage context manager.
+        `items_per_query` : size of the pages to break the query operation into.
 
     Returns:  yields a list of dicts, where each dict contains the fields in `item_fields`, plus the 'pk' field.
 
@@ -103,7 +127,7 @@ def _generate_items_for_subtask(
 
     with track_memory_usage('course_email.subtask_generation.memory', course_id):
         for queryset in item_querysets:
-            for item in queryset.values(*all_item_fields).iterator():
+            for item in _iterate_items_by_pk(queryset, all_item_fields, items_per_query):
                 if len(items_for_task) == items_per_task and num_subtasks < total_num_subtasks - 1:
                     yield items_for_task
                     num_items_queued += items_per_task
@@ -126,6 +150,43 @@ def _generate_items_for_subtask(
         TASK_LOG.info("Number of items generated by chunking %s not equal to original total %s", num_items_queued, total_num_items)
 
 
+def _generate_item_ranges_for_subtask(item_queryset, total_num_items, items_per_task, total_num_subtasks, course_id):
+    """
+    Generates the primary key range of the "items" that should be processed by each subtask.
+
+    Chunks the items exactly as `_generate_items_for_subtask` does, but yields a
+    (lower_pk, upper_pk) tuple per chunk instead of the items themselves: the
+    subtask processes the items with lower_pk < pk <= upper_pk.  The ranges are
+    contiguous, with the first one unbounded below (lower_pk is None) and the
+    last one unbounded above (upper_pk is None), so every item that is in the
+    queryset when a subtask runs belongs to exactly one range.
+    """
+    lower_pk = None
+    previous_upper_pk = None
+    for items in _generate_items_for_subtask(
+        [item_queryset], [], total_num_items, items_per_task, total_num_subtasks, course_id,
+    ):
+        if previous_upper_pk is not None:
+            yield (lower_pk, previous_upper_pk)
+            lower_pk = previous_upper_pk
+        previous_upper_pk = items[-1]['pk']
+
+    if previous_upper_pk is not None:
+        yield (lower_pk, None)
+
+
+def filter_queryset_by_pk_range(queryset, pk_range):
+    """
+    Restricts `queryset` to the items in a range generated by `_generate_item_ranges_for_subtask`.
+    """
+    lower_pk, upper_pk = pk_range
+    if lower_pk is not None:
+        queryset = queryset.filter(pk__gt=lower_pk)
+    if upper_pk is not None:
+        queryset = queryset.filter(pk__lte=upper_pk)
+    return queryset
+
+
 class SubtaskStatus(object):
     """
     Create and return a dict for tracking the status of a subtask.
@@ -285,6 +346,7 @@ def queue_subtasks_for_query(
     item_fields,
     items_per_task,
     total_num_items,
+    dispatch_item_ranges=False,
 ):
     """
     Generates and queues subtasks to each execute a chunk of "items" generated by a queryset.
@@ -300,6 +362,10 @@ def queue_subtasks_for_query(
             These are in addition to the 'pk' field.
         `items_per_task` : maximum size of chunks to break each query chunk into for use by a subtask.
         `total_num_items` : total amount of items that will be put into subtasks
+        `dispatch_item_ranges` : if True, `item_querysets` must contain a single query set, and
+            `create_subtask_fcn` is passed the (lower_pk, upper_pk) range of the items to be processed
+            by the subtask instead of the list of items.  The subtask is then responsible for fetching
+            its items, e.g. with `filter_queryset_by_pk_range`, which keeps the task messages small.
 
     Returns:  the task progress as stored in the InstructorTask object.
 
@@ -324,14 +390,25 @@ def queue_subtasks_for_query(
 
     # Construct a generator that will return the recipients to use for each subtask.
     # Pass in the desired fields to fetch for each recipient.
-    item_list_generator = _generate_items_for_subtask(
-        item_querysets,
-        item_fields,
-        total_num_items,
-        items_per_task,
-        total_num_subtasks,
-        entry.course_id,
-    )
+    if dispatch_item_ranges:
+        if len(item_querysets) != 1:
+            raise ValueError("Item ranges can only be dispatched for a single queryset")
+        item_list_generator = _generate_item_ranges_for_subtask(
+            item_querysets[0],
+            total_num_items,
+            items_per_task,
+            total_num_subtasks,
+            entry.course_id,
+        )
+    else:
+        item_list_generator = _generate_items_for_subtask(
+            item_querysets,
+            item_fields,
+            total_num_items,
+            items_per_task,
+            total_num_subtasks,
+            entry.course_id,
+        )
 
     # Now create the subtasks, and start them running.
     TASK_LOG.info(
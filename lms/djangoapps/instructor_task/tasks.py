@@ -39,6 +39,7 @@ from instructor_task.tasks_helper import (
     upload_problem_grade_report,
     upload_students_csv,
     cohort_students_and_upload,
+    enroll_students_and_upload,
     upload_enrollment_report,
     upload_may_enroll_csv,
     upload_exec_summary_report,
@@ -293,6 +294,18 @@ def cohort_students(entry_id, xmodule_instance_args):
     return run_main_task(entry_id, task_fn, action_name)
 
 
+@task(base=BaseInstructorTask)  # pylint: disable=not-callable
+def enroll_students(entry_id, xmodule_instance_args):
+    """
+    Enroll or unenroll students in bulk, and upload the results.
+    """
+    # Translators: This is a past-tense verb that is inserted into task progress messages as {action}.
+    # An example of such a message is: "Progress: {action} {succeeded} of {attempted} so far"
+    action_name = ugettext_noop('enrolled')
+    task_fn = partial(enroll_students_and_upload, xmodule_instance_args)
+    return run_main_task(entry_id, task_fn, action_name)
+
+
 @task(base=BaseInstructorTask, routing_key=settings.GRADES_DOWNLOAD_ROUTING_KEY)  # pylint: disable=not-callable
 def export_ora2_data(entry_id, xmodule_instance_args):
     """
@@ -41,10 +41,11 @@ from django.utils.translation import ugettext as _
 from certificates.models import (
     CertificateWhitelist,
     certificate_info_for_user,
+    certificate_statuses_for_students,
     CertificateStatuses,
     GeneratedCertificate
 )
-from certificates.api import generate_user_certificates
+from certificates.api import generate_user_certificates_in_bulk
 from courseware.courses import get_course_by_id, get_problems_in_section
 from lms.djangoapps.grades.course_grades import iterate_grades_for
 from courseware.models import StudentModule
@@ -59,13 +60,23 @@ from instructor_analytics.basic import (
 from instructor_analytics.csvs import format_dictlist
 from openassessment.data import OraAggregateData
 from instructor_task.models import ReportStore, InstructorTask, PROGRESS
-from lms.djangoapps.lms_xblock.runtime import LmsPartitionService
-from openedx.core.djangoapps.course_groups.cohorts import get_cohort
+from openedx.core.djangoapps.course_groups.cohorts import get_cohorts_for_users
 from openedx.core.djangoapps.course_groups.models import CourseUserGroup
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from opaque_keys.edx.keys import UsageKey
 from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort, is_course_cohorted
-from student.models import CourseEnrollment, CourseAccessRole
+from student.models import (
+    ALLOWEDTOENROLL_TO_ENROLLED,
+    ALLOWEDTOENROLL_TO_UNENROLLED,
+    ENROLLED_TO_ENROLLED,
+    ENROLLED_TO_UNENROLLED,
+    UNENROLLED_TO_ENROLLED,
+    UNENROLLED_TO_UNENROLLED,
+    CourseAccessRole,
+    CourseEnrollment,
+    CourseEnrollmentAllowed,
+    ManualEnrollmentAudit,
+)
 from lms.djangoapps.teams.models import CourseTeamMembership
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification
 
@@ -83,6 +94,15 @@ UPDATE_STATUS_SKIPPED = 'skipped'
 # The setting name used for events when "settings" (account settings, preferences, profile information) change.
 REPORT_REQUESTED_EVENT_NAME = u'edx.instructor.report.requested'
 
+# Number of students whose per-student report data (cohort, groups, team, mode, certificate)
+# is fetched together, with a query per kind of data rather than per student.
+REPORT_STUDENT_BATCH_SIZE = 1000
+
+# Number of students whose certificates are requested together, with their
+# certificate, profile, whitelist, enrollment and verification data fetched
+# with a query per kind of data rather than per student.
+CERTIFICATE_GENERATION_BATCH_SIZE = 500
+
 
 class BaseInstructorTask(Task):
     """
@@ -653,6 +673,47 @@ def upload_exec_summary_to_store(data_dict, report_name, course_id, generated_at
     tracker.emit(REPORT_REQUESTED_EVENT_NAME, {"report_type": report_name})
 
 
+def _iterate_in_batches(items, batch_size):
+    """
+    Yields the values from the iterable `items` in lists of at most `batch_size`,
+    without consuming more of `items` than is needed for the current list.
+    """
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _get_student_report_data(course_id, user_ids, course_is_cohorted, experiment_partitions, teams_enabled):
+    """
+    Fetches the per-student data of the grade report for the given students, with
+    a fixed number of queries.
+
+    Returns a dict of dicts keyed by user id:
+        'cohorts': CourseUserGroup of each student, if the course is cohorted
+        'experiment_groups': for each experiment partition, a dict of the student's Group
+        'teams': CourseTeam of each student, if teams are enabled
+        'enrollment_modes': (mode, is_active) of each student
+        'certificate_statuses': certificate status dictionary of each student
+        'verified_user_ids': set of the ids of the students who are ID verified
+    """
+    return {
+        'cohorts': get_cohorts_for_users(course_id, user_ids) if course_is_cohorted else {},
+        'experiment_groups': [
+            partition.scheme.get_groups_for_users(course_id, user_ids, partition)
+            for partition in experiment_partitions
+        ],
+        'teams': CourseTeamMembership.get_teams_for_users(user_ids, course_id) if teams_enabled else {},
+        'enrollment_modes': CourseEnrollment.enrollment_modes_for_users(user_ids, course_id),
+        'certificate_statuses': certificate_statuses_for_students(user_ids, course_id),
+        'verified_user_ids': SoftwareSecurePhotoVerification.verified_user_ids(user_ids),
+    }
+
+
 def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input, action_name):  # pylint: disable=too-many-statements
     """
     For a given `course_id`, generate a grades CSV file for all students that
@@ -669,7 +730,7 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
     start_time = time()
     start_date = datetime.now(UTC)
     status_interval = 100
-    enrolled_students = CourseEnrollment.objects.users_enrolled_in(course_id)
+    enrolled_students = CourseEnrollment.objects.users_enrolled_in(course_id).select_related('profile')
     task_progress = TaskProgress(action_name, enrolled_students.count(), start_time)
 
     fmt = u'Task: {task_id}, InstructorTask ID: {entry_id}, Course: {course_id}, Input: {task_input}'
@@ -692,7 +753,7 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
     certificate_info_header = ['Certificate Eligible', 'Certificate Delivered', 'Certificate Type']
     certificate_whitelist = CertificateWhitelist.objects.filter(course_id=course_id, whitelist=True)
-    whitelisted_user_ids = [entry.user_id for entry in certificate_whitelist]
+    whitelisted_user_ids = set(entry.user_id for entry in certificate_whitelist)
 
     # Loop over all our students and build our CSV lists in memory
     header = None
@@ -710,88 +771,96 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
         total_enrolled_students
     )
-    for student, gradeset, err_msg in iterate_grades_for(course_id, enrolled_students):
-        # Periodically update task status (this is a cache write)
-        if task_progress.attempted % status_interval == 0:
-            task_progress.update_task_state(extra_meta=current_step)
-        task_progress.attempted += 1
-
-        # Now add a log entry after each student is graded to get a sense
-        # of the task's progress
-        student_counter += 1
-        TASK_LOG.info(
-            u'%s, Task type: %s, Current step: %s, Grade calculation in-progress for students: %s/%s',
-            task_info_string,
-            action_name,
-            current_step,
-            student_counter,
-            total_enrolled_students
+    grade_results = iterate_grades_for(course_id, enrolled_students)
+    for grade_results_batch in _iterate_in_batches(grade_results, REPORT_STUDENT_BATCH_SIZE):
+        report_data = _get_student_report_data(
+            course_id,
+            [grade_result.student.id for grade_result in grade_results_batch],
+            course_is_cohorted,
+            experiment_partitions,
+            teams_enabled,
         )
+        for student, gradeset, err_msg in grade_results_batch:
+            # Periodically update task status (this is a cache write)
+            if task_progress.attempted % status_interval == 0:
+                task_progress.update_task_state(extra_meta=current_step)
+            task_progress.attempted += 1
 
-        if gradeset:
-            # We were able to successfully grade this student for this course.
-            task_progress.succeeded += 1
-            if not header:
-                header = [section['label'] for section in gradeset[u'section_breakdown']]
-                rows.append(
-                    ["id", "email", "username", "grade"] + header + cohorts_header +
-                    group_configs_header + teams_header +
-                    ['Enrollment Track', 'Verification Status'] + certificate_info_header
-                )
-
-            percents = {
-                section['label']: section.get('percent', 0.0)
-                for section in gradeset[u'section_breakdown']
-                if 'label' in section
-            }
+            # Now add a log entry after each student is graded to get a sense
+            # of the task's progress
+            student_counter += 1
+            TASK_LOG.info(
+                u'%s, Task type: %s, Current step: %s, Grade calculation in-progress for students: %s/%s',
+                task_info_string,
+                action_name,
+                current_step,
+                student_counter,
+                total_enrolled_students
+            )
 
-            cohorts_group_name = []
-            if course_is_cohorted:
-                group = get_cohort(student, course_id, assign=False)
-                cohorts_group_name.append(group.name if group else '')
+            if gradeset:
+                # We were able to successfully grade this student for this course.
+                task_progress.succeeded += 1
+                if not header:
+                    header = [section['label'] for section in gradeset[u'section_breakdown']]
+                    rows.append(
+                        ["id", "email", "username", "grade"] + header + cohorts_header +
+                        group_configs_header + teams_header +
+                        ['Enrollment Track', 'Verification Status'] + certificate_info_header
+                    )
 
-            group_configs_group_names = []
-            for partition in experiment_partitions:
-                group = LmsPartitionService(student, course_id).get_group(partition, assign=False)
-                group_configs_group_names.append(group.name if group else '')
+                percents = {
+                    section['label']: section.get('percent', 0.0)
+                    for section in gradeset[u'section_breakdown']
+                    if 'label' in section
+                }
 
-            team_name = []
-            if teams_enabled:
-                try:
-                    membership = CourseTeamMembership.objects.get(user=student, team__course_id=course_id)
-                    team_name.append(membership.team.name)
-                except CourseTeamMembership.DoesNotExist:
-                    team_name.append('')
-
-            enrollment_mode = CourseEnrollment.enrollment_mode_for_user(student, course_id)[0]
-            verification_status = SoftwareSecurePhotoVerification.verification_status_for_user(
-                student,
-                course_id,
-                enrollment_mode
-            )
-            certificate_info = certificate_info_for_user(
-                student,
-                course_id,
-                gradeset['grade'],
-                student.id in whitelisted_user_ids
-            )
+                cohorts_group_name = []
+                if course_is_cohorted:
+                    group = report_data['cohorts'].get(student.id)
+                    cohorts_group_name.append(group.name if group else '')
+
+                group_configs_group_names = []
+                for partition_groups in report_data['experiment_groups']:
+                    group = partition_groups.get(student.id)
+                    group_configs_group_names.append(group.name if group else '')
+
+                team_name = []
+                if teams_enabled:
+                    team = report_data['teams'].get(student.id)
+                    team_name.append(team.name if team else '')
+
+                enrollment_mode = report_data['enrollment_modes'].get(student.id, (None, None))[0]
+                verification_status = SoftwareSecurePhotoVerification.verification_status_for_user(
+                    student,
+                    course_id,
+                    enrollment_mode,
+                    user_is_verified=student.id in report_data['verified_user_ids'],
+                )
+                certificate_info = certificate_info_for_user(
+                    student,
+                    course_id,
+                    gradeset['grade'],
+                    student.id in whitelisted_user_ids,
+                    certificate_status=report_data['certificate_statuses'][student.id]
+                )
 
-            # Not everybody has the same gradable items. If the item is not
-            # found in the user's gradeset, just assume it's a 0. The aggregated
-            # grades for their sections and overall course will be calculated
-            # without regard for the item they didn't have access to, so it's
-            # possible for a student to have a 0.0 show up in their row but
-            # still have 100% for the course.
-            row_percents = [percents.get(label, 0.0) for label in header]
-            rows.append(
-                [student.id, student.email, student.username, gradeset['percent']] +
-                row_percents + cohorts_group_name + group_configs_group_names + team_name +
-                [enrollment_mode] + [verification_status] + certificate_info
-            )
-        else:
-            # An empty gradeset means we failed to grade a student.
-            task_progress.failed += 1
-            err_rows.append([student.id, student.username, err_msg])
+                # Not everybody has the same gradable items. If the item is not
+                # found in the user's gradeset, just assume it's a 0. The aggregated
+                # grades for their sections and overall course will be calculated
+                # without regard for the item they didn't have access to, so it's
+                # possible for a student to have a 0.0 show up in their row but
+                # still have 100% for the course.
+                row_percents = [percents.get(label, 0.0) for label in header]
+                rows.append(
+                    [student.id, student.email, student.username, gradeset['percent']] +
+                    row_percents + cohorts_group_name + group_configs_group_names + team_name +
+                    [enrollment_mode] + [verification_status] + certificate_info
+                )
+            else:
+                # An empty gradeset means we failed to grade a student.
+                task_progress.failed += 1
+                err_rows.append([student.id, student.username, err_msg])
 
     TASK_LOG.info(
         u'%s, Task type: %s, Current step: %s, Grade calculation completed for students: %s/%s',
@@ -1255,13 +1324,16 @@ def upload_exec_summary_report(_xmodule_instance_args, _entry_id, course_id, _ta
     report_generation_date = datetime.now(UTC)
     status_interval = 100
 
-    enrolled_users = CourseEnrollment.objects.users_enrolled_in(course_id)
-    true_enrollment_count = 0
-    for user in enrolled_users:
-        if not user.is_staff and not CourseAccessRole.objects.filter(
-                user=user, course_id=course_id, role__in=FILTERED_OUT_ROLES
-        ).exists():
-            true_enrollment_count += 1
+    filtered_out_user_ids = set(CourseAccessRole.objects.filter(
+        course_id=course_id, role__in=FILTERED_OUT_ROLES
+    ).values_list('user_id', flat=True))
+    filtered_out_user_ids.update(
+        CourseEnrollment.objects.users_enrolled_in(course_id).filter(is_staff=True).values_list('id', flat=True)
+    )
+    true_enrollment_count = sum(
+        1 for enrollment in CourseEnrollment.objects.enrollment_projections(course_id)
+        if enrollment.user_id not in filtered_out_user_ids
+    )
 
     task_progress = TaskProgress(action_name, true_enrollment_count, start_time)
 
@@ -1455,19 +1527,20 @@ def generate_students_certificates(
     task_progress.update_task_state(extra_meta=current_step)
 
     course = modulestore().get_course(course_id, depth=0)
-    # Generate certificate for each student
-    for student in students_require_certs:
-        task_progress.attempted += 1
-        status = generate_user_certificates(
-            student,
+    # Generate certificates for the students, a batch at a time
+    for students_batch in _iterate_in_batches(students_require_certs, CERTIFICATE_GENERATION_BATCH_SIZE):
+        statuses = generate_user_certificates_in_bulk(
+            students_batch,
             course_id,
             course=course
         )
 
-        if CertificateStatuses.is_passing_status(status):
-            task_progress.succeeded += 1
-        else:
-            task_progress.failed += 1
+        for student in students_batch:
+            task_progress.attempted += 1
+            if CertificateStatuses.is_passing_status(statuses[student.id]):
+                task_progress.succeeded += 1
+            else:
+                task_progress.failed += 1
 
     return task_progress.update_task_state(extra_meta=current_step)
 
@@ -1556,6 +1629,123 @@ def cohort_students_and_upload(_xmodule_instance_args, _entry_id, course_id, tas
     return task_progress.update_task_state(extra_meta=current_step)
 
 
+def enroll_students_and_upload(_xmodule_instance_args, entry_id, course_id, task_input, action_name):
+    """
+    Within a given course, enroll or unenroll the students listed in an
+    uploaded CSV file in bulk, a batch at a time, then upload the results
+    using a `ReportStore`.
+    """
+    start_time = time()
+    start_date = datetime.now(UTC)
+    requester = InstructorTask.objects.get(pk=entry_id).requester
+
+    # Iterate through rows to get total students for task progress
+    with DefaultStorage().open(task_input['file_name']) as f:
+        total_students = 0
+        for _line in unicodecsv.DictReader(UniversalNewlineIterator(f)):
+            total_students += 1
+
+    task_progress = TaskProgress(action_name, total_students, start_time)
+    if task_input['action'] == 'enroll':
+        current_step = {'step': 'Enrolling Students'}
+    else:
+        current_step = {'step': 'Unenrolling Students'}
+    task_progress.update_task_state(extra_meta=current_step)
+
+    output_rows = [['Identifier', 'Status']]
+    with DefaultStorage().open(task_input['file_name']) as f:
+        # Try to use the 'email' field to identify the user.  If it's not present, use 'username'.
+        identifiers = (
+            (row.get('email') or row.get('username') or '').strip()
+            for row in unicodecsv.DictReader(UniversalNewlineIterator(f), encoding='utf-8')
+        )
+        for identifiers_batch in _iterate_in_batches(identifiers, CourseEnrollment.BULK_BATCH_SIZE):
+            output_rows.extend(
+                _update_enrollments_batch(identifiers_batch, course_id, task_input, requester, task_progress)
+            )
+            task_progress.update_task_state(extra_meta=current_step)
+
+    current_step['step'] = 'Uploading CSV'
+    task_progress.update_task_state(extra_meta=current_step)
+    upload_csv_to_report_store(output_rows, 'enrollment_results', course_id, start_date)
+
+    return task_progress.update_task_state(extra_meta=current_step)
+
+
+def _update_enrollments_batch(identifiers, course_id, task_input, requester, task_progress):
+    """
+    Enrolls or unenrolls the students with the given emails or usernames,
+    records their manual enrollment audits, and returns the rows of the
+    results report for them.
+    """
+    users = User.objects.filter(
+        Q(email__in=[identifier for identifier in identifiers if '@' in identifier]) |
+        Q(username__in=[identifier for identifier in identifiers if '@' not in identifier])
+    )
+    users_by_identifier = {}
+    for user in users:
+        users_by_identifier[user.email] = user
+        users_by_identifier[user.username] = user
+
+    found_users = {}
+    for identifier in identifiers:
+        user = users_by_identifier.get(identifier)
+        if user is not None:
+            found_users[user.id] = user
+
+    allowed_emails = set(CourseEnrollmentAllowed.objects.filter(
+        course_id=course_id,
+        email__in=[user.email for user in found_users.itervalues()],
+    ).values_list('email', flat=True))
+
+    if task_input['action'] == 'enroll':
+        results = CourseEnrollment.bulk_enroll(found_users.values(), course_id, mode=task_input.get('mode'))
+    else:
+        results = CourseEnrollment.bulk_unenroll(found_users.values(), course_id)
+        CourseEnrollmentAllowed.objects.filter(course_id=course_id, email__in=allowed_emails).delete()
+
+    output_rows = []
+    transitions = []
+    for identifier in identifiers:
+        task_progress.attempted += 1
+        user = users_by_identifier.get(identifier)
+        if user is None:
+            task_progress.failed += 1
+            output_rows.append([identifier, 'User not found'])
+            continue
+
+        before, enrollment = results[user.id]
+        if task_input['action'] == 'enroll':
+            if before.is_active:
+                state_transition = ENROLLED_TO_ENROLLED
+                status = 'Already enrolled' if before.mode == enrollment.mode else 'Enrolled'
+            else:
+                state_transition = (
+                    ALLOWEDTOENROLL_TO_ENROLLED if user.email in allowed_emails else UNENROLLED_TO_ENROLLED
+                )
+                status = 'Enrolled'
+        else:
+            if before.is_active:
+                state_transition = ENROLLED_TO_UNENROLLED
+                status = 'Unenrolled'
+            elif user.email in allowed_emails:
+                state_transition = ALLOWEDTOENROLL_TO_UNENROLLED
+                status = 'Unenrolled'
+            else:
+                state_transition = UNENROLLED_TO_UNENROLLED
+                status = 'Not enrolled'
+
+        if status in ('Already enrolled', 'Not enrolled'):
+            task_progress.skipped += 1
+        else:
+            task_progress.succeeded += 1
+        output_rows.append([identifier, status])
+        transitions.append((user.email, state_transition, enrollment))
+
+    ManualEnrollmentAudit.bulk_create_manual_enrollment_audits(requester, task_input.get('reason'), transitions)
+    return output_rows
+
+
 def students_require_certificate(course_id, enrolled_students, statuses_to_regenerate=None):
     """
     Returns list of students where certificates needs to be generated.
@@ -7,7 +7,7 @@ from mock import Mock, patch
 
 from student.models import CourseEnrollment
 
-from instructor_task.subtasks import queue_subtasks_for_query
+from instructor_task.subtasks import queue_subtasks_for_query, filter_queryset_by_pk_range
 from instructor_task.tests.factories import InstructorTaskFactory
 from instructor_task.tests.test_base import InstructorTaskCourseTestCase
 
@@ -26,7 +26,7 @@ class TestSubtasks(InstructorTaskCourseTestCase):
             random_id = uuid4().hex[:8]
             self.create_student(username='student{0}'.format(random_id))
 
-    def _queue_subtasks(self, create_subtask_fcn, items_per_task, initial_count, extra_count):
+    def _queue_subtasks(self, create_subtask_fcn, items_per_task, initial_count, extra_count, **kwargs):
         """Queue subtasks while enrolling more students into course in the middle of the process."""
 
         task_id = str(uuid4())
@@ -55,6 +55,7 @@ class TestSubtasks(InstructorTaskCourseTestCase):
                 item_fields=[],
                 items_per_task=items_per_task,
                 total_num_items=initial_count,
+                **kwargs
             )
 
     def test_queue_subtasks_for_query1(self):
@@ -80,3 +81,21 @@ class TestSubtasks(InstructorTaskCourseTestCase):
         self.assertEqual(len(mock_create_subtask_fcn_args[0][0][0]), 3)
         self.assertEqual(len(mock_create_subtask_fcn_args[1][0][0]), 3)
         self.assertEqual(len(mock_create_subtask_fcn_args[2][0][0]), 5)
+
+    def test_queue_subtasks_for_query_ranges(self):
+        """Test queue_subtasks_for_query() when dispatching the ranges of the items of each subtask."""
+
+        mock_create_subtask_fcn = Mock()
+        self._queue_subtasks(mock_create_subtask_fcn, 3, 8, 3, dispatch_item_ranges=True)
+
+        # Check that the ranges are contiguous, and cover all of the items
+        pk_ranges = [call_args[0][0] for call_args in mock_create_subtask_fcn.call_args_list]
+        self.assertEqual(len(pk_ranges), 3)
+        self.assertIsNone(pk_ranges[0][0])
+        self.assertIsNone(pk_ranges[-1][1])
+        self.assertEqual(pk_ranges[0][1], pk_ranges[1][0])
+        self.assertEqual(pk_ranges[1][1], pk_ranges[2][0])
+
+        enrollments = CourseEnrollment.objects.filter(course_id=self.course.id)
+        range_sizes = [filter_queryset_by_pk_range(enrollments, pk_range).count() for pk_range in pk_ranges]
+        self.assertEqual(range_sizes, [3, 3, 5])
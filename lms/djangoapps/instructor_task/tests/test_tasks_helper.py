@@ -40,14 +40,19 @@ from openedx.core.djangoapps.user_api.partition_schemes import RandomUserPartiti
 from shoppingcart.models import Order, PaidCourseRegistration, CourseRegistrationCode, Invoice, \
     CourseRegistrationCodeInvoiceItem, InvoiceTransaction, Coupon
 from student.tests.factories import UserFactory, CourseModeFactory
-from student.models import CourseEnrollment, CourseEnrollmentAllowed, ManualEnrollmentAudit, ALLOWEDTOENROLL_TO_ENROLLED
+from student.models import (
+    CourseEnrollment, CourseEnrollmentAllowed, ManualEnrollmentAudit, ALLOWEDTOENROLL_TO_ENROLLED,
+    ENROLLED_TO_UNENROLLED, UNENROLLED_TO_ENROLLED,
+)
 from lms.djangoapps.verify_student.tests.factories import SoftwareSecurePhotoVerificationFactory
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from xmodule.partitions.partitions import Group, UserPartition
 from instructor_task.models import ReportStore
+from instructor_task.tests.factories import InstructorTaskFactory
 from survey.models import SurveyForm, SurveyAnswer
 from instructor_task.tasks_helper import (
     cohort_students_and_upload,
+    enroll_students_and_upload,
     upload_problem_responses_csv,
     upload_grades_csv,
     upload_problem_grade_report,
@@ -1488,6 +1493,91 @@ class TestCohortStudents(TestReportMixin, InstructorTaskCourseTestCase):
         )
 
 
+@patch('instructor_task.tasks_helper.DefaultStorage', new=MockDefaultStorage)
+class TestEnrollStudents(TestReportMixin, InstructorTaskCourseTestCase):
+    """
+    Tests that bulk student enrollment works.
+    """
+    def setUp(self):
+        super(TestEnrollStudents, self).setUp()
+
+        self.course = CourseFactory.create()
+        CourseModeFactory.create(course_id=self.course.id, mode_slug=CourseMode.VERIFIED)
+        self.student_1 = UserFactory.create(username='student_1', email='student_1@example.com')
+        self.student_2 = UserFactory.create(username='student_2', email='student_2@example.com')
+        self.instructor_task = InstructorTaskFactory.create(course_id=self.course.id, task_type='enroll_students')
+        self.csv_header_row = ['Identifier', 'Status']
+
+    def _enroll_students_and_upload(self, csv_data, action='enroll', mode=None):
+        """
+        Call `enroll_students_and_upload` with a file generated from `csv_data`.
+        """
+        task_input = {'action': action, 'mode': mode, 'reason': 'testing'}
+        with tempfile.NamedTemporaryFile() as temp_file:
+            temp_file.write(csv_data.encode('utf-8'))
+            temp_file.flush()
+            task_input['file_name'] = temp_file.name
+            with patch('instructor_task.tasks_helper._get_current_task'):
+                return enroll_students_and_upload(None, self.instructor_task.id, self.course.id, task_input, 'enrolled')
+
+    def test_enroll(self):
+        CourseEnrollment.enroll(self.student_2, self.course.id)
+        CourseEnrollmentAllowed.objects.create(course_id=self.course.id, email=self.student_1.email)
+
+        result = self._enroll_students_and_upload(
+            'username,email\n'
+            ',student_1@example.com\n'
+            'student_2,\n'
+            'nobody,\n'
+        )
+        self.assertDictContainsSubset(
+            {'total': 3, 'attempted': 3, 'succeeded': 1, 'skipped': 1, 'failed': 1}, result
+        )
+        self.assertTrue(CourseEnrollment.is_enrolled(self.student_1, self.course.id))
+        self.verify_rows_in_csv(
+            [
+                dict(zip(self.csv_header_row, ['student_1@example.com', 'Enrolled'])),
+                dict(zip(self.csv_header_row, ['student_2', 'Already enrolled'])),
+                dict(zip(self.csv_header_row, ['nobody', 'User not found'])),
+            ]
+        )
+        audit = ManualEnrollmentAudit.get_manual_enrollment_by_email(self.student_1.email)
+        self.assertEqual(audit.state_transition, ALLOWEDTOENROLL_TO_ENROLLED)
+        self.assertEqual(audit.enrolled_by, self.instructor_task.requester)
+        self.assertEqual(audit.reason, 'testing')
+
+    def test_enroll_in_mode(self):
+        CourseEnrollment.enroll(self.student_2, self.course.id, mode=CourseMode.AUDIT)
+
+        result = self._enroll_students_and_upload('email\nstudent_1@example.com\nstudent_2@example.com',
+                                                  mode=CourseMode.VERIFIED)
+        self.assertDictContainsSubset({'total': 2, 'attempted': 2, 'succeeded': 2, 'failed': 0}, result)
+        for student in (self.student_1, self.student_2):
+            self.assertEqual(
+                CourseEnrollment.enrollment_mode_for_user(student, self.course.id),
+                (CourseMode.VERIFIED, True)
+            )
+        audit = ManualEnrollmentAudit.get_manual_enrollment_by_email(self.student_1.email)
+        self.assertEqual(audit.state_transition, UNENROLLED_TO_ENROLLED)
+
+    def test_unenroll(self):
+        CourseEnrollment.enroll(self.student_1, self.course.id)
+
+        result = self._enroll_students_and_upload('username\nstudent_1\nstudent_2', action='unenroll')
+        self.assertDictContainsSubset(
+            {'total': 2, 'attempted': 2, 'succeeded': 1, 'skipped': 1, 'failed': 0}, result
+        )
+        self.assertFalse(CourseEnrollment.is_enrolled(self.student_1, self.course.id))
+        self.verify_rows_in_csv(
+            [
+                dict(zip(self.csv_header_row, ['student_1', 'Unenrolled'])),
+                dict(zip(self.csv_header_row, ['student_2', 'Not enrolled'])),
+            ]
+        )
+        audit = ManualEnrollmentAudit.get_manual_enrollment_by_email(self.student_1.email)
+        self.assertEqual(audit.state_transition, ENROLLED_TO_UNENROLLED)
+
+
 @ddt.ddt
 @patch('instructor_task.tasks_helper.DefaultStorage', new=MockDefaultStorage)
 class TestGradeReportEnrollmentAndCertificateInfo(TestReportMixin, InstructorTaskModuleTestCase):
@@ -1670,7 +1760,7 @@ class TestCertificateGeneration(InstructorTaskModuleTestCase):
             'failed': 3,
             'skipped': 2
         }
-        with self.assertNumQueries(191):
+        with self.assertNumQueries(116):
             self.assertCertificatesGenerated(task_input, expected_results)
 
         expected_results = {
@@ -229,6 +229,21 @@ class CourseTeamMembership(models.Model):
 
         return queryset
 
+    @classmethod
+    def get_teams_for_users(cls, user_ids, course_id):
+        """
+        Get the team of each of the given users in the given course, with a single query.
+
+        Args:
+            user_ids: the ids of the users that we want to query on
+            course_id: the course_id of the course we're interested in
+
+        Returns:
+            A dict mapping user id to CourseTeam, for the users who are on a team in the course
+        """
+        memberships = cls.objects.filter(user_id__in=user_ids, team__course_id=course_id).select_related('team')
+        return {membership.user_id: membership.team for membership in memberships}
+
     @classmethod
     def user_in_team_for_course(cls, user, course_id):
         """
@@ -114,6 +114,17 @@ class TeamMembershipTest(SharedModuleStoreTestCase):
             expected_value
         )
 
+    @ddt.data(COURSE_KEY1, COURSE_KEY2)
+    def test_get_teams_for_users(self, course_id):
+        users = (self.user1, self.user2, self.user3)
+        with self.assertNumQueries(1):
+            teams = CourseTeamMembership.get_teams_for_users([user.id for user in users], course_id)
+        self.assertEqual(teams, {
+            membership.user_id: membership.team
+            for user in users
+            for membership in CourseTeamMembership.get_memberships(username=user.username, course_ids=[course_id])
+        })
+
 
 @ddt.ddt
 class TeamSignalsTest(EventTestMixin, SharedModuleStoreTestCase):
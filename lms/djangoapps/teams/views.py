@@ -28,6 +28,7 @@ from openedx.core.lib.api.view_utils import (
     ExpandableFieldViewMixin
 )
 from openedx.core.lib.api.paginators import paginate_search_results, DefaultPagination
+from openedx.core.djangoapps.user_api.models import UserPreference
 from xmodule.modulestore.django import modulestore
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
@@ -1071,7 +1072,15 @@ class MembershipListView(ExpandableFieldViewMixin, GenericAPIView):
             course_keys = [CourseKey.from_string(course_string) for course_string in accessible_course_ids]
 
         queryset = CourseTeamMembership.get_memberships(username, course_keys, team_id)
+        expand_user = 'user' in self.get_serializer_context()['expand']
+        if expand_user:
+            queryset = queryset.select_related('user__profile').prefetch_related(
+                'user__profile__language_proficiencies'
+            )
         page = self.paginate_queryset(queryset)
+        if expand_user and page is not None:
+            # Load the preferences of all the members at once, for their profile visibility.
+            UserPreference.get_all_values_for_users([membership.user for membership in page])
         serializer = self.get_serializer(page, many=True)
         return self.get_paginated_response(serializer.data)
 
@@ -7,7 +7,7 @@ from django.dispatch import receiver
 from django.db.models.signals import post_save, pre_save
 
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
-from student.models import CourseEnrollment
+from student.models import CourseEnrollment, ENROLLMENTS_BULK_SAVED
 from courseware.courses import get_course_by_id
 
 from verified_track_content.tasks import sync_cohort_with_mode
@@ -28,31 +28,59 @@ def move_to_verified_cohort(sender, instance, **kwargs):  # pylint: disable=unus
     If the learner has changed modes, update assigned cohort iff the course is using
     the Automatic Verified Track Cohorting MVP feature.
     """
-    course_key = instance.course_id
+    mode_changes = []
+    if instance.mode != instance._old_mode:  # pylint: disable=protected-access
+        mode_changes.append((instance.user.id, instance._old_mode, instance.mode))  # pylint: disable=protected-access
+    _sync_cohorts_with_modes(instance.course_id, mode_changes)
+
+
+@receiver(ENROLLMENTS_BULK_SAVED)
+def move_to_verified_cohort_on_bulk_save(sender, course_id, enrollments, old_modes, **kwargs):  # pylint: disable=unused-argument
+    """
+    Update the assigned cohorts of the learners who have changed modes in enrollments
+    saved in bulk, iff the course is using the Automatic Verified Track Cohorting MVP feature.
+    """
+    mode_changes = [
+        (enrollment.user_id, old_modes[enrollment.id], enrollment.mode)
+        for enrollment in enrollments
+        if enrollment.mode != old_modes[enrollment.id]
+    ]
+    if mode_changes:
+        _sync_cohorts_with_modes(course_id, mode_changes)
+
+
+def _sync_cohorts_with_modes(course_key, mode_changes):
+    """
+    Queue the automatic cohorting of the learners whose enrollment mode changed, given
+    as (user_id, old_mode, mode) tuples, if the course uses verified track cohorts.
+    """
     verified_cohort_enabled = VerifiedTrackCohortedCourse.is_verified_track_cohort_enabled(course_key)
     verified_cohort_name = VerifiedTrackCohortedCourse.verified_cohort_name_for_course(course_key)
 
-    if verified_cohort_enabled and (instance.mode != instance._old_mode):  # pylint: disable=protected-access
-        if not is_course_cohorted(course_key):
-            log.error("Automatic verified cohorting enabled for course '%s', but course is not cohorted.", course_key)
-        else:
-            course = get_course_by_id(course_key)
-            existing_manual_cohorts = get_course_cohorts(course, CourseCohort.MANUAL)
-            if any(cohort.name == verified_cohort_name for cohort in existing_manual_cohorts):
-                # Get a random cohort to use as the default cohort (for audit learners).
-                # Note that calling this method will create a "Default Group" random cohort if no random
-                # cohort yet exist.
-                random_cohort = get_random_cohort(course_key)
+    if not verified_cohort_enabled or not mode_changes:
+        return
+
+    if not is_course_cohorted(course_key):
+        log.error("Automatic verified cohorting enabled for course '%s', but course is not cohorted.", course_key)
+    else:
+        course = get_course_by_id(course_key)
+        existing_manual_cohorts = get_course_cohorts(course, CourseCohort.MANUAL)
+        if any(cohort.name == verified_cohort_name for cohort in existing_manual_cohorts):
+            # Get a random cohort to use as the default cohort (for audit learners).
+            # Note that calling this method will create a "Default Group" random cohort if no random
+            # cohort yet exist.
+            random_cohort = get_random_cohort(course_key)
+            for user_id, old_mode, mode in mode_changes:
                 args = {
                     'course_id': unicode(course_key),
-                    'user_id': instance.user.id,
+                    'user_id': user_id,
                     'verified_cohort_name': verified_cohort_name,
                     'default_cohort_name': random_cohort.name
                 }
                 log.info(
                     "Queuing automatic cohorting for user '%s' in course '%s' "
                     "due to change in enrollment mode from '%s' to '%s'.",
-                    instance.user.id, course_key, instance._old_mode, instance.mode  # pylint: disable=protected-access
+                    user_id, course_key, old_mode, mode
                 )
 
                 # Do the update with a 3-second delay in hopes that the CourseEnrollment transaction has been
@@ -63,13 +91,13 @@ def move_to_verified_cohort(sender, instance, **kwargs):  # pylint: disable=unus
                 # In case the transaction actually was not committed before the celery task runs,
                 # run it again after 5 minutes. If the first completed successfully, this task will be a no-op.
                 sync_cohort_with_mode.apply_async(kwargs=args, countdown=300)
-            else:
-                log.error(
-                    "Automatic verified cohorting enabled for course '%s', "
-                    "but verified cohort named '%s' does not exist.",
-                    course_key,
-                    verified_cohort_name,
-                )
+        else:
+            log.error(
+                "Automatic verified cohorting enabled for course '%s', "
+                "but verified cohort named '%s' does not exist.",
+                course_key,
+                verified_cohort_name,
+            )
 
 
 @receiver(pre_save, sender=CourseEnrollment)
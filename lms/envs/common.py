@@ -454,6 +454,9 @@ OAUTH2_PROVIDER = {
 # TODO: Move the Mako templating into a different engine in TEMPLATES below.
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_lms')
+# Whether to eagerly load (and verify) every mako template at startup, e.g. the ones
+# compiled ahead of time into MAKO_MODULE_DIR by the `compile_mako_templates` command.
+MAKO_PRECOMPILE_TEMPLATES = False
 MAKO_TEMPLATES = {}
 MAKO_TEMPLATES['main'] = [PROJECT_ROOT / 'templates',
                           COMMON_ROOT / 'templates',
@@ -769,6 +772,11 @@ DEBUG = False
 USE_TZ = True
 SESSION_COOKIE_SECURE = False
 SESSION_SAVE_EVERY_REQUEST = False
+
+# Verify the safe session cookie only once the session is loaded by the request.
+SAFE_SESSIONS_LAZY_VERIFICATION = False
+# Reuse the safe session cookie of the request in the response if it was signed less than this many seconds ago.
+SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE = 60 * 60
 SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
 
 # CMS base
@@ -1825,6 +1833,10 @@ BULK_EMAIL_LOG_SENT_EMAILS = False
 # parallel, and what the SES rate is.
 BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS = 0.02
 
+# Number of messages sent over a subtask's connection between each aggregated
+# log line and statsd report.
+BULK_EMAIL_SEND_BATCH_SIZE = 50
+
 ############################# Email Opt In ####################################
 
 # Minimum age for organization-wide email opt in
@@ -1892,6 +1904,9 @@ INSTALLED_APPS = (
     # Theming
     'openedx.core.djangoapps.theming',
 
+    # Session cookies bound to their user
+    'openedx.core.djangoapps.safe_sessions',
+
     # Site configuration for theming and behavioral modification
     'openedx.core.djangoapps.site_configuration',
 
@@ -2670,6 +2685,14 @@ COURSE_ABOUT_VISIBILITY_PERMISSION = 'see_exists'
 # Enrollment API Cache Timeout
 ENROLLMENT_COURSE_DETAILS_CACHE_TIMEOUT = 60
 
+# How long, in seconds, CourseOverview.get_many keeps course overviews in a cache
+# local to each process. Set to 0 to disable this cache.
+COURSE_OVERVIEW_PROCESS_CACHE_TIMEOUT = 60
+
+# How long, in seconds, ConfigurationModel.current keeps configurations in each
+# process, in front of the configuration cache. Set to 0 to disable this cache.
+CONFIG_MODELS_PROCESS_CACHE_TIMEOUT = 5
+
 
 OAUTH_ID_TOKEN_EXPIRATION = 60 * 60
 
@@ -230,6 +230,10 @@ CACHES = {
     },
 }
 
+# Don't keep course overviews or configurations across tests.
+COURSE_OVERVIEW_PROCESS_CACHE_TIMEOUT = 0
+CONFIG_MODELS_PROCESS_CACHE_TIMEOUT = 0
+
 # Dummy secret key for dev
 SECRET_KEY = '85920908f28904ed733fe576320db18cabd7b6cd'
 
@@ -549,6 +553,7 @@ FACEBOOK_API_VERSION = "v2.2"
 
 ######### custom courses #########
 INSTALLED_APPS += ('lms.djangoapps.ccx', 'openedx.core.djangoapps.ccxcon')
+MIDDLEWARE_CLASSES += ('lms.djangoapps.ccx.middleware.CcxOverridesVersionMiddleware',)
 FEATURES['CUSTOM_COURSES_EDX'] = True
 
 # Set dummy values for profile image settings.
@@ -3,8 +3,11 @@ Declaration of CourseOverview model
 """
 import json
 import logging
+import time
 from urlparse import urlparse, urlunparse
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models, transaction
 from django.db.models.fields import BooleanField, DateTimeField, DecimalField, TextField, FloatField, IntegerField
 from django.db.utils import IntegrityError
@@ -29,6 +32,10 @@ from openedx.core.djangoapps.xmodule_django.models import CourseKeyField, UsageK
 
 log = logging.getLogger(__name__)
 
+# The CourseOverviews recently loaded by CourseOverview.get_many in this
+# process, keyed by course id, as (expiration time, course overview) pairs.
+_PROCESS_CACHE = {}
+
 
 class CourseOverview(TimeStampedModel):
     """
@@ -48,6 +55,12 @@ class CourseOverview(TimeStampedModel):
     # IMPORTANT: Bump this whenever you modify this model and/or add a migration.
     VERSION = 4
 
+    # Cache key and lifetime, in seconds, of the marker set when get_many enqueues
+    # the regeneration of a course's overview, so the task is not enqueued again
+    # by every request until it has run.
+    REGENERATE_TASK_MARKER_KEY = u'course_overviews.regenerate_task.{}'
+    REGENERATE_TASK_MARKER_TIMEOUT = 60 * 5
+
     # Cache entry versioning.
     version = IntegerField()
 
@@ -277,6 +290,89 @@ class CourseOverview(TimeStampedModel):
 
         return course_overview or cls.load_from_module_store(course_id)
 
+    @classmethod
+    def get_many(cls, course_ids):
+        """
+        Load the CourseOverviews of several courses.
+
+        Overviews loaded within the last COURSE_OVERVIEW_PROCESS_CACHE_TIMEOUT
+        seconds are returned from a cache local to the process, unless their
+        row was modified since (e.g. by a course publish handled in another
+        process), which is checked with a single query on the modified
+        timestamps. The others are loaded from the database with a single
+        query. Overviews that are missing from the database are created from
+        the modulestore, as get_from_id does. Overviews of an older
+        CourseOverview.VERSION, or without thumbnail images, are returned as
+        they are, and regenerated by a celery task instead of on the request
+        path. That task is only enqueued once per course every
+        REGENERATE_TASK_MARKER_TIMEOUT seconds.
+
+        Arguments:
+            course_ids (iterable of CourseKey): the IDs of the course overviews to be loaded.
+
+        Returns:
+            dict: maps course IDs to CourseOverviews. Courses that were not
+                found, or could not be loaded from the module store, are not
+                included.
+        """
+        course_ids = set(course_ids)
+        timeout = settings.COURSE_OVERVIEW_PROCESS_CACHE_TIMEOUT
+        now = time.time()
+
+        cached_course_overviews = {}
+        for course_id in course_ids:
+            expiration_time, course_overview = _PROCESS_CACHE.get(course_id, (None, None))
+            if course_overview is not None and expiration_time > now:
+                cached_course_overviews[course_id] = course_overview
+
+        course_overviews = {}
+        if cached_course_overviews:
+            for current in cls.objects.filter(id__in=list(cached_course_overviews)).only('modified'):
+                course_overview = cached_course_overviews[current.id]
+                if course_overview.modified == current.modified:
+                    course_overviews[current.id] = course_overview
+
+        uncached_course_ids = course_ids - set(course_overviews)
+        if not uncached_course_ids:
+            return course_overviews
+
+        images_enabled = CourseOverviewImageConfig.current().enabled
+        stale_course_ids = []
+        for course_overview in cls.objects.select_related('image_set').filter(id__in=list(uncached_course_ids)):
+            course_overviews[course_overview.id] = course_overview
+            is_outdated = course_overview.version < cls.VERSION
+            if is_outdated or (images_enabled and not hasattr(course_overview, 'image_set')):
+                # cache.add fails if another request already enqueued the regeneration of this course.
+                if cache.add(cls.REGENERATE_TASK_MARKER_KEY.format(course_overview.id), True,
+                             cls.REGENERATE_TASK_MARKER_TIMEOUT):
+                    stale_course_ids.append(course_overview.id)
+            elif timeout:
+                _PROCESS_CACHE[course_overview.id] = (now + timeout, course_overview)
+
+        for course_id in uncached_course_ids - set(course_overviews):
+            try:
+                course_overviews[course_id] = cls.load_from_module_store(course_id)
+            except (cls.DoesNotExist, IOError):
+                log.warning(u"Could not load course overview for %s", unicode(course_id))
+
+        if stale_course_ids:
+            # Import here, as the tasks module imports this one.
+            from .tasks import regenerate_course_overviews
+            regenerate_course_overviews.delay([unicode(course_id) for course_id in stale_course_ids])
+
+        return course_overviews
+
+    @classmethod
+    def clear_process_cache(cls, course_id=None):
+        """
+        Forget the CourseOverviews of the given course, or of all courses,
+        cached in this process by get_many.
+        """
+        if course_id is None:
+            _PROCESS_CACHE.clear()
+        else:
+            _PROCESS_CACHE.pop(course_id, None)
+
     def clean_id(self, padding_char='='):
         """
         Returns a unique deterministic base32-encoded ID for the course.
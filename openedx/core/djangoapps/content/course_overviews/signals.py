@@ -13,6 +13,7 @@ def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable
     Catches the signal that a course has been published in Studio and
     updates the corresponding CourseOverview cache entry.
     """
+    CourseOverview.clear_process_cache(course_key)
     CourseOverview.objects.filter(id=course_key).delete()
     CourseOverview.load_from_module_store(course_key)
 
@@ -23,6 +24,7 @@ def _listen_for_course_delete(sender, course_key, **kwargs):  # pylint: disable=
     Catches the signal that a course has been deleted from Studio and
     invalidates the corresponding CourseOverview cache entry if one exists.
     """
+    CourseOverview.clear_process_cache(course_key)
     CourseOverview.objects.filter(id=course_key).delete()
     # import CourseAboutSearchIndexer inline due to cyclic import
     from cms.djangoapps.contentstore.courseware_index import CourseAboutSearchIndexer
@@ -0,0 +1,26 @@
+"""
+Tasks for course overviews.
+"""
+import logging
+
+from celery.task import task  # pylint: disable=import-error,no-name-in-module
+from opaque_keys.edx.keys import CourseKey
+
+from .models import CourseOverview
+
+log = logging.getLogger('edx.celery.task')
+
+
+@task(name=u'openedx.core.djangoapps.content.course_overviews.tasks.regenerate_course_overviews')
+def regenerate_course_overviews(course_ids):
+    """
+    Regenerate the outdated CourseOverviews, or missing thumbnail images, of
+    the given courses.
+
+    Arguments:
+        course_ids (list of unicode): string representations of course keys.
+    """
+    course_keys = [CourseKey.from_string(course_id) for course_id in course_ids]
+    log.info(u'Regenerating course overviews for %d courses.', len(course_keys))
+    # get_from_id replaces overviews of an older version, and creates missing image sets.
+    CourseOverview.get_select_courses(course_keys)
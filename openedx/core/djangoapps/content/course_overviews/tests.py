@@ -13,6 +13,7 @@ import pytz
 from django.conf import settings
 from django.test.utils import override_settings
 from django.utils import timezone
+from opaque_keys.edx.keys import CourseKey
 from PIL import Image
 
 from lms.djangoapps.certificates.api import get_active_web_certificate
@@ -459,6 +460,56 @@ class CourseOverviewTestCase(ModuleStoreTestCase):
             set(select_course_ids),
         )
 
+    def test_get_many(self):
+        course_ids = [CourseFactory.create().id for __ in range(3)]
+        missing_course_id = CourseKey.from_string('course-v1:Missing+Course+Run')
+        course_overviews = CourseOverview.get_many(course_ids[:2] + [missing_course_id])
+        self.assertEqual(set(course_overviews), set(course_ids[:2]))
+        for course_id, course_overview in course_overviews.iteritems():
+            self.assertEqual(course_overview.id, course_id)
+
+    @override_settings(COURSE_OVERVIEW_PROCESS_CACHE_TIMEOUT=60)
+    def test_get_many_process_cache(self):
+        CourseOverview.clear_process_cache()
+        self.addCleanup(CourseOverview.clear_process_cache)
+        course = CourseFactory.create(mobile_available=True, emit_signals=True)
+        self.assertTrue(CourseOverview.get_many([course.id])[course.id].mobile_available)
+
+        # Only the modified timestamp of the overview is fetched.
+        with self.assertNumQueries(1):
+            self.assertTrue(CourseOverview.get_many([course.id])[course.id].mobile_available)
+
+        # Publishing the course evicts its overview from the cache.
+        course.mobile_available = False
+        with self.store.branch_setting(ModuleStoreEnum.Branch.draft_preferred):
+            self.store.update_item(course, ModuleStoreEnum.UserID.test)
+        self.assertFalse(CourseOverview.get_many([course.id])[course.id].mobile_available)
+
+        # Overviews modified by another process are reloaded.
+        CourseOverview.objects.filter(id=course.id).update(
+            mobile_available=True, modified=timezone.now() + datetime.timedelta(seconds=1)
+        )
+        self.assertTrue(CourseOverview.get_many([course.id])[course.id].mobile_available)
+
+    def test_get_many_regenerates_old_versions(self):
+        course = CourseFactory.create(emit_signals=True)
+        CourseOverview.objects.filter(id=course.id).update(version=CourseOverview.VERSION - 1)
+
+        # The outdated overview is returned as is, and regenerated by a task.
+        self.assertEqual(CourseOverview.get_many([course.id])[course.id].version, CourseOverview.VERSION - 1)
+        self.assertEqual(CourseOverview.objects.get(id=course.id).version, CourseOverview.VERSION)
+
+    def test_get_many_enqueues_regeneration_once(self):
+        course = CourseFactory.create(emit_signals=True)
+        CourseOverview.objects.filter(id=course.id).update(version=CourseOverview.VERSION - 1)
+
+        with mock.patch(
+            'openedx.core.djangoapps.content.course_overviews.tasks.regenerate_course_overviews.delay'
+        ) as mock_delay:
+            CourseOverview.get_many([course.id])
+            CourseOverview.get_many([course.id])
+        mock_delay.assert_called_once_with([unicode(course.id)])
+
     def test_get_all_courses(self):
         course_ids = [CourseFactory.create(emit_signals=True).id for __ in range(3)]
         self.assertEqual(
@@ -201,6 +201,30 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
     return request_cache.data.setdefault(cache_key, membership.course_user_group)
 
 
+def get_cohorts_for_users(course_key, user_ids):
+    """Returns the cohorts of the given users in the specified course.
+
+    Unlike get_cohort, users without a cohort are never assigned one, and
+    the cohorts are fetched with a single query rather than one per user.
+
+    Arguments:
+        course_key: CourseKey
+        user_ids: iterable of User ids
+
+    Returns:
+        A dict mapping user id to CourseUserGroup.  Users who have no cohort
+        are not included, and the dict is empty if the course is not cohorted.
+    """
+    if not get_course_cohort_settings(course_key).is_cohorted:
+        return {}
+
+    memberships = CohortMembership.objects.filter(
+        course_id=course_key,
+        user_id__in=user_ids,
+    ).select_related('course_user_group')
+    return {membership.user_id: membership.course_user_group for membership in memberships}
+
+
 def get_random_cohort(course_key):
     """
     Helper method to get a cohort for random assignment.
@@ -262,6 +262,27 @@ class TestCohorts(ModuleStoreTestCase):
             "other_user should be assigned to the default cohort"
         )
 
+    def test_get_cohorts_for_users(self):
+        """
+        Make sure cohorts.get_cohorts_for_users() returns the cohorts of users who have one
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        user = UserFactory(username="test", email="a@b.com")
+        other_user = UserFactory(username="test2", email="a2@b.com")
+        cohort = CohortFactory(course_id=course.id, name="TestCohort", users=[user])
+        user_ids = [user.id, other_user.id]
+
+        self.assertEqual(
+            cohorts.get_cohorts_for_users(course.id, user_ids), {},
+            "Course isn't cohorted, so users shouldn't have cohorts"
+        )
+
+        config_course_cohorts(course, is_cohorted=True)
+        with self.assertNumQueries(2):
+            user_cohorts = cohorts.get_cohorts_for_users(course.id, user_ids)
+        self.assertEqual(user_cohorts, {user.id: cohort})
+        self.assertIsNone(cohorts.get_cohort(other_user, course.id, assign=False), "other_user shouldn't be assigned")
+
     @ddt.data(
         (True, 3),
         (False, 9),
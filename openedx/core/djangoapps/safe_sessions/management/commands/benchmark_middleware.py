@@ -0,0 +1,136 @@
+"""
+Management command for measuring the time spent in each middleware on a request.
+
+Example:
+    ./manage.py lms benchmark_middleware /c4x/edX/DemoX/asset/logo.png --username=staff --settings=aws
+"""
+from collections import OrderedDict
+from importlib import import_module
+import time
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import User
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.management import BaseCommand, CommandError
+from django.http import HttpResponse
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+from django.utils.module_loading import import_string
+
+from ...middleware import SafeCookieData
+
+
+class Command(BaseCommand):
+    """
+    Runs a GET request through the process_request and process_response
+    methods of the configured middleware, without any view, and reports
+    the average time spent in each of them.
+    """
+    help = 'Measure the time spent in each middleware on a request.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            nargs='?',
+            default='/',
+            help='The path of the request.',
+        )
+        parser.add_argument(
+            '--username',
+            default=None,
+            help='Send the request with the safe session cookie of a new session of this user.',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=1000,
+            help='How many times to run the request through the middleware.',
+        )
+        parser.add_argument(
+            '--lazy-safe-sessions',
+            action='store_true',
+            default=False,
+            help='Verify the safe session cookie lazily, regardless of SAFE_SESSIONS_LAZY_VERIFICATION.',
+        )
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('The number of iterations must be positive.')
+
+        session, cookie = self._create_session(options['username']) if options['username'] else (None, None)
+        try:
+            with override_settings(
+                SAFE_SESSIONS_LAZY_VERIFICATION=(
+                    options['lazy_safe_sessions'] or getattr(settings, 'SAFE_SESSIONS_LAZY_VERIFICATION', False)
+                )
+            ):
+                timings = self._benchmark(options['path'], cookie, options['iterations'])
+        finally:
+            if session is not None:
+                session.delete()
+
+        total = 0
+        for middleware_path, seconds in timings.iteritems():
+            per_request = seconds / options['iterations']
+            total += per_request
+            self.stdout.write(u'{:>10.1f} us  {}'.format(per_request * 1e6, middleware_path))
+        self.stdout.write(u'{:>10.1f} us  total per request'.format(total * 1e6))
+
+    @staticmethod
+    def _create_session(username):
+        """
+        Returns a new saved session in which the given user is logged
+        in, along with its safe session cookie.
+        """
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(u'No user named {}.'.format(username))
+
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)  # pylint: disable=protected-access
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+        return session, unicode(SafeCookieData.create(session.session_key, user.id))
+
+    @staticmethod
+    def _benchmark(path, cookie, iterations):
+        """
+        Returns an ordered dict of the total time, in seconds, spent in
+        each middleware while running the requests.
+        """
+        middlewares = []
+        for middleware_path in settings.MIDDLEWARE_CLASSES:
+            try:
+                middlewares.append((middleware_path, import_string(middleware_path)()))
+            except MiddlewareNotUsed:
+                continue
+
+        timings = OrderedDict((middleware_path, 0.0) for middleware_path, __ in middlewares)
+        request_factory = RequestFactory()
+        for __ in xrange(iterations):
+            request = request_factory.get(path)
+            if cookie is not None:
+                request.COOKIES[settings.SESSION_COOKIE_NAME] = cookie
+
+            response = None
+            applied = []
+            for middleware_path, middleware in middlewares:
+                applied.append((middleware_path, middleware))
+                if hasattr(middleware, 'process_request'):
+                    start = time.time()
+                    response = middleware.process_request(request)
+                    timings[middleware_path] += time.time() - start
+                    if response is not None:
+                        break
+
+            if response is None:
+                response = HttpResponse()
+            for middleware_path, middleware in reversed(applied):
+                if hasattr(middleware, 'process_response'):
+                    start = time.time()
+                    response = middleware.process_response(request, response)
+                    timings[middleware_path] += time.time() - start
+        return timings
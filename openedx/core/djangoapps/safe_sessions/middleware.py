@@ -54,6 +54,20 @@ to the browser that the cookie should be sent only over an
 SSL-protected channel.  Otherwise, a session hijacker could copy
 the entire cookie and use it to impersonate the victim.
 
+When settings.SAFE_SESSIONS_LAZY_VERIFICATION is set, the safe cookie
+data is only verified once the session is loaded by the request, so
+requests which never look at the session, such as the ones for static
+assets, don't pay for it.  A cookie which fails the lazy verification
+can no longer turn into a redirect to the login page; the request is
+handled with an empty session instead, and the cookie is deleted.
+
+A response reuses the safe cookie data of the request rather than
+signing a new one when it is still bound to the same session and user,
+and was signed less than settings.SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE
+seconds ago, capped at half of settings.SESSION_COOKIE_AGE so that the
+signature of an active session keeps being refreshed well before the
+session cookie expires.
+
 """
 
 from contextlib import contextmanager
@@ -66,6 +80,7 @@ from django.http import HttpResponse
 from django.utils.crypto import get_random_string
 from hashlib import sha256
 from logging import getLogger, ERROR
+import time
 
 from openedx.core.lib.mobile_utils import is_request_from_mobile_app
 
@@ -170,6 +185,15 @@ class SafeCookieData(object):
         data_to_sign = self._compute_digest(user_id)
         self.signature = signing.dumps(data_to_sign, salt=self.key_salt)
 
+    def signed_at(self):
+        """
+        Returns the time, in seconds since the epoch, at which this
+        safe cookie data was signed.  Only meaningful once the
+        signature is verified.
+        """
+        __, timestamp, __ = self.signature.rsplit(':', 2)
+        return signing.b62_decode(timestamp)
+
     def verify(self, user_id):
         """
         Verifies the signature of this safe cookie data.
@@ -235,6 +259,12 @@ class SafeSessionMiddleware(SessionMiddleware):
     A safer middleware implementation that uses SafeCookieData instead
     of just the session id to lookup and verify a user's session.
     """
+    def __init__(self):
+        super(SafeSessionMiddleware, self).__init__()
+        self.lazy_verification = getattr(settings, 'SAFE_SESSIONS_LAZY_VERIFICATION', False)
+        if self.lazy_verification:
+            self.SessionStore = _get_lazily_verified_session_store(self.SessionStore)
+
     def process_request(self, request):
         """
         Processing the request is a multi-step process, as follows:
@@ -258,6 +288,9 @@ class SafeSessionMiddleware(SessionMiddleware):
         separately in the request object so it is available for another
         final verification before sending the response (in
         process_response).
+
+        With lazy verification, steps 4 and 5 are postponed until the
+        session is loaded.
         """
 
         cookie_data_string = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
@@ -273,6 +306,7 @@ class SafeSessionMiddleware(SessionMiddleware):
 
             else:
                 request.COOKIES[settings.SESSION_COOKIE_NAME] = safe_cookie_data.session_id  # Step 2
+                request.safe_cookie_data = safe_cookie_data
 
         process_request_response = super(SafeSessionMiddleware, self).process_request(request)  # Step 3
         if process_request_response:
@@ -280,7 +314,10 @@ class SafeSessionMiddleware(SessionMiddleware):
             # return the response.
             return process_request_response
 
-        if cookie_data_string and request.session.get(SESSION_KEY):
+        if cookie_data_string and self.lazy_verification:
+            request.session.on_load = lambda session: self._verify_lazily(request, safe_cookie_data)
+
+        elif cookie_data_string and request.session.get(SESSION_KEY):
 
             user_id = self.get_user_id_from_session(request)
             if safe_cookie_data.verify(user_id):  # Step 4
@@ -308,7 +345,9 @@ class SafeSessionMiddleware(SessionMiddleware):
 
         Step 3. If a cookie is being sent with the response, update
         the cookie by replacing its session_id with a safe_cookie_data
-        that binds the session and its corresponding user.
+        that binds the session and its corresponding user.  The
+        safe_cookie_data of the request is reused if it is still valid
+        for the cookie.
 
         Step 4. Delete the cookie, if it's marked for deletion.
 
@@ -325,7 +364,8 @@ class SafeSessionMiddleware(SessionMiddleware):
                     # Use the user_id marked in the session instead of the
                     # one in the request in case the user is not set in the
                     # request, for example during Anonymous API access.
-                    self.update_with_safe_session_cookie(response.cookies, user_id_in_session)  # Step 3
+                    if not self._reuse_safe_session_cookie(request, response.cookies, user_id_in_session):
+                        self.update_with_safe_session_cookie(response.cookies, user_id_in_session)  # Step 3
 
             except SafeCookieError:
                 _mark_cookie_for_deletion(request)
@@ -335,6 +375,55 @@ class SafeSessionMiddleware(SessionMiddleware):
 
         return response
 
+    def _verify_lazily(self, request, safe_cookie_data):
+        """
+        Verifies that the user bound in the safe_cookie_data matches
+        the user in the session, once the session is loaded.
+
+        Since the response can no longer be replaced by a redirect,
+        the session is replaced by an empty one on failure, and the
+        cookie is marked for deletion.
+        """
+        if not request.session.get(SESSION_KEY):
+            return
+
+        user_id = self.get_user_id_from_session(request)
+        if safe_cookie_data.verify(user_id):  # Step 4
+            request.safe_cookie_verified_user_id = user_id  # Step 5
+        else:
+            _mark_cookie_for_deletion(request)
+            # Make sure the session of the bound user can't be saved over.
+            request.session._session_key = None  # pylint: disable=protected-access
+            request.session._session_cache = {}  # pylint: disable=protected-access
+
+    @staticmethod
+    def _reuse_safe_session_cookie(request, cookies, user_id):
+        """
+        Puts the safe_cookie_data of the request back in the session
+        cookie if it was verified for the same user, is bound to the
+        same session and was signed recently enough.
+
+        Returns whether the safe_cookie_data was reused.
+        """
+        safe_cookie_data = getattr(request, 'safe_cookie_data', None)
+        if (
+                safe_cookie_data is None or
+                user_id is None or
+                getattr(request, 'safe_cookie_verified_user_id', None) != user_id or
+                cookies[settings.SESSION_COOKIE_NAME].value != safe_cookie_data.session_id
+        ):
+            return False
+
+        max_age = min(
+            getattr(settings, 'SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE', 0),
+            settings.SESSION_COOKIE_AGE / 2,
+        )
+        if time.time() - safe_cookie_data.signed_at() >= max_age:
+            return False
+
+        cookies[settings.SESSION_COOKIE_NAME] = unicode(safe_cookie_data)
+        return True
+
     @staticmethod
     def _on_user_authentication_failed(request):
         """
@@ -426,6 +515,38 @@ class SafeSessionMiddleware(SessionMiddleware):
         cookies[settings.SESSION_COOKIE_NAME] = unicode(safe_cookie_data)
 
 
+_LAZILY_VERIFIED_SESSION_STORES = {}
+
+
+def _get_lazily_verified_session_store(session_store):
+    """
+    Returns a subclass of the given session store class whose
+    on_load callback, if any, is called the first time the session
+    is loaded.
+    """
+    if session_store not in _LAZILY_VERIFIED_SESSION_STORES:
+
+        class LazilyVerifiedSessionStore(session_store):
+            """
+            Session store which calls its on_load callback once its
+            data is loaded.
+            """
+            on_load = None
+
+            def _get_session(self, no_load=False):
+                on_load, self.on_load = self.on_load, None
+                session = super(LazilyVerifiedSessionStore, self)._get_session(no_load)
+                if on_load is None:
+                    return session
+                on_load(self)
+                return self._session_cache
+
+            _session = property(_get_session)
+
+        _LAZILY_VERIFIED_SESSION_STORES[session_store] = LazilyVerifiedSessionStore
+    return _LAZILY_VERIFIED_SESSION_STORES[session_store]
+
+
 def _mark_cookie_for_deletion(request):
     """
     Updates the given request object to designate that the session
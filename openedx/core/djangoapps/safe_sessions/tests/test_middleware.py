@@ -4,6 +4,7 @@
 Unit tests for SafeSessionMiddleware
 """
 import ddt
+import time
 from django.conf import settings
 from django.contrib.auth import SESSION_KEY
 from django.contrib.auth.models import AnonymousUser
@@ -131,6 +132,33 @@ class TestSafeSessionProcessRequest(TestSafeSessionsLogMixin, TestCase):
             self.assert_response(safe_cookie_data, success=False)
         self.assert_user_in_session()
 
+    @override_settings(SAFE_SESSIONS_LAZY_VERIFICATION=True)
+    def test_lazy_verification(self):
+        self.client.login(username=self.user.username, password='test')
+        safe_cookie_data = SafeCookieData.create(self.client.session.session_key, self.user.id)
+
+        with patch.object(SafeCookieData, 'verify', return_value=True) as mock_verify:
+            self.assert_response(safe_cookie_data)
+            self.assertFalse(mock_verify.called)
+            self.assertIsNone(getattr(self.request, 'safe_cookie_verified_user_id', None))
+
+            # the safe cookie data is verified once the session is loaded
+            self.assert_user_in_session()
+            self.assert_user_in_session()
+            self.assertEquals(mock_verify.call_count, 1)
+        self.assertEquals(self.request.safe_cookie_verified_user_id, self.user.id)
+
+    @override_settings(SAFE_SESSIONS_LAZY_VERIFICATION=True)
+    def test_lazy_verification_invalid_user(self):
+        self.client.login(username=self.user.username, password='test')
+        safe_cookie_data = SafeCookieData.create(self.client.session.session_key, 'no_such_user')
+        self.assert_response(safe_cookie_data)
+
+        with self.assert_incorrect_user_logged():
+            self.assert_no_user_in_session()
+        self.assertTrue(self.request.need_to_delete_cookie)
+        self.assertIsNone(self.request.session.session_key)
+
 
 @attr(shard=2)
 @ddt.ddt
@@ -284,6 +312,40 @@ class TestSafeSessionMiddleware(TestSafeSessionsLogMixin, TestCase):
     def test_success(self):
         self.verify_success()
 
+    def test_reuse_cookie(self):
+        self.verify_success()
+        self.assertEquals(
+            self.client.response.cookies[settings.SESSION_COOKIE_NAME].value,
+            unicode(self.request.safe_cookie_data),
+        )
+
+    @override_settings(SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE=0)
+    def test_refresh_cookie(self):
+        self.verify_success()
+        safe_cookie_data = SafeCookieData.parse(self.client.response.cookies[settings.SESSION_COOKIE_NAME].value)
+        self.assertNotEquals(safe_cookie_data.key_salt, self.request.safe_cookie_data.key_salt)
+        self.assertTrue(safe_cookie_data.verify(self.user.id))
+
+    @override_settings(SAFE_SESSIONS_COOKIE_REUSE_MAX_AGE=60 * 60, SESSION_COOKIE_AGE=60)
+    def test_refresh_cookie_reuse_capped_by_session_age(self):
+        # the cookie was signed more than half of the session age ago
+        with patch.object(SafeCookieData, 'signed_at', lambda __: time.time() - 40):
+            self.verify_success()
+        self.assertNotEquals(
+            self.client.response.cookies[settings.SESSION_COOKIE_NAME].value,
+            unicode(self.request.safe_cookie_data),
+        )
+
+    def test_new_cookie_for_different_user(self):
+        self.verify_success()
+        other_user = UserFactory.create()
+        self.request.user = other_user
+        SafeSessionMiddleware.set_user_id_in_session(self.request, other_user)
+
+        response = SafeSessionMiddleware().process_response(self.request, self.client.response)
+        safe_cookie_data = SafeCookieData.parse(response.cookies[settings.SESSION_COOKIE_NAME].value)
+        self.assertTrue(safe_cookie_data.verify(other_user.id))
+
     def test_success_from_mobile_web_view(self):
         self.request.path = '/xblock/block-v1:org+course+run+type@html+block@block_id'
         self.verify_success()
@@ -24,6 +24,7 @@ from ..errors import (
 )
 from ..forms import PasswordResetFormNoActive
 from ..helpers import intercept_errors
+from ..models import UserPreference
 
 from . import (
     EMAIL_MIN_LENGTH, EMAIL_MAX_LENGTH, PASSWORD_MIN_LENGTH, PASSWORD_MAX_LENGTH,
@@ -72,10 +73,16 @@ def get_account_settings(request, usernames=None, configuration=None, view=None)
     requesting_user = request.user
     usernames = usernames or [requesting_user.username]
 
-    requested_users = User.objects.select_related('profile').filter(username__in=usernames)
+    requested_users = User.objects.select_related('profile').prefetch_related(
+        'profile__language_proficiencies'
+    ).filter(username__in=usernames)
     if not requested_users:
         raise UserNotFound()
 
+    if len(requested_users) > 1:
+        # Load the preferences of all the users at once, for their visibility settings.
+        UserPreference.get_all_values_for_users(requested_users)
+
     serialized_users = []
     for user in requested_users:
         has_full_access = requesting_user.is_staff or requesting_user.username == user.username
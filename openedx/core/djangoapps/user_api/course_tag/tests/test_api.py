@@ -36,3 +36,17 @@ class TestCourseTagAPI(TestCase):
         course_tag_api.set_course_tag(self.user, self.course_id, self.test_key, test_value)
         tag = course_tag_api.get_course_tag(self.user, self.course_id, self.test_key)
         self.assertEqual(tag, test_value)
+
+    def test_get_course_tags_for_users(self):
+        users = [self.user] + [UserFactory.create() for __ in range(2)]
+        course_tag_api.set_course_tag(users[0], self.course_id, self.test_key, 'value')
+        course_tag_api.set_course_tag(users[1], self.course_id, self.test_key, 'value2')
+        course_tag_api.set_course_tag(users[2], self.course_id, 'other_key', 'value')
+
+        with self.assertNumQueries(1):
+            tags = course_tag_api.get_course_tags_for_users([user.id for user in users], self.course_id, self.test_key)
+        self.assertEqual(tags, {
+            user.id: course_tag_api.get_course_tag(user, self.course_id, self.test_key)
+            for user in users[:2]
+        })
+        self.assertIsNone(course_tag_api.get_course_tag(users[2], self.course_id, self.test_key))
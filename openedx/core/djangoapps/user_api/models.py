@@ -1,6 +1,7 @@
 """
 Django ORM model specifications for the User API application
 """
+import crum
 from django.contrib.auth.models import User
 from django.core.validators import RegexValidator
 from django.db import models
@@ -8,6 +9,7 @@ from django.db.models.signals import post_delete, pre_save, post_save
 from django.dispatch import receiver
 from model_utils.models import TimeStampedModel
 
+import request_cache
 from util.model_utils import get_changed_fields_dict, emit_setting_changed_event
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
 
@@ -30,6 +32,75 @@ class UserPreference(models.Model):
     class Meta(object):
         unique_together = ("user", "key")
 
+    # The name of the request cache holding the preferences of the users, by user id.
+    REQUEST_CACHE_NAME = 'UserPreference.preferences'
+
+    @classmethod
+    def _get_preferences_request_cache(cls):
+        """
+        Returns the request-specific cache of the preferences of the users.
+
+        Outside of a request (e.g. in management commands), nothing clears the
+        request cache, so an empty dict that is discarded after use is returned.
+        """
+        if crum.get_current_request() is None:
+            return {}
+        return request_cache.get_cache(cls.REQUEST_CACHE_NAME)
+
+    @classmethod
+    def _get_all_values(cls, user):
+        """
+        Returns the dict of all the preferences of the user, which is loaded
+        with a single query once per request, and shared with the other callers.
+        """
+        preferences = cls._get_preferences_request_cache()
+        if user.id not in preferences:
+            preferences[user.id] = dict(cls.objects.filter(user=user).values_list('key', 'value'))
+        return preferences[user.id]
+
+    @classmethod
+    def get_all_values(cls, user):
+        """Gets all of the user's preferences.
+
+        Note:
+            This method provides no authorization of access to the user preferences.
+            Consider using user_api.preferences.api.get_user_preferences instead if
+            this is part of a REST API request.
+
+        Arguments:
+            user (User): The user whose preferences should be returned.
+
+        Returns:
+            A dict mapping preference keys to values.
+        """
+        return dict(cls._get_all_values(user))
+
+    @classmethod
+    def get_all_values_for_users(cls, users):
+        """Gets all of the preferences of several users.
+
+        The preferences of the users which have not been loaded yet during the
+        request are loaded with a single query, and later calls to get_value
+        and get_all_values for any of the users don't query the database.
+
+        Arguments:
+            users (list of User): The users whose preferences should be returned.
+
+        Returns:
+            A dict mapping user ids to dicts mapping preference keys to values.
+        """
+        preferences = cls._get_preferences_request_cache()
+        user_ids = set(user.id for user in users)
+        missing_user_ids = [user_id for user_id in user_ids if user_id not in preferences]
+        if missing_user_ids:
+            for user_id in missing_user_ids:
+                preferences[user_id] = {}
+            for user_id, key, value in cls.objects.filter(user_id__in=missing_user_ids).values_list(
+                    'user_id', 'key', 'value'
+            ):
+                preferences[user_id][key] = value
+        return {user_id: dict(preferences[user_id]) for user_id in user_ids}
+
     @classmethod
     def get_value(cls, user, preference_key, default=None):
         """Gets the user preference value for a given key.
@@ -47,11 +118,7 @@ class UserPreference(models.Model):
         Returns:
             The user preference value, or default if one is not set.
         """
-        try:
-            user_preference = cls.objects.get(user=user, key=preference_key)
-            return user_preference.value
-        except cls.DoesNotExist:
-            return default
+        return cls._get_all_values(user).get(preference_key, default)
 
 
 @receiver(pre_save, sender=UserPreference)
@@ -69,6 +136,7 @@ def post_save_callback(sender, **kwargs):
     Event changes to user preferences.
     """
     user_preference = kwargs["instance"]
+    UserPreference._get_preferences_request_cache().pop(user_preference.user_id, None)
     emit_setting_changed_event(
         user_preference.user, sender._meta.db_table, user_preference.key,
         user_preference._old_value, user_preference.value
@@ -82,6 +150,7 @@ def post_delete_callback(sender, **kwargs):
     Event changes to user preferences.
     """
     user_preference = kwargs["instance"]
+    UserPreference._get_preferences_request_cache().pop(user_preference.user_id, None)
     emit_setting_changed_event(
         user_preference.user, sender._meta.db_table, user_preference.key, user_preference.value, None
     )
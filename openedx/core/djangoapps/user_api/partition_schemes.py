@@ -71,6 +71,32 @@ class RandomUserPartitionScheme(object):
 
         return group
 
+    @classmethod
+    def get_groups_for_users(cls, course_key, user_ids, user_partition):
+        """
+        Returns a dict mapping user id to the group of the specified user partition
+        to which each of the given users is assigned, with a single query.
+
+        Users who have not been assigned a group (or whose group no longer exists)
+        are not included; no group is assigned to them.
+        """
+        group_ids = course_tag_api.get_course_tags_for_users(
+            user_ids, course_key, cls.key_for_partition(user_partition)
+        )
+        groups = {}
+        for user_id, group_id in group_ids.iteritems():
+            try:
+                groups[user_id] = user_partition.get_group(int(group_id))
+            except NoSuchUserPartitionGroupError:
+                log.warn(
+                    "group not found in RandomUserPartitionScheme: %r",
+                    {
+                        "requested_partition_id": user_partition.id,
+                        "requested_group_id": group_id,
+                    },
+                )
+        return groups
+
     @classmethod
     def key_for_partition(cls, user_partition):
         """
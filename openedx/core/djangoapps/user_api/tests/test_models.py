@@ -3,6 +3,10 @@ Test UserPreferenceModel and UserPreference events
 """
 from django.db import IntegrityError
 from django.test import TestCase
+from django.test.client import RequestFactory
+from mock import patch
+
+from request_cache.middleware import RequestCache
 
 from student.tests.factories import UserFactory
 from student.tests.tests import UserSettingsEventTestMixin
@@ -97,6 +101,51 @@ class UserPreferenceModelTest(ModuleStoreTestCase):
         pref = UserPreference.get_value(user, 'testkey_none', 'default_value')
         self.assertEqual('default_value', pref)
 
+    @patch('crum.get_current_request', lambda: RequestFactory().get('/'))
+    def test_get_value_request_cached(self):
+        """Verifies that the preferences of a user are loaded once per request."""
+        user = UserFactory.create()
+        set_user_preference(user, 'testkey', 'testvalue')
+        RequestCache.clear_request_cache()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(UserPreference.get_value(user, 'testkey'), 'testvalue')
+            self.assertIsNone(UserPreference.get_value(user, 'testkey_none'))
+            self.assertEqual(UserPreference.get_all_values(user), {'testkey': 'testvalue'})
+
+        # saving a preference evicts the cached preferences of the user
+        set_user_preference(user, 'testkey', 'newvalue')
+        self.assertEqual(UserPreference.get_value(user, 'testkey'), 'newvalue')
+
+    def test_get_value_not_cached_outside_request(self):
+        """Verifies that the preferences of a user are not cached outside of a request."""
+        user = UserFactory.create()
+        set_user_preference(user, 'testkey', 'testvalue')
+
+        with self.assertNumQueries(2):
+            self.assertEqual(UserPreference.get_value(user, 'testkey'), 'testvalue')
+            self.assertEqual(UserPreference.get_value(user, 'testkey'), 'testvalue')
+
+    @patch('crum.get_current_request', lambda: RequestFactory().get('/'))
+    def test_get_all_values_for_users(self):
+        """Verifies the behavior of get_all_values_for_users."""
+        users = [UserFactory.create() for __ in range(3)]
+        set_user_preference(users[0], 'testkey', 'first')
+        set_user_preference(users[1], 'testkey', 'second')
+        RequestCache.clear_request_cache()
+
+        with self.assertNumQueries(1):
+            preferences = UserPreference.get_all_values_for_users(users)
+        self.assertEqual(preferences, {
+            users[0].id: {'testkey': 'first'},
+            users[1].id: {'testkey': 'second'},
+            users[2].id: {},
+        })
+
+        with self.assertNumQueries(0):
+            for user in users:
+                UserPreference.get_value(user, 'testkey')
+
 
 class TestUserPreferenceEvents(UserSettingsEventTestMixin, TestCase):
     """
@@ -18,13 +18,21 @@ class MemoryCourseTagAPI(object):
     def __init__(self):
         self._tags = defaultdict(dict)
 
-    def get_course_tag(self, __, course_id, key):
+    def get_course_tag(self, user, course_id, key):
         """Sets the value of ``key`` to ``value``"""
-        return self._tags[course_id].get(key)
+        return self._tags[(user.id, course_id)].get(key)
 
-    def set_course_tag(self, __, course_id, key, value):
+    def get_course_tags_for_users(self, user_ids, course_id, key):
+        """Gets the values of ``key`` of the given users"""
+        return {
+            user_id: self._tags[(user_id, course_id)][key]
+            for user_id in user_ids
+            if key in self._tags[(user_id, course_id)]
+        }
+
+    def set_course_tag(self, user, course_id, key, value):
         """Gets the value of ``key``"""
-        self._tags[course_id][key] = value
+        self._tags[(user.id, course_id)][key] = value
 
 
 class TestRandomUserPartitionScheme(PartitionTestCase):
@@ -37,9 +45,9 @@ class TestRandomUserPartitionScheme(PartitionTestCase):
     def setUp(self):
         super(TestRandomUserPartitionScheme, self).setUp()
         # Patch in a memory-based user service instead of using the persistent version
-        course_tag_api = MemoryCourseTagAPI()
+        self.course_tag_api = MemoryCourseTagAPI()
         self.user_service_patcher = patch(
-            'openedx.core.djangoapps.user_api.partition_schemes.course_tag_api', course_tag_api
+            'openedx.core.djangoapps.user_api.partition_schemes.course_tag_api', self.course_tag_api
         )
         self.user_service_patcher.start()
         self.addCleanup(self.user_service_patcher.stop)
@@ -78,6 +86,27 @@ class TestRandomUserPartitionScheme(PartitionTestCase):
 
         self.assertIsNotNone(group)
 
+    def test_get_groups_for_users(self):
+        users = [self.user] + [UserFactory.create() for __ in range(3)]
+        for user in users[:3]:
+            RandomUserPartitionScheme.get_group_for_user(self.MOCK_COURSE_ID, user, self.user_partition)
+        # the group of the third user no longer exists
+        self.course_tag_api.set_course_tag(
+            users[2], self.MOCK_COURSE_ID, RandomUserPartitionScheme.key_for_partition(self.user_partition), 5
+        )
+
+        groups = RandomUserPartitionScheme.get_groups_for_users(
+            self.MOCK_COURSE_ID, [user.id for user in users], self.user_partition
+        )
+        self.assertEqual(len(groups), 2)
+        for user in users:
+            self.assertEqual(
+                groups.get(user.id),
+                RandomUserPartitionScheme.get_group_for_user(
+                    self.MOCK_COURSE_ID, user, self.user_partition, assign=False
+                )
+            )
+
     def test_empty_partition(self):
         empty_partition = UserPartition(
             self.TEST_ID,